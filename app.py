@@ -1,12 +1,16 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-import ast
-from collections import Counter
-import numpy as np
 import pydeck as pdk 
-from scrapping.kalibrr_script import run_scraper as run_scraper_kalibrr
-import time 
+from scrapping.job_manager import JobManager, DONE, CANCELLED, FINAL_STATES
+from dashboard.storage import load_base_dataset
+from dashboard.preprocess import base_data_version, content_hash, prepare_rows, concat_frames
+from dashboard.geo import density_by_city
+from dashboard.dedup import load_base_fingerprints, dedup_new_rows, fingerprints
+from dashboard.near_dup import NearDuplicateIndex
+from dashboard.views import DataPart, DataView, memory_report
+from dashboard.ingest import SchemaError, ingest_csv, load_store, store_batches, store_frame
+import uuid
 import warnings
 
 # Suppress PyDeck deprecation warnings in Streamlit logs
@@ -83,38 +87,131 @@ def icon(icon_name):
 # --- 3. PERSIAPAN DATA ---
 
 # A. DATABASE KOORDINAT
-koordinat_kota = {
-    "Jakarta Raya": [-6.2088, 106.8456], "Jakarta Selatan": [-6.2615, 106.8106],
-    "Jakarta Barat": [-6.1674, 106.7637], "Jakarta Pusat": [-6.1751, 106.8650],
-    "Jakarta Timur": [-6.2250, 106.9004], "Jakarta Utara": [-6.1384, 106.8645],
-    "Bandung": [-6.9175, 107.6191], "Surabaya": [-7.2575, 112.7521],
-    "Yogyakarta": [-7.7956, 110.3695], "DI Yogyakarta": [-7.7956, 110.3695],
-    "Sleman": [-7.7128, 110.3541], "Semarang": [-6.9667, 110.4167],
-    "Malang": [-7.9666, 112.6326], "Tangerang": [-6.1731, 106.6300],
-    "Tangerang Selatan": [-6.2886, 106.7179], "Bekasi": [-6.2383, 106.9756],
-    "Bogor": [-6.5971, 106.8060], "Depok": [-6.4025, 106.7942],
-    "Banten": [-6.4058, 106.0640], "Jawa Barat": [-6.9147, 107.6098],
-    "Jawa Tengah": [-7.1510, 110.1403], "Jawa Timur": [-7.5360, 112.2384],
-    "Bali": [-8.4095, 115.1889], "Lokasi Lain": [-7.35, 110.00] 
-}
-
-def get_lat(kota): return koordinat_kota.get(kota, [None, None])[0]
-def get_lon(kota): return koordinat_kota.get(kota, [None, None])[1]
+# Gazetteer kota + koordinat ada di scrapping/location.py (dipakai dashboard/geo.py per kategori kota)
 
 # B. LOAD DATA
-@st.cache_data
-def load_base_data():
-    try:
-        df = pd.read_csv("./data/data_loker_clean.csv")
-        return df
-    except FileNotFoundError:
-        return pd.DataFrame()
+# cache_resource: satu objek dipakai bersama (tanpa copy tiap rerun), jangan dimutasi.
+# `version` = mtime file, sehingga cache otomatis basi jika file data berubah.
+@st.cache_resource(max_entries=2)
+def load_base_data(version):
+    # Parquet bertipe (memory-mapped), dibuat otomatis dari CSV (lihat dashboard/storage.py)
+    return load_base_dataset()
+
+@st.cache_resource(max_entries=8)
+def load_uploaded_data(path):
+    # Store upload (folder Parquet per hash isi file) dibaca sekali, dipakai bersama semua sesi
+    return load_store(path)
+
+@st.cache_resource(max_entries=2)
+def get_base_part(version, _base_df):
+    # Data utama + FilterIndex + SkillMatrix: satu salinan per proses, dipakai semua sesi (read-only)
+    return DataPart(_base_df)
+
+@st.cache_resource(max_entries=8)
+def get_upload_part(path):
+    # Bagian data upload juga dibagi antar sesi (kunci = path store, berbasis hash isi file)
+    df = load_uploaded_data(path)
+    return DataPart(df) if not df.empty else None
+
+@st.cache_resource(max_entries=2)
+def get_base_fingerprints(version, _base_df):
+    # Himpunan fingerprint data utama (disimpan juga di disk), untuk dedup data baru
+    return load_base_fingerprints(_base_df, version)
+
+@st.cache_resource(max_entries=2)
+def get_base_near_dup_index(version, _base_df):
+    # Index MinHash/LSH data utama untuk mendeteksi repost dengan ejaan berbeda
+    index = NearDuplicateIndex()
+    index.add(_base_df)
+    return index
+
+@st.cache_data(max_entries=64)
+def get_map_data(data_version, filter_key, _view, _masks):
+    # Agregat peta hanya dihitung ulang jika data atau pilihan filter berubah
+    # (ganti tema / mode peta memakai hasil cache)
+    return _view.map_data(_masks)
+
+def store_scrape_result(batches, job_id):
+    # Hasil job ditulis ke store bersama per batch (folder Parquet, sama seperti store upload)
+    return store_batches(batches, f"scrape-{job_id}")
+
+@st.cache_resource
+def get_job_manager():
+    # Satu antrean job scraping per proses; job tetap berjalan walau sesi / halaman di-refresh
+    return JobManager(store=store_scrape_result)
+
+SCRAPE_POLL_SECONDS = 1.0
+PREVIEW_COLUMNS = ['Perusahaan', 'Posisi', 'gaji_angka']
 
 # Initialize Session State for extra data
+# Data scrape disimpan sudah dinormalisasi (prepare_rows) + nomor versi.
+# Data upload TIDAK disimpan di sesi: cukup path store di disk (sekaligus versinya).
 if 'scraped_data' not in st.session_state:
-    st.session_state.scraped_data = pd.DataFrame()
-if 'uploaded_data' not in st.session_state:
-    st.session_state.uploaded_data = pd.DataFrame()
+    st.session_state.scraped_data = prepare_rows(None)
+    st.session_state.scraped_version = 0
+    st.session_state.scraped_part = None       # DataPart hasil scrape (hanya milik sesi ini)
+    st.session_state.scraped_part_version = 0
+    st.session_state.session_key = uuid.uuid4().hex  # kunci cache unik untuk data milik sesi
+if 'scrape_job_id' not in st.session_state:
+    # Job id juga disimpan di URL, sehingga refresh halaman tetap melanjutkan job yang sama
+    st.session_state.scrape_job_id = st.query_params.get("scrape_job")
+    st.session_state.merged_jobs = set()
+    st.session_state.scrape_message = None
+if 'uploaded_path' not in st.session_state:
+    st.session_state.uploaded_path = None
+    st.session_state.uploaded_file_hash = None
+    st.session_state.uploaded_file_id = None  # file_id widget upload yang terakhir diproses
+    st.session_state.uploader_version = 0     # dinaikkan saat Reset agar widget upload dikosongkan
+
+def finish_scrape_job(info):
+    """Gabungkan hasil job yang selesai ke data sesi (sekali per job), lalu simpan pesan hasil."""
+    job_id = info["id"]
+    st.session_state.scrape_job_id = None
+    st.query_params.pop("scrape_job", None)
+    if info["status"] == DONE and info["result_path"] and job_id not in st.session_state.merged_jobs:
+        new_data = load_uploaded_data(info["result_path"])
+        st.session_state.scraped_data = concat_frames([st.session_state.scraped_data, new_data])
+        st.session_state.scraped_version += 1
+        st.session_state.merged_jobs.add(job_id)
+        st.session_state.scrape_message = (
+            "success",
+            f"Berhasil mengambil {len(new_data)} data baru! Total sementara: {len(st.session_state.scraped_data)}",
+            new_data[PREVIEW_COLUMNS],
+        )
+    elif info["status"] == CANCELLED:
+        st.session_state.scrape_message = ("info", "Scraping dibatalkan.", None)
+    elif info["status"] == DONE:
+        st.session_state.scrape_message = ("warning", "Gagal mengambil data atau tidak ada data baru.", None)
+    else:
+        st.session_state.scrape_message = ("error", f"Scraping gagal: {info['error']}", None)
+
+@st.fragment(run_every=SCRAPE_POLL_SECONDS)
+def scrape_job_panel(scrape_source):
+    # Hanya bagian ini yang di-rerun tiap detik selama job berjalan (bukan seluruh dashboard)
+    job_id = st.session_state.scrape_job_id
+    info = get_job_manager().status(job_id)
+    if info is None:
+        # Job tidak dikenal lagi (mis. server restart)
+        st.session_state.scrape_job_id = None
+        st.query_params.pop("scrape_job", None)
+        st.rerun()
+    if info["status"] in FINAL_STATES:
+        finish_scrape_job(info)
+        st.rerun()
+
+    query = info["params"].get("search_query")
+    target = info["params"].get("target_count") or 1
+    if info["total"]:
+        fraction = 0.5 + 0.5 * (info["fetched"] + info["failed"]) / info["total"]
+    else:
+        fraction = 0.5 * min(info["harvested"] / target, 1.0)
+    st.progress(
+        min(fraction, 1.0),
+        text=f"Scraping {scrape_source} {f'`{query}` ' if query else ''}({info['stage']}, {info['elapsed']:.0f} detik)",
+    )
+    st.caption(f"Harvested: {info['harvested']} | Fetched: {info['fetched']} | Gagal: {info['failed']}")
+    if st.button("Batalkan Scraping", key="cancel_scrape"):
+        get_job_manager().cancel(job_id)
 
 # --- SIDEBAR CONTROLS ---
 with st.sidebar:
@@ -131,49 +228,62 @@ with st.sidebar:
     
     target_scraping = st.number_input("Jumlah Data", min_value=1, max_value=50, value=5)
     
-    if st.button("Mulai Scraping"):
-        with st.spinner(f"Sedang scraping {scrape_source} {f'dengan kata kunci `{search_query}`' if search_query else ''}..."):
-            
-            # Select Scraper Function
-            new_data = run_scraper_kalibrr(target_count=target_scraping, search_query=search_query)
-                
-            if not new_data.empty:
-                # Accumulate data: Concatenate old session state with new data
-                st.session_state.scraped_data = pd.concat([st.session_state.scraped_data, new_data], ignore_index=True)
-                
-                st.success(f"Berhasil mengambil {len(new_data)} data baru! Total sementara: {len(st.session_state.scraped_data)}")
-                
-                # --- PREVIEW DATA ---
-                with st.expander("🔍 Preview Hasil Scraping (Terbaru)", expanded=True):
-                    # use_container_width=True is deprecated in some versions, changed to width (or removed if auto)
-                    st.dataframe(new_data[['Perusahaan', 'Posisi', 'gaji_angka']], hide_index=True)
-            else:
-                st.warning("Gagal mengambil data atau tidak ada data baru.")
+    if st.button("Mulai Scraping", disabled=st.session_state.scrape_job_id is not None):
+        # Job masuk antrean background; dashboard tetap bisa dipakai selama scraping berjalan
+        job_id = get_job_manager().submit(target_count=target_scraping, search_query=search_query or None)
+        st.session_state.scrape_job_id = job_id
+        st.session_state.scrape_message = None
+        st.query_params["scrape_job"] = job_id
+
+    if st.session_state.scrape_job_id:
+        scrape_job_panel(scrape_source)
+
+    if st.session_state.scrape_message:
+        level, text, preview = st.session_state.scrape_message
+        getattr(st, level)(text)
+        if preview is not None:
+            # --- PREVIEW DATA ---
+            with st.expander("🔍 Preview Hasil Scraping (Terbaru)", expanded=True):
+                st.dataframe(preview, hide_index=True)
 
 
     st.markdown("---")
     
     # 2. Upload CSV
     st.subheader("Upload CSV")
-    uploaded_file = st.file_uploader("Upload file CSV", type=["csv"])
-    if uploaded_file is not None:
+    uploaded_file = st.file_uploader("Upload file CSV", type=["csv"], key=f"upload_{st.session_state.uploader_version}")
+    # file_id hanya berubah saat ada upload baru: rerun biasa tidak menyalin / meng-hash file lagi.
+    # Upload baru dengan isi yang sama (hash sama) juga tidak diproses ulang.
+    new_upload = uploaded_file is not None and uploaded_file.file_id != st.session_state.uploaded_file_id
+    if new_upload:
+        st.session_state.uploaded_file_id = uploaded_file.file_id
+        file_hash = content_hash(uploaded_file.getvalue())
+        new_upload = file_hash != st.session_state.uploaded_file_hash
+    if new_upload:
+        progress_bar = st.progress(0.0, text="Memeriksa header...")
         try:
-            temp_df = pd.read_csv(uploaded_file)
-            # Validasi Kolom
-            required_cols = {'Perusahaan', 'Posisi', 'kategori_posisi', 'kota', 'gaji_angka', 'list_skill', 'pendidikan', 'jenis', 'provinsi', 'link'}
-            if required_cols.issubset(temp_df.columns):
-                st.session_state.uploaded_data = temp_df
-                st.success(f"File valid! {len(temp_df)} data ditambahkan.")
-            else:
-                missing = required_cols - set(temp_df.columns)
-                st.error(f"Format salah! Kolom hilang: {missing}")
+            # Header divalidasi dulu, lalu dibaca per chunk ke store upload di disk
+            path, n_rows = ingest_csv(
+                uploaded_file, file_hash,
+                progress=lambda fraction, rows: progress_bar.progress(fraction, text=f"{rows} baris diproses..."),
+            )
+            st.session_state.uploaded_path = path
+            st.session_state.uploaded_file_hash = file_hash
+            st.success(f"File valid! {n_rows} data ditambahkan.")
+        except SchemaError as e:
+            st.error(f"Format salah! Kolom hilang: {e.missing}")
         except Exception as e:
             st.error(f"Error membaca file: {e}")
+        progress_bar.empty()
 
     # Reset Data Button
     if st.button("Reset Tambahan Data"):
-        st.session_state.scraped_data = pd.DataFrame()
-        st.session_state.uploaded_data = pd.DataFrame()
+        st.session_state.scraped_data = prepare_rows(None)
+        st.session_state.scraped_version += 1
+        st.session_state.uploaded_path = None
+        st.session_state.uploaded_file_hash = None
+        st.session_state.uploaded_file_id = None
+        st.session_state.uploader_version += 1
         st.rerun()
 
     st.markdown("---")
@@ -183,61 +293,76 @@ with st.sidebar:
     if st.button("Bersihkan & Gabung Data"):
         with st.spinner("Membersihkan data..."):
             # Gabungkan dulu semua source
-            combined = pd.concat([st.session_state.scraped_data, st.session_state.uploaded_data], ignore_index=True)
+            combined = concat_frames([st.session_state.scraped_data, load_uploaded_data(st.session_state.uploaded_path)])
             
             if not combined.empty:
                 # 1. Deduplikasi
                 # Prioritas deduplikasi: Link (jika ada), atau kombinasi (Perusahaan, Posisi, Kota)
-                initial_count = len(combined)
-                
-                # Buat temporary column untuk deduplikasi case-insensitive
-                combined['dedup_key'] = combined.apply(
-                    lambda x: str(x['link']) if pd.notna(x['link']) and x['link'] != '' 
-                    else f"{str(x['Perusahaan']).lower()}|{str(x['Posisi']).lower()}", axis=1
-                )
-                
-                combined = combined.drop_duplicates(subset=['dedup_key'])
-                combined = combined.drop(columns=['dedup_key'])
+                # Fingerprint int64 per baris, dicek terhadap data tambahan lain DAN data utama
+                current_base_version = base_data_version()
+                base_fps = get_base_fingerprints(current_base_version, load_base_data(current_base_version))
+                combined, dup_internal, dup_base = dedup_new_rows(combined, base_fps)
+                combined = combined.copy()
+                # Near-duplicate (judul / ejaan perusahaan sedikit beda) hanya dilaporkan, tidak dihapus
+                near_dups = get_base_near_dup_index(current_base_version, load_base_data(current_base_version)).query(combined)
+                near_dup_count = near_dups['row'].nunique()
                 
                 # 2. Standardisasi Gaji (Memastikan numerik)
                 combined['gaji_angka'] = pd.to_numeric(combined['gaji_angka'], errors='coerce')
                 
-                # 3. Simpan kembali ke uploaded_data (sebagai wadah data bersih tambahan)
+                # 3. Simpan kembali ke store upload (sebagai wadah data bersih tambahan)
                 # Kita kosongkan scraped_data agar tidak double, semua masuk ke uploaded/tambahan
-                st.session_state.scraped_data = pd.DataFrame() 
-                st.session_state.uploaded_data = combined
+                st.session_state.scraped_data = prepare_rows(None)
+                st.session_state.scraped_version += 1
+                clean_key = "clean-" + content_hash(fingerprints(combined).tobytes())
+                st.session_state.uploaded_path = store_frame(combined, clean_key) if not combined.empty else None
                 
-                removed_count = initial_count - len(combined)
-                st.success(f"Pembersihan Selesai! {removed_count} data duplikat dihapus.")
+                # Pesan disimpan di sesi: st.rerun() di bawah akan menghapus elemen yang sudah ditulis
+                st.session_state.clean_messages = [(
+                    "success",
+                    f"Pembersihan Selesai! {dup_internal + dup_base} data duplikat dihapus "
+                    f"({dup_base} sudah ada di data utama).",
+                )]
+                if near_dup_count:
+                    st.session_state.clean_messages.append(
+                        ("info", f"{near_dup_count} data mirip dengan lowongan di data utama (kemungkinan repost).")
+                    )
                 st.rerun()
             else:
                 st.warning("Belum ada data tambahan untuk dibersihkan.")
 
+    # Hasil pembersihan dari run sebelumnya (ditampilkan sekali)
+    for level, text in st.session_state.pop("clean_messages", []):
+        getattr(st, level)(text)
+
 # C. COMBINE DATA
-base_df = load_base_data()
+base_version = base_data_version()
+base_df = load_base_data(base_version)
 if base_df.empty:
     st.error("❌ File data utama (data_loker_clean.csv) tidak ditemukan!")
     st.stop()
 
-# Gabungkan data utama + scraped + uploaded
-# Note: Kita lakukan deduplikasi akhir juga dengan base_data untuk view
-df = pd.concat([base_df, st.session_state.scraped_data, st.session_state.uploaded_data], ignore_index=True)
-
-# Preprocessing ulang untuk data gabungan (terutama list_skill)
-# Karena data scraped/upload mungkin belum di-eval
-def clean_skill_column(x):
-    if isinstance(x, list): return x
-    if isinstance(x, str):
-        try:
-            return ast.literal_eval(x)
-        except:
-            return []
-    return []
-
-df['list_skill'] = df['list_skill'].apply(clean_skill_column)
-df['pendidikan'] = df['pendidikan'].fillna("Tidak Disebutkan") # Note: base has pendidikan, new data has pendidikan
-df['kota'] = df['kota'].fillna("Lokasi Lain")
-df['gaji_angka'] = pd.to_numeric(df['gaji_angka'], errors='coerce')
+# Susun view dari bagian-bagian data (TIDAK digabung menjadi satu DataFrame):
+# - data utama : bersama semua sesi (cache_resource)
+# - upload     : bersama semua sesi yang mengupload file yang sama
+# - scrape     : milik sesi ini, index-nya dibangun ulang hanya jika datanya berubah
+# Semua sumber sudah dinormalisasi (list_skill, pendidikan, kota, gaji_angka) saat masuk.
+base_part = get_base_part(base_version, base_df)
+upload_part = get_upload_part(st.session_state.uploaded_path) if st.session_state.uploaded_path else None
+if st.session_state.scraped_part_version != st.session_state.scraped_version:
+    scraped = st.session_state.scraped_data
+    st.session_state.scraped_part = DataPart(scraped) if not scraped.empty else None
+    st.session_state.scraped_part_version = st.session_state.scraped_version
+scraped_part = st.session_state.scraped_part
+view = DataView([base_part, upload_part, scraped_part])
+
+# Versi data untuk kunci cache: data scrape diberi kunci sesi agar tidak tertukar antar sesi
+scraped_key = (st.session_state.session_key, st.session_state.scraped_version) if scraped_part else None
+data_version = (base_version, st.session_state.uploaded_path, scraped_key)
+
+# Perkiraan memori: data bersama vs data milik sesi ini (hanya hasil scrape)
+shared_mb, session_mb = memory_report([base_part, upload_part], [scraped_part])
+st.sidebar.caption(f"Memori data — bersama: {shared_mb:.1f} MB, sesi ini: {session_mb:.2f} MB")
 
 # --- 4. HEADER & FILTER ---
 # GANTI st.title BIASA DENGAN MARKDOWN AGAR BISA PAKAI ICON
@@ -248,9 +373,9 @@ with st.container(border=True):
     st.markdown(f"### {icon('search')} Filter Data", unsafe_allow_html=True)
     c1, c2, c3 = st.columns(3)
     
-    kategori_list = sorted(df['kategori_posisi'].unique().tolist())
-    provinsi_list = sorted(df['provinsi'].unique().tolist())
-    pendidikan_list = sorted(df['pendidikan'].unique().tolist())
+    kategori_list = view.options('kategori_posisi')
+    provinsi_list = view.options('provinsi')
+    pendidikan_list = view.options('pendidikan')
 
     with c1:
         st.markdown(f"**{icon('assignment')} Posisi / Kategori**", unsafe_allow_html=True)
@@ -264,16 +389,18 @@ with st.container(border=True):
         st.markdown(f"**{icon('school')} Pendidikan**", unsafe_allow_html=True)
         selected_pendidikan = st.multiselect("Pendidikan", pendidikan_list, label_visibility="collapsed")
 
-# Logic Filter
-if not selected_kategori: selected_kategori = kategori_list
-if not selected_provinsi: selected_provinsi = provinsi_list
-if not selected_pendidikan: selected_pendidikan = pendidikan_list
-
-filtered_df = df[
-    (df['kategori_posisi'].isin(selected_kategori)) & 
-    (df['provinsi'].isin(selected_provinsi)) &
-    (df['pendidikan'].isin(selected_pendidikan))
-]
+# Logic Filter (pilihan kosong = semua nilai)
+# Irisan bitmap dari FilterIndex tiap bagian data, bukan isin() ke seluruh kolom
+selections = {
+    'kategori_posisi': selected_kategori,
+    'provinsi': selected_provinsi,
+    'pendidikan': selected_pendidikan,
+}
+filter_masks = view.masks(selections)
+# Kunci cache untuk agregat yang bergantung pada filter
+filter_key = tuple((col, tuple(sorted(values))) for col, values in selections.items())
+# Hanya baris yang lolos filter & kolom tampilan (tanpa list_skill) yang diambil
+filtered_df = view.rows(filter_masks)
 
 st.markdown("---") 
 
@@ -335,15 +462,8 @@ else:
     deck_color = [0, 100, 255, 180] 
 
 # 4. Proses Data
-def apply_jitter(coord, amount=0.015): return coord + np.random.uniform(-amount, amount)
-
-df_map = filtered_df.copy()
-map_data = df_map.groupby(['kota', 'kategori_posisi']).size().reset_index(name='Jumlah')
-map_data['lat'] = map_data['kota'].apply(get_lat)
-map_data['lon'] = map_data['kota'].apply(get_lon)
-map_data = map_data.dropna(subset=['lat', 'lon']) 
-map_data['lat_jitter'] = map_data['lat'].apply(lambda x: apply_jitter(x))
-map_data['lon_jitter'] = map_data['lon'].apply(lambda x: apply_jitter(x))
+# Hitung per (kota, kategori_posisi) langsung dari kode categorical + mask filter
+map_data = get_map_data(data_version, filter_key, view, filter_masks)
 
 # --- PERBAIKAN BUG ---
 # Gunakan session_state sebagai value dan on_change untuk update
@@ -362,7 +482,7 @@ center_java = {"lat": -7.35, "lon": 110.00}
 if not map_data.empty:
     with st.container(border=True):
         if st.session_state.view_mode_peta == "Kepadatan Lowongan":
-            data_3d = map_data.groupby(['kota', 'lat', 'lon'])['Jumlah'].sum().reset_index()
+            data_3d = density_by_city(map_data)
             view_state = pdk.ViewState(latitude=-7.2, longitude=110.0, zoom=6.5, pitch=50)
             
             layer = pdk.Layer(
@@ -418,9 +538,9 @@ with col_right:
         # Icon: construction (Alat/Skill) atau engineering
         st.markdown(f"### {icon('construction')} Top 10 Skill Teknis", unsafe_allow_html=True)
         
-        all_skills = [s for skills in filtered_df['list_skill'] for s in skills]
-        if all_skills:
-            skill_counts = pd.DataFrame(Counter(all_skills).most_common(10), columns=['Skill', 'Jumlah'])
+        # Jumlah kolom matriks skill yang di-mask filter (tanpa flatten list per rerun)
+        skill_counts = view.skills.top_skills(filter_masks, n=10)
+        if not skill_counts.empty:
             fig_skill = px.bar(
                 skill_counts, x='Jumlah', y='Skill', orientation='h',
                 text='Jumlah', color='Jumlah', 
@@ -442,7 +562,9 @@ with col_left:
         # Icon: location_on (Pin Map)
         st.markdown(f"### {icon('location_on')} Top 10 Lokasi", unsafe_allow_html=True)
 
-        loc_data = filtered_df['kota'].value_counts().head(10).reset_index()
+        # kota kategorikal: value_counts ikut menghitung kategori kosong (0 baris)
+        loc_counts = filtered_df['kota'].value_counts()
+        loc_data = loc_counts[loc_counts > 0].head(10).reset_index()
         loc_data.columns = ['Kota', 'Jumlah']
 
         fig_loc = px.bar(loc_data, x='Kota', y='Jumlah', color='Kota')
@@ -454,13 +576,56 @@ with col_right:
         # Icon: school (Topi Wisuda)
         st.markdown(f"### {icon('school')} Kualifikasi Pendidikan", unsafe_allow_html=True)
 
-        edu_data = filtered_df['pendidikan'].value_counts().reset_index()
+        edu_counts = filtered_df['pendidikan'].value_counts()
+        edu_data = edu_counts[edu_counts > 0].reset_index()
         edu_data.columns = ['Pendidikan', 'Jumlah']
 
         fig_edu = px.pie(edu_data, values='Jumlah', names='Pendidikan', hole=0.4)
         fig_edu.update_layout(margin=dict(l=0, r=0, t=30, b=0))
         st.plotly_chart(fig_edu, use_container_width=True)
 
+# === BARIS 3: ANALISIS SKILL LANJUTAN ===
+with st.container(border=True):
+    # Icon: hub (Jaringan skill)
+    st.markdown(f"### {icon('hub')} Analisis Skill Lanjutan", unsafe_allow_html=True)
+    tab_pair, tab_prov, tab_gaji = st.tabs(["Skill Sering Bersamaan", "Skill per Provinsi", "Median Gaji per Skill"])
+
+    with tab_pair:
+        pair_data = view.skills.cooccurrence(filter_masks, n=10)
+        if not pair_data.empty:
+            fig_pair = px.bar(
+                pair_data, x='Jumlah', y='Pasangan', orientation='h',
+                text='Jumlah', color='Jumlah', color_continuous_scale='Purples'
+            )
+            fig_pair.update_layout(yaxis={'categoryorder':'total ascending'}, margin=dict(l=0, r=0, t=30, b=0))
+            st.plotly_chart(fig_pair, use_container_width=True)
+        else:
+            st.info("Data skill tidak tersedia.")
+
+    with tab_prov:
+        prov_data = view.skills.by_province(filter_masks, top_k=10)
+        if not prov_data.empty:
+            fig_prov = px.imshow(
+                prov_data, text_auto=True, aspect="auto", color_continuous_scale='Blues',
+                labels=dict(x="Skill", y="Provinsi", color="Jumlah")
+            )
+            fig_prov.update_layout(margin=dict(l=0, r=0, t=30, b=0))
+            st.plotly_chart(fig_prov, use_container_width=True)
+        else:
+            st.info("Data skill tidak tersedia.")
+
+    with tab_gaji:
+        salary_data = view.skills.median_salary(filter_masks, n=10, min_jobs=5)
+        if not salary_data.empty:
+            fig_sal = px.bar(
+                salary_data, x='Median Gaji', y='Skill', orientation='h',
+                hover_data=['Jumlah'], color='Median Gaji', color_continuous_scale='Greens'
+            )
+            fig_sal.update_layout(yaxis={'categoryorder':'total ascending'}, margin=dict(l=0, r=0, t=30, b=0))
+            st.plotly_chart(fig_sal, use_container_width=True)
+        else:
+            st.info("Belum cukup data gaji per skill (minimal 5 lowongan bergaji).")
+
 # --- 8. TABEL DATA ---
 # Icon: table_view (Grid/Tabel)
 st.markdown(f"### {icon('table_view')} Data Detail Lowongan", unsafe_allow_html=True)
@@ -0,0 +1,139 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+# --- DEDUPLIKASI (FINGERPRINT INT64) ---
+# Setiap baris punya kunci komposit perusahaan|posisi|kota yang sudah dinormalisasi
+# (huruf kecil, spasi dirapikan), ditambah kunci link jika kolom link terisi.
+# Baris dianggap duplikat jika SALAH SATU kuncinya sudah pernah terlihat. Dataset
+# utama tidak punya link, jadi baris scrape (selalu ber-link) tetap bisa cocok
+# lewat kunci kompositnya. Kunci dibangun dengan operasi string vektor lalu
+# di-hash menjadi int64 (hash_pandas_object).
+# Fingerprint dataset utama disimpan di disk (array int64 terurut) dan hanya
+# dibangun ulang jika file data utama berubah, sehingga menggabungkan data baru
+# cukup uji keanggotaan (searchsorted) tanpa drop_duplicates ke seluruh data.
+
+BASE_FINGERPRINT_PATH = "./data/data_loker_clean.fingerprints-v2.npy"
+LINK_PREFIX = "link:"   # kunci link & komposit tidak boleh bertabrakan
+
+
+def _normalized(values):
+    # Nama perusahaan/posisi/kota banyak berulang: normalisasi hanya nilai uniknya
+    codes, uniques = pd.factorize(values.astype("object"), use_na_sentinel=False)
+    uniques = (pd.Series(uniques, dtype="object").fillna("").astype(str)
+               .str.lower().str.replace(r"\s+", " ", regex=True).str.strip())
+    return pd.Series(uniques.to_numpy().take(codes), index=values.index)
+
+
+def composite_keys(df):
+    """Series kunci perusahaan|posisi|kota per baris (selalu ada)."""
+    return _normalized(df["Perusahaan"]) + "|" + _normalized(df["Posisi"]) + "|" + _normalized(df["kota"])
+
+
+def link_keys(df):
+    """Series kunci link per baris ("" jika baris tidak punya link)."""
+    if "link" not in df:
+        return pd.Series("", index=df.index)
+    link = df["link"].astype("object").fillna("").astype(str).str.strip()
+    return link.where(link == "", LINK_PREFIX + link)
+
+
+def _hash(keys):
+    return pd.util.hash_pandas_object(keys, index=False).to_numpy().view(np.int64)
+
+
+def row_fingerprints(df):
+    """(fingerprint komposit, fingerprint link, mask punya link), sejajar dengan df."""
+    links = link_keys(df)
+    return _hash(composite_keys(df)), _hash(links), (links != "").to_numpy()
+
+
+def fingerprints(df):
+    """Fingerprint identitas int64 per baris: link jika ada, selain itu komposit."""
+    if df is None or df.empty:
+        return np.empty(0, dtype=np.int64)
+    composite, link, has_link = row_fingerprints(df)
+    return np.where(has_link, link, composite)
+
+
+def key_fingerprints(df):
+    """Semua fingerprint yang dimiliki df (komposit setiap baris + link yang ada), untuk himpunan seen."""
+    if df is None or df.empty:
+        return np.empty(0, dtype=np.int64)
+    composite, link, has_link = row_fingerprints(df)
+    return np.concatenate([composite, link[has_link]])
+
+
+class FingerprintSet:
+    """Himpunan fingerprint (array int64 terurut) dengan uji keanggotaan vektor."""
+
+    def __init__(self, values=None):
+        values = np.empty(0, dtype=np.int64) if values is None else np.asarray(values, dtype=np.int64)
+        self.values = np.unique(values)
+
+    def __len__(self):
+        return len(self.values)
+
+    def contains(self, fps):
+        """Bool array: fingerprint mana yang sudah ada di himpunan."""
+        fps = np.asarray(fps, dtype=np.int64)
+        if not len(self.values):
+            return np.zeros(len(fps), dtype=bool)
+        pos = np.searchsorted(self.values, fps)
+        pos[pos == len(self.values)] = 0
+        return self.values[pos] == fps
+
+    def add(self, fps):
+        self.values = np.union1d(self.values, np.asarray(fps, dtype=np.int64))
+
+    def save(self, path=BASE_FINGERPRINT_PATH):
+        with open(path, "wb") as f:
+            np.save(f, self.values)
+        return path
+
+    @classmethod
+    def load(cls, path=BASE_FINGERPRINT_PATH):
+        result = cls()
+        result.values = np.load(path)
+        return result
+
+
+def load_base_fingerprints(base_df, base_version, path=BASE_FINGERPRINT_PATH):
+    """
+    Fingerprint dataset utama dari file jika masih sesuai versi data (mtime),
+    selain itu dihitung ulang dari base_df lalu disimpan.
+    """
+    if base_version is not None and os.path.exists(path) and os.path.getmtime(path) >= base_version:
+        try:
+            return FingerprintSet.load(path)
+        except (OSError, ValueError):
+            pass
+    result = FingerprintSet(key_fingerprints(base_df))
+    try:
+        result.save(path)
+    except OSError:
+        pass  # folder data read-only: tetap jalan tanpa file cache
+    return result
+
+
+def dedup_new_rows(new_df, known=None):
+    """
+    Buang duplikat di dalam new_df dan baris yang fingerprint-nya sudah ada di `known`.
+    Baris duplikat jika kunci komposit ATAU kunci link-nya sudah terlihat (di baris
+    sebelumnya atau di `known`).
+    Mengembalikan (DataFrame bersih, jumlah duplikat internal, jumlah yang sudah ada di data utama).
+    """
+    if new_df is None or new_df.empty:
+        return new_df, 0, 0
+    composite, link, has_link = row_fingerprints(new_df)
+    # Kunci komposit & link tidak pernah sama (prefix link:), jadi cukup dicek per jenis
+    internal_dup = pd.Series(composite).duplicated().to_numpy().copy()
+    internal_dup[has_link] |= pd.Series(link[has_link]).duplicated().to_numpy()
+    if known is not None:
+        in_known = known.contains(composite)
+        in_known[has_link] |= known.contains(link[has_link])
+    else:
+        in_known = np.zeros(len(composite), dtype=bool)
+    keep = ~internal_dup & ~in_known
+    return new_df[keep], int(internal_dup.sum()), int((in_known & ~internal_dup).sum())
@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+
+# --- FILTER ENGINE (INVERTED INDEX) ---
+# Dibangun SEKALI per versi dataset: untuk setiap kolom filter disimpan
+# daftar opsi (sudah terurut) dan bitmap baris per nilai (numpy bool array).
+# Filter = OR bitmap nilai terpilih dalam satu kolom, lalu AND antar kolom.
+# Tidak ada lagi isin() ke seluruh kolom atau sorted(unique()) di setiap rerun.
+
+FILTER_COLUMNS = ["kategori_posisi", "provinsi", "pendidikan"]
+
+
+class FilterIndex:
+    def __init__(self, df, columns=FILTER_COLUMNS):
+        self.n_rows = len(df)
+        self.options = {}
+        self.bitmaps = {}
+        for col in columns:
+            values = df[col]
+            if not isinstance(values.dtype, pd.CategoricalDtype):
+                values = values.astype("category")
+            codes = values.cat.codes.to_numpy()
+            categories = values.cat.categories
+            counts = np.bincount(codes[codes >= 0], minlength=len(categories))
+            self.bitmaps[col] = {
+                categories[i]: codes == i for i in range(len(categories)) if counts[i] > 0
+            }
+            self.options[col] = sorted(self.bitmaps[col])
+
+    @property
+    def nbytes(self):
+        return sum(bitmap.nbytes for bitmaps in self.bitmaps.values() for bitmap in bitmaps.values())
+
+    def mask(self, selections):
+        """
+        selections: {kolom: list nilai terpilih}. List kosong = semua nilai (tanpa filter).
+        Mengembalikan numpy bool array, atau None jika tidak ada filter aktif.
+        """
+        result = None
+        for col, selected in selections.items():
+            if not selected:
+                continue
+            bitmaps = self.bitmaps[col]
+            col_mask = np.zeros(self.n_rows, dtype=bool)
+            for value in selected:
+                bitmap = bitmaps.get(value)
+                if bitmap is not None:
+                    col_mask |= bitmap
+            result = col_mask if result is None else (result & col_mask)
+        return result
+
+    def apply(self, df, selections):
+        mask = self.mask(selections)
+        return df if mask is None else df[mask]
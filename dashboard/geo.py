@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+
+from scrapping.location import resolve_location
+
+# --- AGREGASI PETA (VEKTOR) ---
+# Koordinat dicari per KATEGORI kota (puluhan nilai), bukan per baris, lalu
+# jumlah lowongan per (kota, kategori_posisi) dihitung dengan satu np.bincount
+# atas kode categorical yang sudah di-mask. Tidak ada copy DataFrame, tidak ada
+# apply per baris. Jitter diambil dengan satu panggilan RNG ber-seed sehingga
+# posisi titik stabil di setiap rerun.
+# Koordinat berasal dari gazetteer di scrapping/location.py, jadi lokasi mentah
+# seperti "Jakarta Raya(Hibrid)" atau "South Tangerang" tetap muncul di peta.
+
+JITTER_AMOUNT = 0.015
+JITTER_SEED = 42
+MAP_COLUMNS = ["kota", "kategori_posisi", "Jumlah", "lat", "lon", "lat_jitter", "lon_jitter"]
+
+
+def _as_category(values):
+    return values if isinstance(values.dtype, pd.CategoricalDtype) else values.astype("category")
+
+
+def category_coordinates(categories):
+    """Array (n_kategori, 2) berisi lat/lon tiap kategori kota (NaN jika tidak dikenal)."""
+    table = np.full((len(categories), 2), np.nan)
+    for i, kota in enumerate(categories):
+        loc = resolve_location(kota)
+        if loc.lat is not None:
+            table[i] = (loc.lat, loc.lon)
+    return table
+
+
+def pair_counts(df, mask=None):
+    """Jumlah lowongan per (kota, kategori_posisi) dari kode categorical (satu np.bincount)."""
+    kota = _as_category(df["kota"])
+    kategori = _as_category(df["kategori_posisi"])
+    kota_codes = kota.cat.codes.to_numpy()
+    kategori_codes = kategori.cat.codes.to_numpy()
+    n_kategori = len(kategori.cat.categories)
+
+    valid = (kota_codes >= 0) & (kategori_codes >= 0)
+    if mask is not None:
+        valid &= mask
+    codes = kota_codes[valid].astype(np.int64) * n_kategori + kategori_codes[valid]
+    counts = np.bincount(codes, minlength=len(kota.cat.categories) * n_kategori)
+
+    pairs = np.flatnonzero(counts)
+    kota_idx, kategori_idx = np.divmod(pairs, n_kategori)
+    return pd.DataFrame({
+        "kota": np.asarray(kota.cat.categories[kota_idx], dtype=object),
+        "kategori_posisi": np.asarray(kategori.cat.categories[kategori_idx], dtype=object),
+        "Jumlah": counts[pairs],
+    })
+
+
+def aggregate_map(df, mask=None, seed=JITTER_SEED, amount=JITTER_AMOUNT):
+    """
+    Jumlah lowongan per (kota, kategori_posisi) + koordinat & jitter untuk peta.
+    mask: numpy bool array dari FilterIndex (None = semua baris).
+    """
+    return aggregate_map_parts([(df, mask)], seed, amount)
+
+
+def aggregate_map_parts(parts, seed=JITTER_SEED, amount=JITTER_AMOUNT):
+    """
+    Versi aggregate_map untuk beberapa bagian data [(df, mask), ...] sekaligus
+    (mis. data utama bersama + data tambahan sesi) tanpa menggabungkan DataFrame-nya.
+    """
+    counts = [pair_counts(df, mask) for df, mask in parts if len(df)]
+    if not counts:
+        return pd.DataFrame(columns=MAP_COLUMNS)
+    counts = counts[0] if len(counts) == 1 else (
+        pd.concat(counts, ignore_index=True)
+        .groupby(["kota", "kategori_posisi"], sort=True)["Jumlah"].sum().reset_index()
+    )
+
+    kota_names, kota_idx = np.unique(counts["kota"].to_numpy(dtype=object), return_inverse=True)
+    coords = category_coordinates(kota_names)[kota_idx]
+    known = ~np.isnan(coords[:, 0])
+    counts, coords = counts[known].reset_index(drop=True), coords[known]
+
+    rng = np.random.default_rng(seed)
+    jitter = rng.uniform(-amount, amount, size=coords.shape)
+    return counts.assign(
+        lat=coords[:, 0], lon=coords[:, 1],
+        lat_jitter=coords[:, 0] + jitter[:, 0], lon_jitter=coords[:, 1] + jitter[:, 1],
+    )[MAP_COLUMNS]
+
+
+def density_by_city(map_data):
+    """Total lowongan per kota untuk ColumnLayer 3D."""
+    return map_data.groupby(["kota", "lat", "lon"], sort=False)["Jumlah"].sum().reset_index()
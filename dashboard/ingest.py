@@ -0,0 +1,140 @@
+import csv
+import io
+import os
+import shutil
+
+import pandas as pd
+
+from dashboard.storage import COLUMN_ORDER, read_parquet, write_parquet
+
+# --- INGEST UPLOAD CSV (BERTAHAP / CHUNKED) ---
+# File upload tidak lagi dibaca utuh dengan pd.read_csv lalu disimpan di
+# session_state. Alurnya:
+# 1. Header dicek dulu (baris pertama saja) -> file salah format langsung ditolak
+# 2. CSV dibaca per CHUNK_ROWS baris, hanya kolom yang dipakai, dengan dtype
+#    eksplisit (tanpa type inference)
+# 3. Tiap chunk dinormalisasi (list_skill, gaji_angka, lokasi, kategori) lalu
+#    ditulis sebagai satu file Parquet di folder store upload
+# Memori puncak saat parsing ~ satu chunk, berapa pun ukuran file. Folder store
+# diberi nama hash isi file, jadi upload yang sama tidak diproses dua kali dan
+# bisa dipakai bersama oleh semua sesi.
+
+UPLOAD_STORE_DIR = "./data/uploads"
+CHUNK_ROWS = 50_000
+REQUIRED_COLUMNS = COLUMN_ORDER
+# Semua kolom dibaca sebagai teks; konversi tipe dilakukan oleh normalize_frame per chunk
+CSV_DTYPES = {col: "object" for col in REQUIRED_COLUMNS}
+
+
+class SchemaError(ValueError):
+    def __init__(self, missing):
+        self.missing = set(missing)
+        super().__init__(f"Kolom hilang: {sorted(self.missing)}")
+
+
+def read_header(fileobj):
+    """Nama kolom dari baris pertama CSV (posisi file dikembalikan ke awal)."""
+    fileobj.seek(0)
+    first_line = fileobj.readline()
+    fileobj.seek(0)
+    if isinstance(first_line, bytes):
+        first_line = first_line.decode("utf-8-sig", errors="replace")
+    first_line = first_line.lstrip("\ufeff")
+    row = next(csv.reader(io.StringIO(first_line)), [])
+    return [col.strip() for col in row]
+
+
+def validate_header(columns, required=REQUIRED_COLUMNS):
+    missing = set(required) - set(columns)
+    if missing:
+        raise SchemaError(missing)
+
+
+def store_path(key, store_dir=UPLOAD_STORE_DIR):
+    return os.path.join(store_dir, key)
+
+
+def ingest_csv(fileobj, key, store_dir=UPLOAD_STORE_DIR, chunk_rows=CHUNK_ROWS, progress=None):
+    """
+    Validasi header lalu tulis CSV per chunk ke store upload.
+    progress(fraksi 0..1, jumlah baris) dipanggil setiap selesai satu chunk.
+    Mengembalikan (path store, jumlah baris). SchemaError jika kolom wajib tidak ada.
+    """
+    validate_header(read_header(fileobj))
+
+    path = store_path(key, store_dir)
+    if os.path.isdir(path):
+        return path, count_rows(path)
+
+    fileobj.seek(0, os.SEEK_END)
+    total_bytes = max(fileobj.tell(), 1)
+    fileobj.seek(0)
+
+    tmp_path = f"{path}.tmp"
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+    n_rows = 0
+    try:
+        reader = pd.read_csv(fileobj, usecols=REQUIRED_COLUMNS, dtype=CSV_DTYPES, chunksize=chunk_rows)
+        for i, chunk in enumerate(reader):
+            write_parquet(chunk, os.path.join(tmp_path, f"part-{i:05d}.parquet"))
+            n_rows += len(chunk)
+            if progress is not None:
+                progress(min(fileobj.tell() / total_bytes, 1.0), n_rows)
+        os.replace(tmp_path, path)
+    except BaseException:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+    return path, n_rows
+
+
+def store_frame(df, key, store_dir=UPLOAD_STORE_DIR):
+    """Simpan DataFrame (mis. hasil 'Bersihkan & Gabung Data') sebagai store upload."""
+    path = store_path(key, store_dir)
+    if not os.path.isdir(path):
+        tmp_path = f"{path}.tmp"
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        os.makedirs(tmp_path)
+        write_parquet(df, os.path.join(tmp_path, "part-00000.parquet"))
+        os.replace(tmp_path, path)
+    return path
+
+
+def store_batches(batches, key, store_dir=UPLOAD_STORE_DIR):
+    """
+    Tulis DataFrame batch (mis. dari stream_scraper) satu per satu sebagai part Parquet,
+    tanpa menggabungkannya di memori. Mengembalikan (path store, jumlah baris);
+    path None jika tidak ada baris sama sekali.
+    """
+    path = store_path(key, store_dir)
+    tmp_path = f"{path}.tmp"
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+    n_rows = 0
+    try:
+        for i, batch in enumerate(b for b in batches if not b.empty):
+            write_parquet(batch, os.path.join(tmp_path, f"part-{i:05d}.parquet"))
+            n_rows += len(batch)
+        if not n_rows:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            return None, 0
+        shutil.rmtree(path, ignore_errors=True)
+        os.replace(tmp_path, path)
+    except BaseException:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+    return path, n_rows
+
+
+def count_rows(path):
+    import pyarrow.parquet as pq
+
+    return sum(pq.ParquetFile(os.path.join(path, name)).metadata.num_rows
+               for name in os.listdir(path) if name.endswith(".parquet"))
+
+
+def load_store(path):
+    """Baca store upload (semua part Parquet) sebagai satu DataFrame."""
+    if not path or not os.path.isdir(path) or not os.listdir(path):
+        return pd.DataFrame(columns=COLUMN_ORDER)
+    return read_parquet(path)
@@ -0,0 +1,285 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+from dashboard.storage import parse_skill_list
+
+# --- DETEKSI NEAR-DUPLICATE (MINHASH + LSH) ---
+# Lowongan yang sama sering diposting ulang dengan judul / ejaan perusahaan yang
+# sedikit berbeda ("PT. X" vs "PT X, Tbk"), sehingga lolos dari dedup kunci persis
+# (dashboard/dedup.py). Di sini tiap lowongan diubah menjadi himpunan shingle:
+#   c:<token perusahaan>  (tanpa PT/Tbk/CV/...), p:<token posisi>, k:<kota>,
+#   s:<skill>, d:<3 kata deskripsi> (jika kolom deskripsi tersedia)
+# lalu diringkas menjadi signature MinHash (NUM_PERM nilai). Signature dipotong
+# menjadi BANDS band; dua lowongan menjadi kandidat jika ada satu band yang sama
+# persis (LSH), jadi tidak perlu membandingkan semua pasangan (n^2). Kandidat
+# diverifikasi dengan estimasi Jaccard dari signature >= threshold.
+# NearDuplicateIndex menyimpan bucket LSH sehingga batch baru (hasil scrape)
+# bisa ditambahkan dan dicek secara incremental.
+
+NUM_PERM = 64
+BANDS = 16
+THRESHOLD = 0.7
+MAX_BUCKET_COMPARE = 50   # batas kandidat per bucket (lowongan identik massal)
+SEED = 1
+
+_MERSENNE_PRIME = (1 << 31) - 1
+_CHUNK_RECORDS = 5000
+_WORD_RE = re.compile(r"[a-z0-9+#]+")
+LEGAL_TOKENS = {"pt", "tbk", "cv", "persero", "ltd", "inc", "co", "corp", "llc", "pte", "sdn", "bhd"}
+
+
+def _words(text):
+    if text is None or (isinstance(text, float) and text != text):
+        return []
+    return _WORD_RE.findall(str(text).lower())
+
+
+def record_shingles(perusahaan, posisi, kota, skills, deskripsi=None):
+    """Himpunan shingle untuk satu lowongan."""
+    shingles = {f"c:{w}" for w in _words(perusahaan) if w not in LEGAL_TOKENS}
+    shingles.update(f"p:{w}" for w in _words(posisi))
+    kota_words = _words(kota)
+    if kota_words:
+        shingles.add("k:" + " ".join(kota_words))
+    shingles.update(f"s:{str(s).lower()}" for s in parse_skill_list(skills))
+    words = _words(deskripsi)
+    shingles.update("d:" + " ".join(words[i:i + 3]) for i in range(max(len(words) - 2, 0)))
+    return shingles
+
+
+def frame_shingles(df, description_col="deskripsi"):
+    """List himpunan shingle per baris df (kolom deskripsi opsional)."""
+    deskripsi = df[description_col] if description_col in df else [None] * len(df)
+    return [
+        record_shingles(*values)
+        for values in zip(df["Perusahaan"], df["Posisi"], df["kota"], df["list_skill"], deskripsi)
+    ]
+
+
+def jaccard(a, b):
+    return len(a & b) / len(a | b) if (a or b) else 0.0
+
+
+class MinHasher:
+    """Permutasi hash (a*h + b) mod p, dihitung vektor untuk semua shingle sekaligus."""
+
+    def __init__(self, num_perm=NUM_PERM, seed=SEED):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.a = rng.integers(1, _MERSENNE_PRIME, size=num_perm, dtype=np.int64)
+        self.b = rng.integers(0, _MERSENNE_PRIME, size=num_perm, dtype=np.int64)
+
+    def signatures(self, shingle_sets):
+        n = len(shingle_sets)
+        result = np.full((n, self.num_perm), _MERSENNE_PRIME, dtype=np.int64)
+        for start in range(0, n, _CHUNK_RECORDS):
+            chunk = shingle_sets[start:start + _CHUNK_RECORDS]
+            lengths = np.fromiter((len(s) for s in chunk), dtype=np.int64, count=len(chunk))
+            if not lengths.sum():
+                continue
+            flat = np.array([x for s in chunk for x in s], dtype=object)
+            # hash_array deterministik (tidak seperti hash() bawaan Python yang di-salt per proses)
+            h = (pd.util.hash_array(flat) & np.uint64(0x7FFFFFFF)).astype(np.int64)
+            values = (h[:, None] * self.a + self.b) % _MERSENNE_PRIME
+            nonempty = lengths > 0
+            offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))[nonempty]
+            result[start + np.flatnonzero(nonempty)] = np.minimum.reduceat(values, offsets, axis=0)
+        return result
+
+
+class NearDuplicateIndex:
+    """
+    Index LSH incremental. Setiap baris yang ditambahkan diberi label
+    (default: nomor urut global) dan disimpan signature-nya.
+    """
+
+    def __init__(self, num_perm=NUM_PERM, bands=BANDS, threshold=THRESHOLD, seed=SEED):
+        if num_perm % bands:
+            raise ValueError("num_perm harus habis dibagi bands")
+        self.hasher = MinHasher(num_perm, seed)
+        self.bands = bands
+        self.rows_per_band = num_perm // bands
+        self.threshold = threshold
+        self.labels = []
+        self._signatures = np.empty((0, num_perm), dtype=np.int64)
+        self._buckets = [dict() for _ in range(bands)]
+
+    def __len__(self):
+        return len(self.labels)
+
+    def _band_keys(self, signatures):
+        """(n, bands) kunci bucket uint64 per band."""
+        sig = signatures.astype(np.uint64).reshape(len(signatures), self.bands, self.rows_per_band)
+        keys = np.zeros((len(signatures), self.bands), dtype=np.uint64)
+        for j in range(self.rows_per_band):
+            keys = keys * np.uint64(1000003) ^ sig[:, :, j]
+        return keys
+
+    def _candidates(self, keys_row):
+        found = set()
+        for band, key in enumerate(keys_row):
+            members = self._buckets[band].get(int(key))
+            if members:
+                found.update(members[-MAX_BUCKET_COMPARE:])
+        return found
+
+    def _similar(self, signature, candidates):
+        if not candidates:
+            return []
+        ids = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+        sims = (self._signatures[ids] == signature).mean(axis=1)
+        keep = sims >= self.threshold
+        return list(zip(ids[keep].tolist(), sims[keep].tolist()))
+
+    def query(self, df):
+        """
+        Cocokkan baris df dengan isi index TANPA menambahkannya.
+        Mengembalikan DataFrame [row, match, similarity] (row = index df, match = label index).
+        """
+        signatures = self.hasher.signatures(frame_shingles(df))
+        keys = self._band_keys(signatures)
+        rows = []
+        for i, row_label in enumerate(df.index):
+            for pos, sim in self._similar(signatures[i], self._candidates(keys[i])):
+                rows.append((row_label, self.labels[pos], sim))
+        return pd.DataFrame(rows, columns=["row", "match", "similarity"])
+
+    def add(self, df, labels=None):
+        """
+        Tambahkan batch baru. Setiap baris dicek terhadap isi index + baris sebelumnya
+        di batch yang sama, lalu dimasukkan ke bucket. Mengembalikan pasangan
+        near-duplicate yang ditemukan: DataFrame [label, match, similarity].
+        """
+        labels = list(range(len(self.labels), len(self.labels) + len(df))) if labels is None else list(labels)
+        signatures = self.hasher.signatures(frame_shingles(df))
+        keys = self._band_keys(signatures)
+        empty = (signatures == _MERSENNE_PRIME).all(axis=1)
+
+        start = len(self.labels)
+        self._signatures = np.vstack([self._signatures, signatures])
+        self.labels.extend(labels)
+
+        pairs = []
+        for i in range(len(df)):
+            if empty[i]:
+                continue
+            pos = start + i
+            for match, sim in self._similar(signatures[i], self._candidates(keys[i])):
+                pairs.append((labels[i], self.labels[match], sim))
+            for band, key in enumerate(keys[i]):
+                self._buckets[band].setdefault(int(key), []).append(pos)
+        return pd.DataFrame(pairs, columns=["label", "match", "similarity"])
+
+
+def find_near_duplicates(df, **kwargs):
+    """Semua pasangan near-duplicate di dalam satu DataFrame (label = posisi baris)."""
+    return NearDuplicateIndex(**kwargs).add(df)
+
+
+def cluster_ids(n, pairs):
+    """Nomor cluster per baris dari pasangan (komponen terhubung)."""
+    from scipy import sparse
+    from scipy.sparse.csgraph import connected_components
+
+    if pairs.empty:
+        return np.arange(n)
+    i = pairs.iloc[:, 0].to_numpy(dtype=np.int64)
+    j = pairs.iloc[:, 1].to_numpy(dtype=np.int64)
+    graph = sparse.coo_matrix((np.ones(len(i)), (i, j)), shape=(n, n))
+    return connected_components(graph, directed=False)[1]
+
+
+def _perturb(row, rng):
+    """Buat versi 'repost' dari satu lowongan (ejaan perusahaan / judul sedikit berubah)."""
+    row = row.copy()
+    perusahaan = str(row["Perusahaan"])
+    options = [
+        perusahaan.replace("PT. ", "PT ") if "PT. " in perusahaan else f"PT. {perusahaan}",
+        f"{perusahaan}, Tbk",
+        perusahaan.upper(),
+    ]
+    row["Perusahaan"] = options[rng.integers(len(options))]
+    posisi = str(row["Posisi"])
+    options = [posisi.upper(), f"{posisi} (Urgent)", posisi.replace("-", " "), f"{posisi} - Jakarta"]
+    row["Posisi"] = options[rng.integers(len(options))]
+    skills = parse_skill_list(row["list_skill"])
+    if len(skills) > 4:
+        skills = list(skills)
+        skills.pop(int(rng.integers(len(skills))))
+    row["list_skill"] = skills
+    return row
+
+
+def benchmark(csv_path="./data/data_loker_clean.csv", n_planted=300, scale=20, seed=0):
+    """
+    Presisi & throughput pada dataset utama:
+    - recall     : dari n_planted repost sintetis, berapa yang ditemukan
+    - presisi    : pasangan yang dilaporkan yang memang lowongan sama (ground truth =
+                   repost yang ditanam + duplikat kunci persis dedup, termasuk turunannya)
+    - kesesuaian Jaccard : pasangan dengan Jaccard shingle asli >= THRESHOLD (hanya
+                   mengecek estimasi MinHash terhadap shingle-nya sendiri, bukan presisi)
+    - throughput : baris/detik untuk dataset yang diperbesar `scale` kali (incremental per batch)
+    """
+    import time
+
+    from dashboard.dedup import composite_keys, link_keys
+
+    rng = np.random.default_rng(seed)
+    base = pd.read_csv(csv_path)
+    base["list_skill"] = base["list_skill"].map(parse_skill_list)
+
+    # 1. Presisi / recall
+    sample = rng.choice(len(base), size=min(n_planted, len(base)), replace=False)
+    planted = pd.DataFrame([_perturb(base.iloc[i], rng) for i in sample]).reset_index(drop=True)
+    data = pd.concat([base, planted], ignore_index=True)
+    truth = {(len(base) + k, int(i)) for k, i in enumerate(sample)}
+
+    start_time = time.perf_counter()
+    pairs = find_near_duplicates(data)
+    elapsed = time.perf_counter() - start_time
+
+    found = {(int(a), int(b)) for a, b in zip(pairs["label"], pairs["match"])}
+    recall = len(truth & found) / len(truth)
+
+    # Ground truth "lowongan sama": graf baris -- kunci persis (komposit / link) ditambah
+    # pasangan repost yang ditanam; dua baris benar-duplikat jika satu komponen terhubung
+    n = len(data)
+    composite = pd.factorize(composite_keys(data))[0] + n
+    links = link_keys(data).to_numpy()
+    has_link = links != ""
+    link_ids = pd.factorize(links[has_link])[0] + composite.max() + 1
+    edges = pd.DataFrame({
+        "a": np.concatenate([np.arange(n), np.flatnonzero(has_link), [a for a, _ in truth]]),
+        "b": np.concatenate([composite, link_ids, [b for _, b in truth]]),
+    })
+    same_job = cluster_ids(int(max(composite.max(), link_ids.max(initial=0))) + 1, edges)
+    hits = np.array([same_job[a] == same_job[b] for a, b in found])
+    precision = float(hits.mean()) if found else 1.0
+
+    shingles = frame_shingles(data)
+    true_jaccard = np.array([jaccard(shingles[a], shingles[b]) for a, b in found]) if found else np.array([])
+    jaccard_agreement = float((true_jaccard >= THRESHOLD).mean()) if len(true_jaccard) else 1.0
+    print(f"📊 {n} baris ({len(base)} asli + {len(planted)} repost sintetis) dalam {elapsed:.2f} detik")
+    print(f"   Pasangan ditemukan : {len(found)} (dari {n * (n - 1) // 2:,} pasangan mungkin)")
+    print(f"   Recall repost      : {recall:.1%}")
+    print(f"   Presisi            : {precision:.1%} (repost ditanam + duplikat kunci persis)")
+    print(f"   Kesesuaian Jaccard : {jaccard_agreement:.1%} (estimasi MinHash vs Jaccard shingle asli)")
+
+    # 2. Throughput incremental (batch seperti hasil scrape)
+    big = pd.concat([base] * scale, ignore_index=True)
+    index = NearDuplicateIndex()
+    batch_size = 1000
+    start_time = time.perf_counter()
+    for batch_start in range(0, len(big), batch_size):
+        index.add(big.iloc[batch_start:batch_start + batch_size])
+    elapsed = time.perf_counter() - start_time
+    print(f"   Throughput         : {len(big) / elapsed:,.0f} baris/detik ({len(big)} baris, batch {batch_size})")
+    return {"recall": recall, "precision": precision, "jaccard_agreement": jaccard_agreement,
+            "pairs": len(found), "rows_per_sec": len(big) / elapsed}
+
+
+if __name__ == "__main__":
+    # python -m dashboard.near_dup  -> benchmark presisi & throughput
+    benchmark()
@@ -0,0 +1,57 @@
+import hashlib
+import os
+
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from dashboard.storage import (
+    BASE_CSV_PATH, BASE_PARQUET_PATH, CATEGORICAL_COLUMNS, COLUMN_ORDER, normalize_frame,
+)
+
+# --- PREPROCESSING BERTINGKAT (VERSIONED) ---
+# Setiap sumber data punya "versi":
+# - data utama  : mtime file CSV/Parquet
+# - data scrape : counter generasi di session_state (naik setiap ada perubahan)
+# - data upload : path store upload (nama folder = hash isi file)
+# Baris baru dinormalisasi SEKALI saat masuk (prepare_rows); index per bagian data
+# di-cache per versi (lihat dashboard/views.py). Rerun karena widget filter tidak
+# memproses ulang data.
+
+
+def base_data_version(csv_path=BASE_CSV_PATH, parquet_path=BASE_PARQUET_PATH):
+    """Versi data utama = mtime terbaru dari file CSV / Parquet (None jika tidak ada)."""
+    mtimes = [os.path.getmtime(p) for p in (csv_path, parquet_path) if os.path.exists(p)]
+    return max(mtimes) if mtimes else None
+
+
+def content_hash(data):
+    """Hash isi file upload (bytes) untuk dipakai sebagai versi."""
+    return hashlib.md5(data).hexdigest()
+
+
+def prepare_rows(df):
+    """Normalisasi baris tambahan (scrape/upload) sekali saja, sebelum disimpan di sesi."""
+    if df is None or df.empty:
+        return pd.DataFrame(columns=COLUMN_ORDER)
+    return normalize_frame(df)
+
+
+def concat_frames(frames):
+    """
+    pd.concat yang mempertahankan kolom categorical (kategori disatukan dulu,
+    kalau tidak pandas akan menurunkan kolomnya ke object).
+    """
+    frames = [f for f in frames if f is not None and not f.empty]
+    if not frames:
+        return pd.DataFrame(columns=COLUMN_ORDER)
+    if len(frames) == 1:
+        return frames[0]
+
+    frames = [f.copy(deep=False) for f in frames]
+    for col in CATEGORICAL_COLUMNS:
+        if not all(col in f.columns and isinstance(f[col].dtype, pd.CategoricalDtype) for f in frames):
+            continue
+        categories = union_categoricals([f[col] for f in frames]).categories
+        for f in frames:
+            f[col] = f[col].cat.set_categories(categories)
+    return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,169 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+# --- MATRIKS SKILL (SPARSE JOB x SKILL) ---
+# Dibangun sekali per versi dataset dari kolom list_skill, baris sejajar dengan
+# posisi baris DataFrame. Semua analisis skill untuk filter apa pun cukup
+# operasi matriks dengan mask baris (tanpa flatten list + Counter di Python):
+# - Top-N skill         : jumlah kolom yang di-mask
+# - Co-occurrence skill : X^T X
+# - Skill per provinsi  : P^T X (P = one-hot provinsi)
+# - Median gaji / skill : median gaji_angka pada baris tiap kolom
+# Semua hasil di atas bisa dijumlahkan antar bagian data, jadi matriks data
+# utama (dipakai bersama) dan data tambahan sesi digabung lewat SkillMatrixView
+# tanpa membangun matriks gabungan.
+
+
+class SkillMatrix:
+    def __init__(self, df, skill_col="list_skill"):
+        lists = df[skill_col].tolist()
+        lengths = np.fromiter((len(x) for x in lists), dtype=np.int64, count=len(lists))
+        flat = [s for skills in lists for s in skills]
+        codes, vocab = pd.factorize(pd.Series(flat, dtype="object"), sort=True)
+
+        indptr = np.zeros(len(lists) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+        matrix = sparse.csr_matrix(
+            (np.ones(len(codes), dtype=np.int32), codes.astype(np.int32), indptr),
+            shape=(len(lists), len(vocab)),
+        )
+        matrix.sum_duplicates()
+        matrix.data[:] = 1   # skill ganda di satu lowongan dihitung sekali
+
+        self.matrix = matrix
+        self.vocab = np.asarray(vocab, dtype=object)
+        self._vocab_pos = pd.Index(self.vocab)
+        self.gaji = pd.to_numeric(df["gaji_angka"], errors="coerce").to_numpy(dtype="float64")
+        self.provinsi = df["provinsi"].astype("category")
+
+    @property
+    def nbytes(self):
+        m = self.matrix
+        return m.data.nbytes + m.indices.nbytes + m.indptr.nbytes + self.gaji.nbytes + self.vocab.nbytes
+
+    def _rows(self, mask):
+        return self.matrix if mask is None else self.matrix[mask]
+
+    def counts(self, mask=None):
+        """Jumlah lowongan per skill untuk baris yang lolos mask (None = semua)."""
+        if mask is None:
+            return np.asarray(self.matrix.sum(axis=0)).ravel()
+        return np.asarray(self.matrix.T @ mask.astype(np.int32)).ravel()
+
+    def count_series(self, mask=None):
+        return pd.Series(self.counts(mask), index=self.vocab)
+
+    def columns(self, mask, skills):
+        """Sub-matriks baris ter-mask x `skills` (urutan sama; skill yang tidak ada = kolom nol)."""
+        pos = self._vocab_pos.get_indexer(skills)
+        found = np.flatnonzero(pos >= 0)
+        select = sparse.csr_matrix(
+            (np.ones(len(found), dtype=np.int32), (np.arange(len(found)), found)),
+            shape=(len(found), len(skills)),
+        )
+        return self._rows(mask)[:, pos[found]] @ select
+
+    def province_table(self, mask, skills):
+        """Tabel provinsi x `skills` (jumlah lowongan)."""
+        prov = self.provinsi if mask is None else self.provinsi[mask]
+        codes = prov.cat.codes.to_numpy()
+        valid = codes >= 0
+        onehot = sparse.csr_matrix(
+            (np.ones(valid.sum(), dtype=np.int32), (np.flatnonzero(valid), codes[valid])),
+            shape=(len(codes), len(prov.cat.categories)),
+        )
+        table = (onehot.T @ self.columns(mask, skills)).toarray()
+        return pd.DataFrame(table, index=prov.cat.categories, columns=skills)
+
+    def salary_values(self, mask):
+        """{skill: array gaji_angka (tanpa NaN)} untuk baris yang lolos mask."""
+        x = self._rows(mask).tocsc()
+        gaji = self.gaji if mask is None else self.gaji[mask]
+        result = {}
+        for j in range(x.shape[1]):
+            values = gaji[x.indices[x.indptr[j]:x.indptr[j + 1]]]
+            values = values[~np.isnan(values)]
+            if len(values):
+                result[self.vocab[j]] = values
+        return result
+
+    def top_skills(self, mask=None, n=10):
+        return SkillMatrixView([self]).top_skills([mask], n)
+
+    def cooccurrence(self, mask=None, n=10, top_k=30):
+        return SkillMatrixView([self]).cooccurrence([mask], n, top_k)
+
+    def by_province(self, mask=None, top_k=10):
+        return SkillMatrixView([self]).by_province([mask], top_k)
+
+    def median_salary(self, mask=None, n=10, min_jobs=5):
+        return SkillMatrixView([self]).median_salary([mask], n, min_jobs)
+
+
+class SkillMatrixView:
+    """
+    Beberapa SkillMatrix (mis. data utama + data tambahan sesi) dibaca sebagai satu.
+    Setiap method menerima list mask, satu per bagian (None = semua baris bagian itu).
+    """
+
+    def __init__(self, parts):
+        self.parts = list(parts)
+
+    def _total_counts(self, masks):
+        total = None
+        for part, mask in zip(self.parts, masks):
+            counts = part.count_series(mask)
+            total = counts if total is None else total.add(counts, fill_value=0)
+        total = total.astype(np.int64)
+        return total if len(self.parts) == 1 else total.sort_index()
+
+    def _top(self, masks, k):
+        counts = self._total_counts(masks)
+        values = counts.to_numpy()
+        top = np.argsort(-values, kind="stable")[:k]
+        top = top[values[top] > 0]
+        return counts.index[top], values[top]
+
+    def top_skills(self, masks, n=10):
+        skills, counts = self._top(masks, n)
+        return pd.DataFrame({"Skill": np.asarray(skills, dtype=object), "Jumlah": counts})
+
+    def cooccurrence(self, masks, n=10, top_k=30):
+        """Pasangan skill yang paling sering muncul bersama (di antara top_k skill)."""
+        keep = list(self._top(masks, top_k)[0])
+        co = np.zeros((len(keep), len(keep)), dtype=np.int64)
+        for part, mask in zip(self.parts, masks):
+            x = part.columns(mask, keep)
+            co += (x.T @ x).toarray()
+        i, j = np.triu_indices(len(keep), k=1)
+        pair_counts = co[i, j]
+        order = np.argsort(-pair_counts, kind="stable")[:n]
+        order = order[pair_counts[order] > 0]
+        return pd.DataFrame({
+            "Pasangan": [f"{keep[i[o]]} + {keep[j[o]]}" for o in order],
+            "Jumlah": pair_counts[order],
+        })
+
+    def by_province(self, masks, top_k=10):
+        """Tabel provinsi x top_k skill (jumlah lowongan)."""
+        keep = list(self._top(masks, top_k)[0])
+        result = None
+        for part, mask in zip(self.parts, masks):
+            table = part.province_table(mask, keep)
+            result = table if result is None else result.add(table, fill_value=0).astype(np.int64)
+        return result[result.sum(axis=1) > 0]
+
+    def median_salary(self, masks, n=10, min_jobs=5):
+        """Median gaji_angka per skill (hanya skill dengan >= min_jobs lowongan bergaji)."""
+        values = {}
+        for part, mask in zip(self.parts, masks):
+            for skill, arr in part.salary_values(mask).items():
+                values.setdefault(skill, []).append(arr)
+        rows = []
+        for skill in sorted(values):
+            arr = np.concatenate(values[skill])
+            if len(arr) >= min_jobs:
+                rows.append((skill, float(np.median(arr)), len(arr)))
+        result = pd.DataFrame(rows, columns=["Skill", "Median Gaji", "Jumlah"])
+        return result.sort_values("Median Gaji", ascending=False).head(n).reset_index(drop=True)
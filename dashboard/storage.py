@@ -0,0 +1,131 @@
+import ast
+import os
+
+import pandas as pd
+
+from scrapping.location import UNKNOWN_PROVINSI, normalize_locations
+
+# --- PENYIMPANAN DATASET (PARQUET) ---
+# CSV + ast.literal_eval per baris terlalu lambat untuk ratusan ribu baris.
+# Dataset utama disimpan juga sebagai Parquet dengan tipe kolom yang benar:
+# - list_skill  : list<string> asli (tidak perlu literal_eval)
+# - kota, provinsi, pendidikan, kategori_posisi, jenis : dictionary / categorical
+# - gaji_angka  : float64
+# File Parquet dibaca dengan memory map. CSV tetap menjadi sumber (bisa diedit manual),
+# Parquet dibuat ulang otomatis jika CSV lebih baru.
+
+BASE_CSV_PATH = "./data/data_loker_clean.csv"
+BASE_PARQUET_PATH = "./data/data_loker_clean.parquet"
+
+CATEGORICAL_COLUMNS = ["kota", "provinsi", "pendidikan", "kategori_posisi", "jenis"]
+STRING_COLUMNS = ["Perusahaan", "Posisi", "link"]
+COLUMN_ORDER = ["Perusahaan", "Posisi", "kategori_posisi", "kota", "gaji_angka",
+                "list_skill", "pendidikan", "jenis", "provinsi", "link"]
+
+
+def parse_skill_list(x):
+    """list_skill bisa berupa list, array (dari Parquet) atau string "['a', 'b']"."""
+    if isinstance(x, list): return x
+    if isinstance(x, str):
+        try:
+            parsed = ast.literal_eval(x)
+            return list(parsed) if isinstance(parsed, (list, tuple)) else []
+        except (ValueError, SyntaxError):
+            return []
+    if hasattr(x, "__len__") and not isinstance(x, (dict, bytes)):
+        return [str(s) for s in x]
+    return []
+
+
+def normalize_frame(df):
+    """Samakan tipe kolom seperti skema Parquet (dipakai juga untuk data scrape/upload)."""
+    df = df.copy()
+    for col in COLUMN_ORDER:
+        if col not in df.columns:
+            df[col] = None
+    df["list_skill"] = df["list_skill"].map(parse_skill_list)
+    df["gaji_angka"] = pd.to_numeric(df["gaji_angka"], errors="coerce").astype("float64")
+    df["pendidikan"] = df["pendidikan"].fillna("Tidak Disebutkan")
+    # Lokasi mentah -> nama kota kanonik; provinsi diisi dari gazetteer jika kosong / "Lainnya"
+    lokasi = normalize_locations(df["kota"])
+    df["kota"] = lokasi["kota"]
+    provinsi_kosong = df["provinsi"].isna() | (df["provinsi"].astype("object") == UNKNOWN_PROVINSI)
+    df["provinsi"] = df["provinsi"].astype("object").where(~provinsi_kosong, lokasi["provinsi"])
+    for col in STRING_COLUMNS:
+        df[col] = df[col].astype("object").where(df[col].notna(), None)
+    for col in CATEGORICAL_COLUMNS:
+        df[col] = df[col].astype("category")
+    return df[COLUMN_ORDER + [c for c in df.columns if c not in COLUMN_ORDER]]
+
+
+def _arrow_schema():
+    import pyarrow as pa
+
+    dict_str = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([
+        ("Perusahaan", pa.string()),
+        ("Posisi", pa.string()),
+        ("kategori_posisi", dict_str),
+        ("kota", dict_str),
+        ("gaji_angka", pa.float64()),
+        ("list_skill", pa.list_(pa.string())),
+        ("pendidikan", dict_str),
+        ("jenis", dict_str),
+        ("provinsi", dict_str),
+        ("link", pa.string()),
+    ])
+
+
+def write_parquet(df, parquet_path=BASE_PARQUET_PATH):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    df = normalize_frame(df)[COLUMN_ORDER]
+    table = pa.Table.from_pandas(df, schema=_arrow_schema(), preserve_index=False)
+    pq.write_table(table, parquet_path, compression="zstd")
+    return parquet_path
+
+
+def csv_to_parquet(csv_path=BASE_CSV_PATH, parquet_path=BASE_PARQUET_PATH):
+    """Konversi satu kali CSV lama -> Parquet bertipe."""
+    return write_parquet(pd.read_csv(csv_path), parquet_path)
+
+
+def read_parquet(parquet_path=BASE_PARQUET_PATH):
+    """Baca Parquet dengan memory map; list_skill dikembalikan sebagai list Python."""
+    import pyarrow.parquet as pq
+
+    table = pq.read_table(parquet_path, memory_map=True)
+    df = table.to_pandas()
+    df["list_skill"] = [list(x) if x is not None else [] for x in df["list_skill"]]
+    return df
+
+
+def load_base_dataset(csv_path=BASE_CSV_PATH, parquet_path=BASE_PARQUET_PATH):
+    """
+    Muat dataset utama. Pakai Parquet jika pyarrow tersedia (dibuat/diperbarui
+    otomatis dari CSV), selain itu fallback ke CSV + normalize_frame.
+    Mengembalikan DataFrame kosong jika tidak ada file sama sekali.
+    """
+    csv_exists = os.path.exists(csv_path)
+    parquet_exists = os.path.exists(parquet_path)
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return normalize_frame(pd.read_csv(csv_path)) if csv_exists else pd.DataFrame()
+
+    if csv_exists and (not parquet_exists or os.path.getmtime(csv_path) > os.path.getmtime(parquet_path)):
+        csv_to_parquet(csv_path, parquet_path)
+        parquet_exists = True
+    if not parquet_exists:
+        return pd.DataFrame()
+    return read_parquet(parquet_path)
+
+
+if __name__ == "__main__":
+    # python -m dashboard.storage  -> konversi CSV utama ke Parquet
+    import time
+
+    start_time = time.time()
+    out = csv_to_parquet()
+    print(f"✅ {BASE_CSV_PATH} -> {out} ({time.time() - start_time:.2f} detik)")
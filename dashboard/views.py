@@ -0,0 +1,73 @@
+import pandas as pd
+
+from dashboard.filters import FilterIndex
+from dashboard.geo import aggregate_map_parts
+from dashboard.preprocess import concat_frames
+from dashboard.skill_matrix import SkillMatrix, SkillMatrixView
+
+# --- VIEW DATA: DATA UTAMA BERSAMA + DELTA SESI ---
+# Data utama (beserta FilterIndex & SkillMatrix-nya) hanya ada SATU salinan per
+# proses (st.cache_resource), read-only, dipakai semua sesi. Setiap sesi hanya
+# menyimpan bagian tambahannya sendiri (hasil scrape) + bagian upload yang juga
+# dibagi lewat cache. DataView membaca bagian-bagian itu sebagai satu dataset:
+# - filter   : mask per bagian (bitmap masing-masing FilterIndex)
+# - skill    : SkillMatrixView (hasil per bagian dijumlahkan)
+# - peta     : aggregate_map_parts
+# - baris    : hanya baris yang lolos filter, hanya kolom tampilan (tanpa list_skill)
+# Jadi tidak ada DataFrame gabungan base + tambahan yang disimpan per sesi.
+
+# Kolom yang dipakai grafik / metrik / tabel (list_skill dibaca lewat SkillMatrix)
+VIEW_COLUMNS = ["Perusahaan", "Posisi", "kategori_posisi", "kota", "gaji_angka", "pendidikan", "jenis", "provinsi"]
+
+
+class DataPart:
+    """Satu bagian data beserta index filter & matriks skill-nya."""
+
+    def __init__(self, df):
+        self.df = df
+        self.filter_index = FilterIndex(df)
+        self.skill_matrix = SkillMatrix(df)
+        # Bagian data read-only: ukuran dihitung sekali (memory_usage(deep=True) mahal
+        # untuk data besar, jangan diulang di setiap rerun)
+        self.nbytes = int(df.memory_usage(deep=True).sum()) + self.filter_index.nbytes + self.skill_matrix.nbytes
+
+    def __len__(self):
+        return len(self.df)
+
+
+class DataView:
+    def __init__(self, parts):
+        self.parts = [p for p in parts if p is not None and len(p)]
+        self.skills = SkillMatrixView([p.skill_matrix for p in self.parts])
+
+    def __len__(self):
+        return sum(len(p) for p in self.parts)
+
+    def options(self, col):
+        values = set()
+        for part in self.parts:
+            values.update(part.filter_index.options[col])
+        return sorted(values)
+
+    def masks(self, selections):
+        """Mask per bagian (None = bagian itu tidak difilter)."""
+        return [part.filter_index.mask(selections) for part in self.parts]
+
+    def rows(self, masks, columns=VIEW_COLUMNS):
+        """DataFrame berisi baris yang lolos filter (hanya `columns`)."""
+        frames = []
+        for part, mask in zip(self.parts, masks):
+            df = part.df[columns]
+            frames.append(df if mask is None else df[mask])
+        return concat_frames(frames) if frames else pd.DataFrame(columns=columns)
+
+    def map_data(self, masks):
+        return aggregate_map_parts([(part.df, mask) for part, mask in zip(self.parts, masks)])
+
+
+def memory_report(shared_parts, session_parts):
+    """(MB data bersama, MB milik sesi ini) untuk ditampilkan di dashboard."""
+    shared = sum(p.nbytes for p in shared_parts if p is not None)
+    session = sum(p.nbytes for p in session_parts if p is not None)
+    return shared / 1e6, session / 1e6
+
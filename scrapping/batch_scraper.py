@@ -0,0 +1,193 @@
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+from scrapping import http_client
+from scrapping.driver_pool import get_driver_pool
+from scrapping.http_cache import HttpCache, HTTP_CACHE_PATH
+from scrapping.kalibrr_script import (
+    LISTING_MODE, MAX_WORKERS, build_record, extract_skills_batch, fetch_details, harvest_data,
+)
+from scrapping.raw_store import RawStore, RAW_STORE_PATH
+
+# --- SCRAPING BANYAK KATA KUNCI (BATCH / SHARDED) ---
+# Dataset mingguan butuh banyak kata kunci ("python", "java", "data analyst", ...).
+# Menjalankan run_scraper satu per satu berarti harvest berurutan dan halaman detail
+# lowongan yang muncul di beberapa kata kunci diambil berulang kali. Alurnya di sini:
+# 1. Harvest   : kata kunci dibagi ke process pool (MAX_PROCESSES), satu browser per
+#                proses worker; budget request Kalibrr dibagi rata antar worker
+#                sehingga total laju tetap sama dengan satu proses.
+# 2. Dedup link: hasil semua kata kunci digabung per link (kanonik), dan setiap link
+#                dicatat berasal dari kata kunci mana saja (provenance).
+# 3. Detail    : setiap link unik diambil SEKALI di proses utama (fetch_details,
+#                HTTP cache + raw store seperti run_scraper), skill di-mining per batch.
+
+MAX_PROCESSES = 3       # Proses harvest bersamaan (masing-masing 1 Chrome bila perlu Selenium)
+DEFAULT_TARGET = 20     # Target per kata kunci jika tidak disebutkan
+
+BatchResult = namedtuple("BatchResult", ["data", "provenance", "summary"])
+
+
+def parse_queries(queries, default_target=DEFAULT_TARGET):
+    """
+    Normalisasi daftar kata kunci -> list (query, target), urutan dipertahankan.
+    Menerima: ["python", "java"], [("python", 50), "java"] atau {"python": 50, "java": 20}.
+    Kata kunci kosong / ganda (beda huruf besar-kecil) dibuang.
+    """
+    pairs = queries.items() if isinstance(queries, dict) else queries
+    result, seen = [], set()
+    for entry in pairs:
+        query, target = (entry, None) if isinstance(entry, str) else entry
+        query = " ".join(str(query).split())
+        if not query or query.lower() in seen:
+            continue
+        seen.add(query.lower())
+        result.append((query, int(target or default_target)))
+    return result
+
+
+def canonical_link(url):
+    """Link tanpa query string / fragment / slash akhir (kunci dedup antar kata kunci)."""
+    return url.split("#", 1)[0].split("?", 1)[0].rstrip("/")
+
+
+def _init_harvest_worker(n_workers):
+    # Satu browser per proses worker; budget request Kalibrr dibagi rata antar worker
+    get_driver_pool(max_size=1)
+    http_client.configure_rate_limiter(
+        rate=http_client.REQUESTS_PER_SECOND / n_workers,
+        burst=max(1, http_client.BURST // n_workers),
+    )
+
+
+def _harvest_shard(query, target, listing_mode, close_browsers=False):
+    start_time = time.time()
+    try:
+        items = harvest_data(target, query, listing_mode=listing_mode)
+    finally:
+        if close_browsers:
+            # Worker ProcessPoolExecutor keluar lewat os._exit (atexit tidak jalan):
+            # Chrome milik worker harus ditutup di sini agar tidak jadi proses yatim
+            get_driver_pool().close_all()
+    return query, items, time.time() - start_time
+
+
+def harvest_queries(query_targets, listing_mode=LISTING_MODE, max_processes=MAX_PROCESSES):
+    """
+    Harvest semua kata kunci, dibagi ke process pool.
+    Mengembalikan {query: list item} (urutan item sesuai hasil listing).
+    max_processes=1 (atau satu kata kunci) menjalankan harvest di proses ini.
+    """
+    n_workers = max(1, min(max_processes, len(query_targets)))
+    results = {}
+    if n_workers == 1:
+        for query, target in query_targets:
+            query, items, elapsed = _harvest_shard(query, target, listing_mode)
+            print(f"   🔎 '{query}': {len(items)} link ({elapsed:.1f} detik)")
+            results[query] = items
+        return results
+
+    with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_harvest_worker,
+                             initargs=(n_workers,)) as executor:
+        futures = [executor.submit(_harvest_shard, query, target, listing_mode, close_browsers=True)
+                   for query, target in query_targets]
+        for future in as_completed(futures):
+            try:
+                query, items, elapsed = future.result()
+            except Exception as e:
+                print(f"❌ Harvest gagal: {e}")
+                continue
+            print(f"   🔎 '{query}': {len(items)} link ({elapsed:.1f} detik)")
+            results[query] = items
+    # Urutan dikembalikan sesuai input (hasil as_completed acak)
+    return {query: results[query] for query, _ in query_targets if query in results}
+
+
+def merge_harvests(harvests):
+    """
+    Gabungkan hasil harvest per kata kunci menjadi item unik per link.
+    Mengembalikan (items unik, provenance DataFrame [query, link, rank]).
+    Item yang sudah membawa data detail dari listing JSON ("prefetched") diutamakan.
+    """
+    unique, rows = {}, []
+    for query, items in harvests.items():
+        for rank, item in enumerate(items, start=1):
+            key = canonical_link(item["link"])
+            rows.append((query, key, rank))
+            if key not in unique or (item.get("prefetched") and not unique[key].get("prefetched")):
+                unique[key] = {**item, "link": key}
+    provenance = pd.DataFrame(rows, columns=["query", "link", "rank"])
+    return list(unique.values()), provenance
+
+
+def provenance_summary(provenance):
+    """Per kata kunci: jumlah link, link yang juga muncul di kata kunci lain, dan yang unik."""
+    if provenance.empty:
+        return pd.DataFrame(columns=["query", "harvested", "shared", "only_this"])
+    n_queries = provenance.groupby("link")["query"].transform("nunique")
+    summary = provenance.assign(shared=n_queries > 1).groupby("query", sort=False).agg(
+        harvested=("link", "size"), shared=("shared", "sum"),
+    )
+    summary["only_this"] = summary["harvested"] - summary["shared"]
+    return summary.reset_index()
+
+
+def run_batch_scraper(queries, default_target=DEFAULT_TARGET, max_processes=MAX_PROCESSES,
+                      max_workers=MAX_WORKERS, raw_store_path=RAW_STORE_PATH,
+                      http_cache_path=HTTP_CACHE_PATH, offline=False, listing_mode=LISTING_MODE):
+    """
+    Scraping banyak kata kunci sekaligus (lihat parse_queries untuk format `queries`).
+    Mengembalikan BatchResult:
+    - data       : DataFrame gabungan (format run_scraper), satu baris per link unik,
+                   plus kolom `search_queries` (kata kunci asal, dipisah "; ")
+    - provenance : DataFrame [query, link, rank] (posisi link di hasil tiap kata kunci)
+    - summary    : ringkasan per kata kunci (harvested / shared / only_this)
+    """
+    start_time = time.time()
+    query_targets = parse_queries(queries, default_target)
+    if not query_targets:
+        return BatchResult(pd.DataFrame(), pd.DataFrame(columns=["query", "link", "rank"]), provenance_summary(pd.DataFrame()))
+
+    print(f"🚜 BATCH: {len(query_targets)} kata kunci, maks {max_processes} proses harvest...")
+    harvests = harvest_queries(query_targets, listing_mode=listing_mode, max_processes=max_processes)
+    items, provenance = merge_harvests(harvests)
+    summary = provenance_summary(provenance)
+    print(f"🔗 {len(provenance)} link dari semua kata kunci -> {len(items)} link unik "
+          f"({len(provenance) - len(items)} duplikat tidak diambil ulang)")
+    if not items:
+        return BatchResult(pd.DataFrame(), provenance, summary)
+
+    cache = HttpCache(http_cache_path, offline=offline) if http_cache_path else None
+    try:
+        raws = fetch_details(items, max_workers=max_workers, cache=cache)
+    finally:
+        if cache is not None:
+            print(f"   📦 HTTP cache: {cache.stats()}")
+            cache.close()
+
+    if raw_store_path:
+        with RawStore(raw_store_path) as store:
+            saved = store.put_many([raw for raw in raws if raw["ok"]])
+        print(f"💾 {saved} dokumen mentah disimpan ke {raw_store_path}")
+
+    all_skills = extract_skills_batch([raw.get("deskripsi") or "" for raw in raws])
+    data = pd.DataFrame([build_record(raw, skills=skills) for raw, skills in zip(raws, all_skills)])
+    sources = provenance.groupby("link", sort=False)["query"].agg("; ".join)
+    data["search_queries"] = data["link"].map(sources)
+    print(f"🎉 BATCH SELESAI: {len(data)} data dalam {time.time() - start_time:.1f} detik.")
+    return BatchResult(data, provenance, summary)
+
+
+if __name__ == "__main__":
+    # Contoh: python -m scrapping.batch_scraper python java "data analyst" devops
+    #         (hasil: data/data_batch.csv + data/data_batch_provenance.csv)
+    import sys
+
+    result = run_batch_scraper(sys.argv[1:] or ["python", "java", "data analyst", "devops"])
+    print(result.summary.to_string(index=False))
+    if not result.data.empty:
+        result.data.to_csv("./data/data_batch.csv", index=False)
+        result.provenance.to_csv("./data/data_batch_provenance.csv", index=False)
+        print("💾 Disimpan ke ./data/data_batch.csv (+ _provenance.csv)")
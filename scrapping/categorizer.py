@@ -0,0 +1,141 @@
+import re
+from functools import lru_cache
+
+import pandas as pd
+
+# --- KATEGORI POSISI (RULE SET TERKOMPILASI) ---
+# Aturan kategori ditulis sekali di CATEGORY_RULES (urutan = prioritas, aturan
+# pertama yang cocok menang, sama seperti rantai if/elif lama). Tiap aturan
+# dikompilasi menjadi satu regex alternation, jadi satu judul cukup dicek dengan
+# satu .search() per kategori, bukan any(x in title ...) per keyword.
+# Judul lowongan sangat sering berulang: hasil di-memo per judul yang sudah
+# dinormalisasi (lru_cache), dan versi kolom (categorize_titles) hanya
+# mengkategorikan nilai unik lalu menyebarkannya ke semua baris.
+# Setelah aturan diubah, dataset tersimpan bisa dikategorikan ulang lewat
+# `python -m scrapping.categorizer --write`.
+
+DEFAULT_CATEGORY = "Other"
+MEMO_SIZE = 16384
+
+# (kategori, keyword substring huruf kecil)
+CATEGORY_RULES = [
+    ("Data / AI", ["data", "ai", "learning", "intelligence", "analyst", "scientist"]),
+    ("Software Engineering", ["frontend", "backend", "fullstack", "software", "developer", "programmer",
+                              "web", "mobile", "android", "ios"]),
+    ("QA / Tester", ["qa", "tester", "quality"]),
+    ("DevOps / Infra", ["devops", "sre", "cloud", "system", "network", "infra", "security", "cyber"]),
+    ("Product / Project", ["product", "manager", "scrum", "project", "owner"]),
+]
+
+_SPACES_RE = re.compile(r"\s+")
+
+
+def compile_rules(rules=CATEGORY_RULES):
+    """[(kategori, regex)] — keyword tetap dicocokkan sebagai substring seperti aturan lama."""
+    return [
+        (category, re.compile("|".join(re.escape(k) for k in keywords)))
+        for category, keywords in rules
+    ]
+
+
+_COMPILED_RULES = compile_rules()
+
+
+def normalize_title(title):
+    if title is None or (isinstance(title, float) and title != title):
+        return ""
+    return _SPACES_RE.sub(" ", str(title).lower()).strip()
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def _categorize_normalized(title):
+    for category, pattern in _COMPILED_RULES:
+        if pattern.search(title):
+            return category
+    return DEFAULT_CATEGORY
+
+
+def categorize_title(title):
+    """Kategori untuk satu judul (di-memo per judul yang sudah dinormalisasi)."""
+    return _categorize_normalized(normalize_title(title))
+
+
+def categorize_titles(titles):
+    """
+    Versi kolom: Series judul -> Series kategori (index sama).
+    Tiap judul unik hanya dinormalisasi dan dicek sekali.
+    """
+    titles = pd.Series(titles)
+    # factorize judul mentah dulu (hash, cepat), normalisasi hanya nilai uniknya
+    codes, uniques = pd.factorize(titles, use_na_sentinel=False)
+    labels = pd.Index([categorize_title(t) for t in uniques], dtype="object")
+    return pd.Series(labels.take(codes), index=titles.index, name="kategori_posisi")
+
+
+def set_rules(rules):
+    """Ganti rule set saat runtime (memo dikosongkan supaya hasil lama tidak terpakai)."""
+    global _COMPILED_RULES
+    _COMPILED_RULES = compile_rules(rules)
+    _categorize_normalized.cache_clear()
+
+
+def recategorize_frame(df, title_col="Posisi", category_col="kategori_posisi"):
+    """Salinan df dengan kolom kategori dihitung ulang + jumlah baris yang berubah."""
+    result = df.copy()
+    new_categories = categorize_titles(df[title_col])
+    changed = int((df[category_col].astype("object") != new_categories).sum()) if category_col in df else len(df)
+    result[category_col] = new_categories
+    return result, changed
+
+
+def _determine_category_per_row(title):
+    """Implementasi lama (rantai any(x in title_lower ...)), hanya untuk benchmark."""
+    title_lower = str(title).lower()
+    for category, keywords in CATEGORY_RULES:
+        if any(x in title_lower for x in keywords):
+            return category
+    return DEFAULT_CATEGORY
+
+
+def benchmark(csv_path="./data/data_loker_clean.csv", repeat=200):
+    """Bandingkan apply per baris vs categorize_titles pada judul dataset (diperbesar `repeat` kali)."""
+    import time
+
+    titles = pd.read_csv(csv_path)["Posisi"]
+    titles = pd.concat([titles] * repeat, ignore_index=True)
+
+    start_time = time.perf_counter()
+    old = titles.apply(_determine_category_per_row)
+    t_old = time.perf_counter() - start_time
+
+    _categorize_normalized.cache_clear()
+    start_time = time.perf_counter()
+    new = categorize_titles(titles)
+    t_new = time.perf_counter() - start_time
+
+    mismatches = int((old != new).sum())
+    print(f"📊 {len(titles)} judul ({titles.nunique()} unik)")
+    print(f"   Per baris (lama) : {t_old:.3f} detik")
+    print(f"   Kolom (baru)     : {t_new:.3f} detik ({t_old / max(t_new, 1e-9):.1f}x lebih cepat)")
+    print(f"   Hasil berbeda    : {mismatches}")
+    return t_old, t_new, mismatches
+
+
+if __name__ == "__main__":
+    # python -m scrapping.categorizer           -> benchmark + ringkasan perubahan (dry run)
+    # python -m scrapping.categorizer --write   -> tulis ulang kategori_posisi di CSV utama
+    import sys
+    import time
+
+    csv_path = "./data/data_loker_clean.csv"
+    benchmark(csv_path)
+
+    start_time = time.time()
+    df = pd.read_csv(csv_path)
+    df_new, changed = recategorize_frame(df)
+    print(f"\n♻️  Kategorisasi ulang {len(df)} baris dalam {time.time() - start_time:.3f} detik, {changed} baris berubah.")
+    if "--write" in sys.argv:
+        df_new.to_csv(csv_path, index=False)
+        print(f"💾 Disimpan ke {csv_path} (Parquet dibuat ulang otomatis saat dashboard dibuka)")
+    else:
+        print(df_new["kategori_posisi"].value_counts().to_string())
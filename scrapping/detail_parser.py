@@ -0,0 +1,229 @@
+import sys
+
+import lxml.html
+from lxml import etree
+
+from scrapping import listing_json
+from scrapping.http_cache import source_version
+from scrapping.listing_json import canonical_education, extract_next_data
+
+# --- PARSING HALAMAN DETAIL (LEAN) ---
+# Halaman detail Kalibrr bisa ratusan KB, padahal yang dibaca hanya:
+#   div[itemprop=description], div[itemprop=qualifications], satu pasangan <dt>/<dd>
+#   pendidikan, dan JSON __NEXT_DATA__ (gaji).
+# Membangun pohon BeautifulSoup penuh untuk itu memakan sebagian besar CPU tahap
+# detail (dan menahan GIL dari thread pool). Jalur lean:
+# 1. __NEXT_DATA__ diambil langsung dari teks mentah (regex + json.loads), tanpa DOM.
+#    Jika JSON sudah memuat deskripsi/kualifikasi (dan kode pendidikan yang dikenal),
+#    DOM tidak di-parse sama sekali; tanpa kode pendidikan, DOM tetap dibaca untuk <dd>.
+# 2. Selain itu, DOM di-parse dengan lxml (C) dan elemen yang dibutuhkan diambil
+#    lewat XPath; teks digabung seperti get_text(separator=" ", strip=True).
+# parse_detail_html_soup = implementasi lama (html.parser, pendidikan mentah), pembanding benchmark.
+# PARSER_VERSION disimpan bersama hasil parse di HTTP cache: setiap perubahan modul
+# ini / listing_json (label pendidikan) membuat halaman tersimpan di-parse ulang.
+
+PARSER_VERSION = source_version(sys.modules[__name__], listing_json)
+
+_SKIP_TEXT_TAGS = {"script", "style", "template"}
+_EDU_DT_XPATH = (
+    "//dt[contains(translate(normalize-space(.), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'pendidikan')"
+    " or contains(translate(normalize-space(.), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'education')]"
+)
+
+
+def _texts(el):
+    if isinstance(el.tag, str) and el.tag not in _SKIP_TEXT_TAGS:
+        if el.text:
+            yield el.text
+        for child in el:
+            yield from _texts(child)
+            if child.tail:
+                yield child.tail
+
+
+def element_text(el):
+    """Sama dengan BeautifulSoup get_text(separator=" ", strip=True) untuk satu elemen lxml."""
+    return " ".join(t.strip() for t in _texts(el) if t.strip())
+
+
+def html_fragment_text(fragment):
+    if not fragment:
+        return ""
+    try:
+        return element_text(lxml.html.fragment_fromstring(fragment, create_parent="div"))
+    except (etree.ParserError, ValueError):
+        return ""
+
+
+def _job_info(data):
+    if not isinstance(data, dict):
+        return {}
+    job = data.get("props", {}).get("pageProps", {}).get("job", {})
+    return job if isinstance(job, dict) else {}
+
+
+def _salary(job):
+    try:
+        min_sal = job.get("minimum_salary")
+        max_sal = job.get("maximum_salary")
+        if not min_sal:
+            return None
+        gaji_angka = float(min_sal)
+        if max_sal:
+            gaji_angka = (gaji_angka + float(max_sal)) / 2
+        return gaji_angka
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_dom(html):
+    try:
+        return lxml.html.document_fromstring(html)
+    except (etree.ParserError, ValueError):
+        return None
+
+
+def _dom_education(root):
+    dt_pendidikan = root.xpath(_EDU_DT_XPATH)
+    if dt_pendidikan:
+        dd_pendidikan = dt_pendidikan[0].xpath("following-sibling::dd[1]")
+        if dd_pendidikan:
+            return canonical_education(element_text(dd_pendidikan[0]))
+    return None
+
+
+def parse_detail_html(html):
+    """
+    Parse halaman detail lowongan. Mengembalikan dict
+    {deskripsi, pendidikan, gaji_angka} (bisa disimpan apa adanya di HTTP cache).
+    """
+    parsed = {"deskripsi": "", "pendidikan": None, "gaji_angka": None}
+    job = _job_info(extract_next_data(html))
+    parsed["gaji_angka"] = _salary(job)
+
+    # Jalur tercepat: deskripsi & kualifikasi sudah ada di JSON
+    if job.get("description") or job.get("qualifications"):
+        desc_text = html_fragment_text(job.get("description"))
+        qual_text = html_fragment_text(job.get("qualifications"))
+        parsed["deskripsi"] = f"{desc_text} {qual_text}"
+        parsed["pendidikan"] = canonical_education(job.get("education_level"))
+        if parsed["pendidikan"] is None:
+            # Kode pendidikan kosong / tidak dikenal: ambil dari pasangan <dt>/<dd> halaman
+            root = _parse_dom(html)
+            if root is not None:
+                parsed["pendidikan"] = _dom_education(root)
+        return parsed
+
+    root = _parse_dom(html)
+    if root is None:
+        return parsed
+
+    desc_div = root.xpath('//div[@itemprop="description"]')
+    qual_div = root.xpath('//div[@itemprop="qualifications"]')
+    desc_text = element_text(desc_div[0]) if desc_div else ""
+    qual_text = element_text(qual_div[0]) if qual_div else ""
+    parsed["deskripsi"] = f"{desc_text} {qual_text}"
+    parsed["pendidikan"] = _dom_education(root)
+    return parsed
+
+
+def parse_detail_html_soup(html):
+    """
+    Implementasi lama (BeautifulSoup "html.parser", pohon penuh), hanya untuk benchmark.
+    Pendidikan dikembalikan mentah (teks <dd> apa adanya), seperti sebelum dikanonikkan.
+    """
+    import json
+
+    from bs4 import BeautifulSoup
+
+    parsed = {"deskripsi": "", "pendidikan": None, "gaji_angka": None}
+    soup = BeautifulSoup(html, "html.parser")
+    desc_div = soup.find("div", itemprop="description")
+    qual_div = soup.find("div", itemprop="qualifications")
+    desc_text = desc_div.get_text(separator=" ", strip=True) if desc_div else ""
+    qual_text = qual_div.get_text(separator=" ", strip=True) if qual_div else ""
+    parsed["deskripsi"] = f"{desc_text} {qual_text}"
+
+    dt_pendidikan = soup.find("dt", string=lambda t: t and ("pendidikan" in t.lower() or "education" in t.lower()))
+    if dt_pendidikan:
+        dd_pendidikan = dt_pendidikan.find_next_sibling("dd")
+        if dd_pendidikan:
+            parsed["pendidikan"] = dd_pendidikan.get_text(strip=True)
+
+    next_data = soup.find("script", id="__NEXT_DATA__")
+    if next_data:
+        try:
+            parsed["gaji_angka"] = _salary(_job_info(json.loads(next_data.string)))
+        except (TypeError, ValueError):
+            pass
+    return parsed
+
+
+def _padded(html, target_kb=300):
+    """Perbesar fixture ke ukuran halaman Kalibrr asli (markup navigasi / footer tambahan)."""
+    block = (
+        '<div class="k-flex k-items-center k-gap-2"><a class="k-text-primary" href="/id-ID/job-board">'
+        'Lowongan serupa</a><span class="k-text-subdued">Jakarta Raya, Indonesia</span>'
+        '<svg viewBox="0 0 24 24"><path d="M12 2L2 7l10 5 10-5-10-5z"></path></svg></div>\n'
+    )
+    filler = block * (target_kb * 1024 // len(block))
+    return html.replace("</main>", f"</main><footer>{filler}</footer>", 1)
+
+
+def _with_json_description(html, education_level=True):
+    """
+    Variasi fixture di mana deskripsi juga ada di __NEXT_DATA__ (seperti halaman asli).
+    education_level=False membuang kode pendidikan dari JSON (harus dibaca dari <dd>).
+    """
+    import json
+
+    data = extract_next_data(html)
+    root = lxml.html.document_fromstring(html)
+    job = data["props"]["pageProps"]["job"]
+    if not education_level:
+        job.pop("education_level", None)
+    job["description"] = lxml.html.tostring(root.xpath('//div[@itemprop="description"]')[0], encoding="unicode")
+    job["qualifications"] = lxml.html.tostring(root.xpath('//div[@itemprop="qualifications"]')[0], encoding="unicode")
+    start = html.index('<script id="__NEXT_DATA__"')
+    end = html.index("</script>", start) + len("</script>")
+    script = f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(data)}</script>'
+    return html[:start] + script + html[end:]
+
+
+def benchmark(fixture_path="./scrapping/fixtures/job_detail.html", repeat=50):
+    """Waktu parse per halaman: BeautifulSoup penuh vs jalur lean, pada fixture tersimpan."""
+    import time
+
+    with open(fixture_path, encoding="utf-8") as f:
+        html = f.read()
+    pages = {
+        "fixture (DOM)": html,
+        "fixture 300KB (DOM)": _padded(html),
+        "fixture 300KB (JSON)": _padded(_with_json_description(html)),
+        "300KB (JSON, tanpa kode)": _padded(_with_json_description(html, education_level=False)),
+    }
+
+    results = {}
+    print(f"📊 Parse halaman detail ({repeat}x per halaman)")
+    for name, page in pages.items():
+        timings = []
+        for parser in (parse_detail_html_soup, parse_detail_html):
+            start_time = time.perf_counter()
+            for _ in range(repeat):
+                parser(page)
+            timings.append((time.perf_counter() - start_time) / repeat * 1000)
+        old, new = parse_detail_html_soup(page), parse_detail_html(page)
+        # deskripsi & gaji_angka harus identik; pendidikan kini dikanonikkan
+        # (jalur lama menyimpan teks <dd> mentah), jadi dibandingkan setelah kanonik
+        same = (old["deskripsi"] == new["deskripsi"] and old["gaji_angka"] == new["gaji_angka"]
+                and canonical_education(old["pendidikan"]) == new["pendidikan"])
+        print(f"   {name:<24} {len(page) / 1024:6.0f} KB | soup {timings[0]:7.2f} ms | lean {timings[1]:6.2f} ms "
+              f"| {timings[0] / timings[1]:5.1f}x | field sama: {same} "
+              f"| pendidikan {old['pendidikan']!r} -> {new['pendidikan']!r}")
+        results[name] = (timings[0], timings[1], same)
+    return results
+
+
+if __name__ == "__main__":
+    # python -m scrapping.detail_parser  -> benchmark parse per halaman
+    benchmark()
@@ -0,0 +1,139 @@
+import atexit
+import threading
+import time
+
+from selenium import webdriver
+
+# --- CHROME DRIVER POOL ---
+# Headless Chrome butuh beberapa detik dan ratusan MB untuk start.
+# Pool ini menyimpan driver yang sudah hangat supaya bisa dipakai ulang antar
+# panggilan harvest_data (dan antar user Streamlit dalam satu proses):
+# - max_size: batas jumlah browser hidup bersamaan (pemanggil lain menunggu)
+# - health check sebelum driver dipinjamkan (driver mati dibuang & diganti)
+# - recycle: driver di-quit setelah melayani max_pages halaman (cegah memory leak Chrome)
+
+POOL_MAX_SIZE = 2
+POOL_MAX_PAGES = 50        # Recycle driver setelah sekian halaman
+POOL_ACQUIRE_TIMEOUT = 120 # Detik menunggu driver bebas sebelum menyerah
+
+
+def create_headless_driver():
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")           # Use new headless mode (lighter)
+    options.add_argument("--disable-gpu")            # Essential for servers
+    options.add_argument("--no-sandbox")             # Required for root/docker
+    options.add_argument("--disable-dev-shm-usage")  # Prevents shared memory crashes
+    options.add_argument("--disable-extensions")     # Save memory
+    options.add_argument("--disable-infobars")
+    return webdriver.Chrome(options=options)
+
+
+class DriverPool:
+    def __init__(self, max_size=POOL_MAX_SIZE, max_pages=POOL_MAX_PAGES, factory=create_headless_driver):
+        self.max_size = max_size
+        self.max_pages = max_pages
+        self.factory = factory
+        self._idle = []          # list of (driver, pages_served)
+        self._pages = {}         # id(driver) -> pages_served (driver yang sedang dipinjam)
+        self._alive = 0
+        self._cond = threading.Condition()
+
+    @staticmethod
+    def _is_healthy(driver):
+        try:
+            driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def acquire(self, timeout=POOL_ACQUIRE_TIMEOUT):
+        """Pinjam driver (hangat jika ada). Memblok jika pool penuh."""
+        deadline = time.monotonic() + timeout
+        while True:
+            driver = None
+            with self._cond:
+                while True:
+                    if self._idle:
+                        driver, pages = self._idle.pop()
+                        break
+                    if self._alive < self.max_size:
+                        self._alive += 1
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError("Semua Chrome driver sedang dipakai.")
+                    self._cond.wait(remaining)
+            if driver is None:
+                break
+
+            # Health check (round-trip WebDriver) di luar lock: satu Chrome yang hang
+            # tidak boleh memblok acquire / release lain. Selama dicek, driver tetap
+            # dihitung di _alive (slot-nya dipegang pemanggil ini).
+            if self._is_healthy(driver):
+                with self._cond:
+                    self._pages[id(driver)] = pages
+                return driver
+            self._quit(driver)
+            with self._cond:
+                self._alive -= 1
+                self._cond.notify()
+
+        # Start Chrome di luar lock (lambat)
+        try:
+            driver = self.factory()
+        except Exception:
+            with self._cond:
+                self._alive -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._pages[id(driver)] = 0
+        return driver
+
+    def release(self, driver, pages=1, broken=False):
+        """Kembalikan driver. pages = jumlah halaman yang dimuat selama dipinjam."""
+        with self._cond:
+            served = self._pages.pop(id(driver), 0) + pages
+            recycle = broken or served >= self.max_pages
+            if not recycle:
+                self._idle.append((driver, served))
+            else:
+                self._alive -= 1
+            self._cond.notify()
+        if recycle:
+            self._quit(driver)
+
+    def close_all(self):
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._alive -= len(idle)
+        for driver, _ in idle:
+            self._quit(driver)
+
+    def stats(self):
+        with self._cond:
+            return {"alive": self._alive, "idle": len(self._idle), "in_use": len(self._pages)}
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_driver_pool(max_size=POOL_MAX_SIZE):
+    """
+    Pool global per proses (dibagi semua sesi Streamlit).
+    max_size hanya berlaku saat pool pertama kali dibuat (mis. 1 browser per proses worker).
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = DriverPool(max_size=max_size)
+            atexit.register(_pool.close_all)
+        return _pool
@@ -0,0 +1,32 @@
+import functools
+import threading
+from contextlib import contextmanager
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+# --- LOCAL HTTP STAND-IN ---
+# Server HTTP lokal yang menyajikan file HTML tersimpan (scrapping/fixtures),
+# dipakai untuk menguji / benchmark fetch layer tanpa menyentuh kalibrr.id.
+
+FIXTURES_DIR = "./scrapping/fixtures"
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@contextmanager
+def serve_fixtures(directory=FIXTURES_DIR, port=0):
+    """
+    Context manager: jalankan server di thread background, yield base URL-nya.
+    Contoh: with serve_fixtures() as base: fetch(f"{base}/job_detail.html")
+    """
+    handler = functools.partial(_QuietHandler, directory=directory)
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,228 @@
+import hashlib
+import inspect
+import json
+import sqlite3
+import threading
+import time
+import zlib
+
+# --- HTTP CACHE (CONDITIONAL GET) ---
+# Cache on-disk untuk halaman detail lowongan, key = URL.
+# - Selama TTL belum habis: halaman diambil dari cache, tanpa request sama sekali.
+# - Setelah TTL: conditional GET (If-None-Match / If-Modified-Since). Jika server
+#   membalas 304, hasil parsing yang tersimpan dipakai ulang (tanpa BeautifulSoup).
+# - Ukuran total dibatasi; entri yang paling lama tidak diakses dibuang duluan (LRU).
+# - Mode offline: semua halaman dilayani dari cache (replay scrape untuk benchmark/uji).
+# - Setiap entri menyimpan versi parser. Jika parser berubah, body tersimpan di-parse
+#   ulang (tanpa request) alih-alih mengembalikan hasil parsing lama.
+
+HTTP_CACHE_PATH = "./data/http_cache.sqlite"
+CACHE_TTL_HOURS = 6
+CACHE_MAX_MB = 200
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS http_cache (
+    url            TEXT PRIMARY KEY,
+    status_code    INTEGER,
+    etag           TEXT,
+    last_modified  TEXT,
+    body           BLOB,
+    parsed         TEXT,
+    size           INTEGER,
+    stored_at      REAL,
+    last_access    REAL,
+    parser_version TEXT
+)
+"""
+
+
+def source_version(*modules):
+    """Hash source modul parser: berubah otomatis setiap kali kode parser diubah."""
+    digest = hashlib.sha1()
+    for module in modules:
+        digest.update(inspect.getsource(module).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+class CacheEntry:
+    def __init__(self, url, status_code, etag, last_modified, body, parsed, stored_at, parser_version=None):
+        self.url = url
+        self.status_code = status_code
+        self.etag = etag
+        self.last_modified = last_modified
+        self.body = body
+        self.parsed = parsed
+        self.stored_at = stored_at
+        self.parser_version = parser_version
+
+    def is_fresh(self, ttl_hours):
+        return time.time() - self.stored_at < ttl_hours * 3600
+
+    def conditional_headers(self):
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    """
+    Cache halaman HTTP berbasis SQLite. Aman dipakai dari beberapa thread
+    (satu koneksi, dijaga lock).
+    """
+
+    def __init__(self, path=HTTP_CACHE_PATH, ttl_hours=CACHE_TTL_HOURS, max_mb=CACHE_MAX_MB, offline=False):
+        self.path = path
+        self.ttl_hours = ttl_hours
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.offline = offline
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.reparsed = 0
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(_SCHEMA)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(http_cache)")}
+        if "parser_version" not in columns:
+            # Cache lama (tanpa versi): semua entri dianggap versi tidak dikenal -> di-parse ulang
+            self.conn.execute("ALTER TABLE http_cache ADD COLUMN parser_version TEXT")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_http_cache_access ON http_cache (last_access)")
+        self.conn.commit()
+
+    def get(self, url):
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT url, status_code, etag, last_modified, body, parsed, stored_at, parser_version "
+                "FROM http_cache WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            self.conn.execute("UPDATE http_cache SET last_access = ? WHERE url = ?", (time.time(), url))
+            self.conn.commit()
+        url, status_code, etag, last_modified, body, parsed, stored_at, parser_version = row
+        return CacheEntry(
+            url, status_code, etag, last_modified,
+            zlib.decompress(body).decode("utf-8") if body else "",
+            json.loads(parsed) if parsed else None,
+            stored_at, parser_version,
+        )
+
+    def put(self, url, response, parsed, parser_version=None):
+        """Simpan respon 200 beserta hasil parsing-nya (dan versi parser yang menghasilkannya)."""
+        body = zlib.compress(response.text.encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            self.conn.execute(
+                """
+                INSERT OR REPLACE INTO http_cache
+                (url, status_code, etag, last_modified, body, parsed, size, stored_at, last_access, parser_version)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    url, response.status_code, response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"), body, json.dumps(parsed),
+                    len(body), now, now, parser_version,
+                ),
+            )
+            self.conn.commit()
+            self._evict()
+
+    def update_parsed(self, url, parsed, parser_version):
+        """Ganti hasil parsing entri (body tetap) setelah di-parse ulang dengan parser baru."""
+        with self._lock:
+            self.conn.execute(
+                "UPDATE http_cache SET parsed = ?, parser_version = ? WHERE url = ?",
+                (json.dumps(parsed), parser_version, url),
+            )
+            self.conn.commit()
+
+    def _current_parsed(self, entry, parse, parser_version):
+        # Hasil parsing tersimpan hanya dipakai jika dibuat oleh versi parser yang sama
+        if entry.parser_version == parser_version:
+            return entry.parsed
+        parsed = parse(entry.body)
+        self.update_parsed(entry.url, parsed, parser_version)
+        self._count("reparsed")
+        return parsed
+
+    def touch(self, url, response=None):
+        """Server membalas 304: perpanjang umur entri (dan update validator jika dikirim)."""
+        now = time.time()
+        etag = response.headers.get("ETag") if response is not None else None
+        last_modified = response.headers.get("Last-Modified") if response is not None else None
+        with self._lock:
+            self.conn.execute(
+                """
+                UPDATE http_cache SET stored_at = ?, last_access = ?,
+                    etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified)
+                WHERE url = ?
+                """,
+                (now, now, etag, last_modified, url),
+            )
+            self.conn.commit()
+
+    def _evict(self):
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM http_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        cursor = self.conn.execute("SELECT url, size FROM http_cache ORDER BY last_access ASC")
+        to_delete = []
+        for url, size in cursor:
+            if total <= self.max_bytes:
+                break
+            to_delete.append((url,))
+            total -= size
+        self.conn.executemany("DELETE FROM http_cache WHERE url = ?", to_delete)
+        self.conn.commit()
+
+    def fetch(self, url, parse, fetch, parser_version=None):
+        """
+        Ambil URL lewat cache. `parse(html) -> dict` dipanggil untuk body baru, atau
+        untuk body tersimpan yang di-parse oleh versi parser lain.
+        `fetch(url, headers=...)` adalah fungsi GET (mis. http_client.fetch).
+        parser_version default = hash source modul `parse` (lihat source_version).
+        Mengembalikan (status_code, parsed, etag); parsed None jika gagal.
+        """
+        if parser_version is None:
+            parser_version = source_version(inspect.getmodule(parse))
+        entry = self.get(url)
+        if entry is not None and (self.offline or entry.is_fresh(self.ttl_hours)):
+            self._count("hits")
+            return entry.status_code, self._current_parsed(entry, parse, parser_version), entry.etag
+        if self.offline:
+            self._count("misses")
+            return None, None, None
+
+        response = fetch(url, headers=entry.conditional_headers() if entry is not None else {})
+        if response.status_code == 304 and entry is not None:
+            self.touch(url, response)
+            self._count("revalidated")
+            parsed = self._current_parsed(entry, parse, parser_version)
+            return entry.status_code, parsed, response.headers.get("ETag") or entry.etag
+        if response.status_code != 200:
+            return response.status_code, None, None
+
+        parsed = parse(response.text)
+        self.put(url, response, parsed, parser_version)
+        self._count("misses")
+        return response.status_code, parsed, response.headers.get("ETag")
+
+    def _count(self, kind):
+        with self._lock:
+            setattr(self, kind, getattr(self, kind) + 1)
+
+    def stats(self):
+        return {"hits": self.hits, "revalidated": self.revalidated, "misses": self.misses, "reparsed": self.reparsed}
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,75 @@
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from scrapping.rate_limiter import RateLimiter, RETRY_STATUS, parse_retry_after
+
+# --- HTTP CLIENT (CONNECTION POOLING) ---
+# Satu requests.Session dipakai bersama oleh semua worker, sehingga koneksi
+# keep-alive ke www.kalibrr.id dipakai ulang (tidak handshake TCP+TLS per halaman).
+# Laju request diatur per host oleh RateLimiter (token bucket + backoff),
+# bukan sleep acak per thread.
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Referer': 'https://www.google.com/'
+}
+POOL_SIZE = 16              # Maks koneksi keep-alive per host
+REQUESTS_PER_SECOND = 2.0   # Budget rata-rata per host
+BURST = 4                   # Request beruntun yang boleh lolos tanpa menunggu
+MAX_RETRIES = 3             # Percobaan ulang untuk 429/5xx/timeout
+REQUEST_TIMEOUT = 15
+
+
+_session = None
+_session_lock = threading.Lock()
+rate_limiter = RateLimiter(rate=REQUESTS_PER_SECOND, burst=BURST)
+
+
+def get_session():
+    """Session global dengan pool koneksi keep-alive (dibuat sekali, lazy)."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_SIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(DEFAULT_HEADERS)
+            _session = session
+        return _session
+
+
+def configure_rate_limiter(rate=REQUESTS_PER_SECOND, burst=BURST):
+    """Ganti budget request proses ini (mis. budget dibagi rata antar proses worker)."""
+    global rate_limiter
+    rate_limiter = RateLimiter(rate=rate, burst=burst)
+    return rate_limiter
+
+
+def fetch(url, timeout=REQUEST_TIMEOUT, max_retries=MAX_RETRIES, **kwargs):
+    """
+    GET lewat session bersama. Setiap percobaan meminta token ke rate_limiter;
+    429/5xx/timeout memicu backoff untuk seluruh worker lalu dicoba ulang.
+    Respon terakhir dikembalikan apa adanya (pemanggil tetap cek status_code).
+    """
+    host = urlsplit(url).netloc
+    for attempt in range(max_retries + 1):
+        rate_limiter.acquire(host)
+        try:
+            response = get_session().get(url, timeout=timeout, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt == max_retries:
+                raise
+            rate_limiter.on_error(host, attempt)
+            continue
+
+        if response.status_code in RETRY_STATUS and attempt < max_retries:
+            rate_limiter.on_error(host, attempt, parse_retry_after(response.headers.get("Retry-After")))
+            continue
+        if response.status_code not in RETRY_STATUS:
+            rate_limiter.on_success(host)
+        return response
+
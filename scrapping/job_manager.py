@@ -0,0 +1,199 @@
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import pandas as pd
+
+# --- JOB SCRAPING DI BACKGROUND ---
+# Tombol "Mulai Scraping" tidak lagi menjalankan run_scraper di thread script
+# Streamlit. Job dimasukkan ke antrean JobManager (satu per proses, dipakai semua
+# sesi) dan dijalankan oleh thread pool kecil (MAX_JOBS job bersamaan, sisanya
+# menunggu di antrean executor). Selama berjalan, scraper melaporkan progres
+# lewat ScrapeProgress (jumlah harvested / fetched / failed) dan memeriksa
+# permintaan batal di setiap halaman listing & setiap fetch detail.
+# Runner default = stream_scraper per batch: setiap batch langsung diteruskan ke
+# callback `store` (mis. part Parquet di store upload), jadi hasil scrape besar
+# tidak pernah ditampung utuh di memori dan tetap ada walaupun halaman di-refresh.
+
+MAX_JOBS = 2          # Job scraping yang berjalan bersamaan (masing-masing sudah multi-thread)
+MAX_FINISHED = 50     # Job selesai yang masih disimpan untuk di-poll
+JOB_BATCH_SIZE = 25   # Baris per batch yang diteruskan ke store
+
+QUEUED, RUNNING, DONE, FAILED, CANCELLED = "antri", "berjalan", "selesai", "gagal", "dibatalkan"
+FINAL_STATES = {DONE, FAILED, CANCELLED}
+
+
+class JobCancelled(Exception):
+    """Dilempar di dalam run_scraper saat job diminta berhenti."""
+
+
+class ScrapeProgress:
+    """Counter progres yang aman dipakai dari banyak thread + flag batal."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cancel = threading.Event()
+        self.stage = QUEUED
+        self.harvested = 0
+        self.fetched = 0
+        self.failed = 0
+        self.total = 0
+
+    def set_stage(self, stage):
+        self.stage = stage
+
+    def set_harvested(self, n):
+        with self._lock:
+            self.harvested = n
+
+    def set_total(self, n):
+        with self._lock:
+            self.total = n
+
+    def record_fetch(self, ok):
+        with self._lock:
+            if ok:
+                self.fetched += 1
+            else:
+                self.failed += 1
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def check(self):
+        if self._cancel.is_set():
+            raise JobCancelled()
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "stage": self.stage,
+                "harvested": self.harvested,
+                "fetched": self.fetched,
+                "failed": self.failed,
+                "total": self.total,
+            }
+
+
+class ScrapeJob:
+    def __init__(self, params):
+        self.id = uuid.uuid4().hex[:12]
+        self.params = params
+        self.progress = ScrapeProgress()
+        self.status = QUEUED
+        self.error = None
+        self.result_path = None
+        self.result_rows = 0
+        self.submitted_at = time.time()
+        self.finished_at = None
+        self.future = None
+
+    @property
+    def finished(self):
+        return self.status in FINAL_STATES
+
+    def snapshot(self):
+        info = self.progress.snapshot()
+        info.update({
+            "id": self.id,
+            "status": self.status,
+            "error": self.error,
+            "result_path": self.result_path,
+            "result_rows": self.result_rows,
+            "params": dict(self.params),
+            "elapsed": (self.finished_at or time.time()) - self.submitted_at,
+        })
+        return info
+
+
+class JobManager:
+    """
+    runner(progress=..., **params) -> DataFrame atau iterator DataFrame batch
+                                      (default: stream_scraper per JOB_BATCH_SIZE baris)
+    store(batches, job_id) -> (path, jumlah baris)   (opsional, menulis hasil ke store bersama)
+    """
+
+    def __init__(self, runner=None, store=None, max_jobs=MAX_JOBS):
+        if runner is None:
+            from scrapping.kalibrr_script import stream_scraper
+            runner = partial(stream_scraper, batch_size=JOB_BATCH_SIZE)
+        self.runner = runner
+        self.store = store
+        self._executor = ThreadPoolExecutor(max_workers=max_jobs, thread_name_prefix="scrape-job")
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, **params):
+        """Masukkan job ke antrean, kembalikan job id (langsung, tanpa menunggu)."""
+        job = ScrapeJob(params)
+        with self._lock:
+            self._prune()
+            self._jobs[job.id] = job
+        job.future = self._executor.submit(self._run, job)
+        return job.id
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def status(self, job_id):
+        """Snapshot status + progres job (None jika id tidak dikenal)."""
+        job = self.get(job_id)
+        return job.snapshot() if job is not None else None
+
+    def cancel(self, job_id):
+        """Job di antrean langsung dibatalkan; job yang berjalan berhenti di titik cek berikutnya."""
+        job = self.get(job_id)
+        if job is None or job.finished:
+            return False
+        job.progress.cancel()
+        if job.future is not None and job.future.cancel():
+            self._finish(job, CANCELLED)
+        return True
+
+    def jobs(self):
+        with self._lock:
+            return [job.snapshot() for job in self._jobs.values()]
+
+    def shutdown(self, wait=False):
+        with self._lock:
+            jobs = list(self._jobs.values())
+        for job in jobs:
+            job.progress.cancel()
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _run(self, job):
+        if job.progress.cancelled:
+            self._finish(job, CANCELLED)
+            return
+        job.status = RUNNING
+        try:
+            result = self.runner(progress=job.progress, **job.params)
+            batches = [result] if isinstance(result, pd.DataFrame) else result
+            if self.store is not None:
+                job.result_path, job.result_rows = self.store(batches, job.id)
+            else:
+                job.result_rows = sum(len(batch) for batch in batches)
+            self._finish(job, DONE)
+        except JobCancelled:
+            self._finish(job, CANCELLED)
+        except Exception as e:
+            print(f"❌ Job scraping {job.id} gagal: {e}")
+            job.error = str(e)
+            self._finish(job, FAILED)
+
+    def _finish(self, job, status):
+        job.finished_at = time.time()
+        job.progress.set_stage(status)
+        job.status = status
+
+    def _prune(self):
+        finished = sorted((j for j in self._jobs.values() if j.finished), key=lambda j: j.finished_at)
+        for job in finished[:max(len(finished) - MAX_FINISHED, 0)]:
+            del self._jobs[job.id]
@@ -1,51 +1,40 @@
 import time
-import json
-import re
+import hashlib
+from functools import partial
 import pandas as pd
-import requests
-import random
-from bs4 import BeautifulSoup
-from concurrent.futures import ThreadPoolExecutor
-from selenium import webdriver
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+from scrapping.skill_matcher import SkillMatcher
+from scrapping.raw_store import RawStore, RAW_STORE_PATH
+from scrapping.seen_index import SeenIndex, SEEN_INDEX_PATH, STALE_AFTER_HOURS
+from scrapping import http_client
+from scrapping.driver_pool import get_driver_pool
+from scrapping.listing_json import harvest_listing_json, canonical_education, FALLBACK_OUTCOMES, LISTING_NO_DATA
+from scrapping.detail_parser import parse_detail_html, PARSER_VERSION
+from scrapping.http_cache import HttpCache, HTTP_CACHE_PATH
+from scrapping.location import resolve_location
+from scrapping.categorizer import categorize_title
+from scrapping.job_manager import JobCancelled
 
 # --- 1. KONFIGURASI ---
 # --- 1. KONFIGURASI ---
 BASE_URL = "https://www.kalibrr.id/job-board/te/it/1"
 # TARGET_DATA and OUTPUT_FILE are now parameters/handled externally
-MAX_WORKERS = 2        # Thread worker
+MAX_WORKERS = 8        # Thread worker (laju request dibatasi per host oleh rate_limiter)
+STREAM_BATCH_SIZE = 25 # Baris per DataFrame batch di stream_scraper (dipakai job background)
+KALIBRR_HOST = "www.kalibrr.id"
+CARD_CSS = "div.k-bg-white.k-border-solid.k-rounded-lg"
+RENDER_TIMEOUT = 10    # Detik maksimal menunggu card baru muncul
+LISTING_MODE = "auto"  # "auto" = __NEXT_DATA__ lewat HTTP, Selenium hanya fallback
 
 # --- 2. KAMUS DATA & HELPER ---
 def get_provinsi(kota):
-    if pd.isna(kota): return "Lainnya"
-    kota = str(kota).title().strip()
-    kota_lower = kota.lower()   
-    
-    mapping = {
-        "Jakarta Raya": "DKI Jakarta", "Jakarta Selatan": "DKI Jakarta", "Jakarta Barat": "DKI Jakarta",
-        "Jakarta Pusat": "DKI Jakarta", "Jakarta Timur": "DKI Jakarta", "Jakarta Utara": "DKI Jakarta",
-        "Tangerang": "Banten", "Tangerang Selatan": "Banten", "Banten": "Banten",
-        "Bandung": "Jawa Barat", "Bogor": "Jawa Barat", "Depok": "Jawa Barat", "Bekasi": "Jawa Barat",
-        "Cikarang": "Jawa Barat", "Sukabumi": "Jawa Barat", "Karawang": "Jawa Barat", "Cirebon": "Jawa Barat",
-        "Semarang": "Jawa Tengah", "Solo": "Jawa Tengah", "Surakarta": "Jawa Tengah", "Magelang": "Jawa Tengah",
-        "Yogyakarta": "DI Yogyakarta", "Sleman": "DI Yogyakarta", "Bantul": "DI Yogyakarta",
-        "Surabaya": "Jawa Timur", "Malang": "Jawa Timur", "Sidoarjo": "Jawa Timur", "Gresik": "Jawa Timur",
-        "Kediri": "Jawa Timur", "Bali": "Bali", "Denpasar": "Bali"
-    }
-    
-    if kota in mapping: return mapping[kota]
-    
-    # Heuristic Search
-    if "jakarta" in kota_lower: return "DKI Jakarta"
-    if any(x in kota_lower for x in ["bandung", "bekasi", "bogor", "depok", "cimahi", "karawang"]): return "Jawa Barat"
-    if any(x in kota_lower for x in ["tangerang", "banten", "serang"]): return "Banten"
-    if any(x in kota_lower for x in ["semarang", "solo", "kudus"]): return "Jawa Tengah"
-    if any(x in kota_lower for x in ["surabaya", "malang", "sidoarjo", "gresik"]): return "Jawa Timur"
-    if any(x in kota_lower for x in ["yogyakarta", "jogja", "sleman"]): return "DI Yogyakarta"
-    
-    return "Lainnya"
+    # Lewat gazetteer + fuzzy match (di-memo per string), lihat scrapping/location.py
+    return resolve_location(kota).provinsi
 
 IT_SKILLS_DATABASE = {
     # --- PROGRAMMING LANGUAGES ---
@@ -103,49 +92,125 @@ SPECIAL_SKILLS = {"c": r"\bc\b", "go": r"\bgo\b", ".net": r"\.net", "c#": r"c#",
 def determine_category(title):
     """
     Menentukan kategori posisi berdasarkan judul pekerjaan
+    (aturan ada di scrapping/categorizer.py, hasil di-memo per judul)
     """
-    title_lower = str(title).lower()
-    
-    if any(x in title_lower for x in ['data', 'ai', 'learning', 'intelligence', 'analyst', 'scientist']):
-        return 'Data / AI'
-    elif any(x in title_lower for x in ['frontend', 'backend', 'fullstack', 'software', 'developer', 'programmer', 'web', 'mobile', 'android', 'ios']):
-        return 'Software Engineering'
-    elif any(x in title_lower for x in ['qa', 'tester', 'quality']):
-        return 'QA / Tester'
-    elif any(x in title_lower for x in ['devops', 'sre', 'cloud', 'system', 'network', 'infra', 'security', 'cyber']):
-        return 'DevOps / Infra'
-    elif any(x in title_lower for x in ['product', 'manager', 'scrum', 'project', 'owner']):
-        return 'Product / Project'
-    else:
-        return 'Other'
+    return categorize_title(title)
     
 # --- FUNGSI TEXT MINING SKILL ---
+# Satu regex gabungan untuk seluruh kamus (lihat scrapping/skill_matcher.py)
+SKILL_MATCHER = SkillMatcher(IT_SKILLS_DATABASE, SPECIAL_SKILLS)
+
 def extract_skills(text):
     if pd.isna(text): return []
-    text_lower = str(text).lower()
-    found_skills = set()
-    for skill in IT_SKILLS_DATABASE:
-        if len(skill) > 2 and skill not in SPECIAL_SKILLS:
-            if re.search(r"\b" + re.escape(skill) + r"\b", text_lower):
-                found_skills.add(skill)
-    for skill, pattern in SPECIAL_SKILLS.items():
-        if re.search(pattern, text_lower):
-            found_skills.add(skill)
-    return sorted(list(found_skills))
+    return SKILL_MATCHER.extract(text)
+
+def extract_skills_batch(texts, as_matrix=False, n_jobs=1):
+    """
+    Text mining skill untuk banyak deskripsi sekaligus (pandas Series / iterable).
+    - as_matrix=False -> list of list skill, urutan sama dengan input
+    - as_matrix=True  -> (scipy.sparse.csr_matrix boolean, daftar nama kolom skill)
+    n_jobs > 1 memakai process pool (berguna untuk korpus besar).
+    """
+    if as_matrix:
+        return SKILL_MATCHER.skill_matrix(texts, n_jobs=n_jobs)
+    return SKILL_MATCHER.extract_many(texts, n_jobs=n_jobs)
 
 # --- 3. TAHAP 1: HARVEST URL (Sama seperti sebelumnya) ---
-def harvest_data(target_count, search_query=None):
+# Mengembalikan [jumlah card, data card mulai index arguments[1]].
+# Tiap card: [href judul, judul, perusahaan, lokasi] atau null jika tidak ada judul.
+_NEW_CARDS_JS = """
+const cards = document.querySelectorAll(arguments[0]);
+const out = [];
+for (let i = arguments[1]; i < cards.length; i++) {
+    const card = cards[i];
+    const title = card.querySelector('a[itemprop="name"]');
+    if (!title) { out.push(null); continue; }
+    const comp = card.querySelector('a.k-text-subdued.k-font-bold');
+    const loc = card.querySelector('span.k-text-gray-500.k-block.k-pointer-events-none');
+    out.push([
+        title.getAttribute('href'),
+        title.textContent.trim(),
+        comp ? comp.textContent.trim() : null,
+        loc ? loc.textContent.trim() : null,
+    ]);
+}
+return [cards.length, out];
+"""
+
+def _count_cards(driver):
+    return len(driver.find_elements(By.CSS_SELECTOR, CARD_CSS))
+
+def _wait_for_more_cards(driver, previous_count, timeout=RENDER_TIMEOUT):
+    """Tunggu sampai jumlah card > previous_count. False jika timeout."""
+    try:
+        WebDriverWait(driver, timeout).until(lambda d: _count_cards(d) > previous_count)
+        return True
+    except TimeoutException:
+        return False
+
+def harvest_data(target_count, search_query=None, seen_index=None, stale_after_hours=STALE_AFTER_HOURS,
+                 listing_mode=LISTING_MODE, progress=None):
+    """
+    Kumpulkan card lowongan dari halaman listing.
+    Jika seen_index diberikan (mode incremental), link yang detailnya masih segar
+    dilewati, dan harvesting berhenti saat satu halaman hanya berisi link yang sudah dikenal.
+    listing_mode: "auto" (JSON dulu, Selenium hanya jika JSON gagal / tidak tersedia),
+    "json" atau "selenium".
+    progress (ScrapeProgress, opsional) diperbarui & dicek batal di setiap halaman.
+    """
     print(f"🚜 HARVESTER: Mencari minimal {target_count} link valid...")
-    
-    options = webdriver.ChromeOptions()
-    options.add_argument("--headless=new")           # Use new headless mode (lighter)
-    options.add_argument("--disable-gpu")            # Essential for servers
-    options.add_argument("--no-sandbox")             # Required for root/docker
-    options.add_argument("--disable-dev-shm-usage")  # Prevents shared memory crashes
-    options.add_argument("--disable-extensions")     # Save memory
-    options.add_argument("--disable-infobars")
-    driver = webdriver.Chrome(options=options)
-    
+    known_links = seen_index.fresh_links(stale_after_hours) if seen_index is not None else set()
+    harvested_items, seen_urls = [], set()
+    outcome = LISTING_NO_DATA
+
+    # Fast path: listing lewat HTTP + __NEXT_DATA__ (tanpa browser)
+    if listing_mode in ("auto", "json"):
+        try:
+            harvested_items, seen_urls, outcome = harvest_listing_json(target_count, search_query, known_links,
+                                                                       progress=progress)
+        except JobCancelled:
+            raise
+        except Exception as e:
+            print(f"⚠️ Listing JSON gagal: {e}")
+
+    # Fallback: Selenium hanya jika fast path gagal / tidak ada JSON. Berhenti karena
+    # listing habis atau (incremental) halaman penuh lowongan lama BUKAN alasan start Chrome.
+    remaining = target_count - len(harvested_items)
+    if progress is not None:
+        progress.check()
+    use_selenium = listing_mode == "selenium" or (listing_mode == "auto" and outcome in FALLBACK_OUTCOMES)
+    if use_selenium and remaining > 0:
+        if listing_mode == "auto":
+            print(f"   ↪️ Fallback Selenium untuk {remaining} data lagi (listing JSON: {outcome})...")
+        # Driver diambil dari pool (Chrome hangat, dipakai ulang antar harvest)
+        pool = get_driver_pool()
+        driver = pool.acquire()
+        stats = {"pages": 0}
+        broken = False
+        try:
+            more_items, more_urls = _harvest_with_driver(
+                driver, remaining, search_query, known_links, stats,
+                exclude_links={item["link"] for item in harvested_items},
+                progress=progress, harvested_before=len(harvested_items),
+            )
+        except JobCancelled:
+            raise
+        except Exception:
+            broken = True
+            raise
+        finally:
+            pool.release(driver, pages=max(1, stats["pages"]), broken=broken)
+        harvested_items += more_items
+        seen_urls |= more_urls
+
+    if seen_index is not None:
+        seen_index.mark_seen(seen_urls)
+    final_items = harvested_items[:target_count]
+    print(f"✅ HARVESTER SELESAI: {len(final_items)} data siap diproses detailnya.\n")
+    return final_items
+
+def _harvest_with_driver(driver, target_count, search_query, known_links, stats, exclude_links=frozenset(),
+                         progress=None, harvested_before=0):
     # Construct URL based on search
     if search_query:
         # Format: https://www.kalibrr.id/id-ID/home/i/it-and-software/te/{query}
@@ -158,42 +223,48 @@ def harvest_data(target_count, search_query=None):
         target_url = "https://www.kalibrr.id/job-board/te/it/1"
         print("   📂 Mode Default: List Lowongan IT")
 
+    # Semua interaksi yang memicu request ke Kalibrr minta token ke rate limiter,
+    # lalu menunggu card ter-render (bukan sleep tetap)
+    http_client.rate_limiter.acquire(KALIBRR_HOST)
     driver.get(target_url)
-    time.sleep(3)
+    stats["pages"] += 1
+    _wait_for_more_cards(driver, 0)
     
     harvested_items = []
     seen_urls = set()
     
+    card_offset = 0
+    
     while len(harvested_items) < target_count:
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        
-        # Cari Card Container
-        cards = soup.find_all("div", class_=lambda x: x and "k-bg-white" in x and "k-border-solid" in x and "k-rounded-lg" in x)
+        # Ambil HANYA card baru (index >= card_offset) lewat JS, tanpa parse ulang seluruh page_source
+        card_count, new_cards = driver.execute_script(_NEW_CARDS_JS, CARD_CSS, card_offset)
+        if card_count < card_offset:
+            # List di-render ulang dari awal (bukan append): scan ulang, duplikat tersaring seen_urls
+            card_count, new_cards = driver.execute_script(_NEW_CARDS_JS, CARD_CSS, 0)
+        card_offset = card_count
         
         added_this_round = 0
-        for card in cards:
+        known_this_round = 0
+        for card in new_cards:
             try:
-                title_tag = card.find("a", itemprop="name")
-                if not title_tag: continue
+                if not card: continue
+                href, posisi, perusahaan, lokasi = card
                 
-                href = title_tag['href']
-                posisi = title_tag.get_text(strip=True)
-                
-                if "/jobs/" in href and any(char.isdigit() for char in href):
+                if href and "/jobs/" in href and any(char.isdigit() for char in href):
                     full_url = f"https://www.kalibrr.id{href}" if href.startswith("/") else href
                     
-                    if full_url not in seen_urls:
-                        comp_tag = card.find("a", class_="k-text-subdued k-font-bold")
-                        perusahaan = comp_tag.get_text(strip=True) if comp_tag else "N/A"
-                        
-                        loc_tag = card.find("span", class_="k-text-gray-500 k-block k-pointer-events-none")
-                        lokasi = loc_tag.get_text(strip=True) if loc_tag else "Lokasi Lain"
-                        
+                    if full_url in exclude_links:
+                        # Sudah didapat lewat fast path JSON
+                        seen_urls.add(full_url)
+                    elif full_url in known_links and full_url not in seen_urls:
+                        seen_urls.add(full_url)
+                        known_this_round += 1
+                    elif full_url not in seen_urls:
                         item = {
                             "link": full_url,
                             "posisi": posisi,
-                            "perusahaan": perusahaan,
-                            "lokasi": lokasi
+                            "perusahaan": perusahaan or "N/A",
+                            "lokasi": lokasi or "Lokasi Lain"
                         }
                         
                         harvested_items.append(item)
@@ -202,155 +273,232 @@ def harvest_data(target_count, search_query=None):
             except Exception:
                 continue
         
-        print(f"   --> Total Data: {len(harvested_items)} (Baru: {added_this_round})")
+        print(f"   --> Total Data: {len(harvested_items)} (Baru: {added_this_round}, Sudah dikenal: {known_this_round})")
+        if progress is not None:
+            progress.set_harvested(harvested_before + len(harvested_items))
+            progress.check()
         
         if len(harvested_items) >= target_count:
             break
 
+        # Mode incremental: satu halaman penuh lowongan lama -> sisanya juga lama
+        if known_this_round > 0 and added_this_round == 0:
+            print("   [i] Halaman ini hanya berisi lowongan yang sudah dikenal. Stop.")
+            break
+
         try:
             # Coba cari tombol Load More
             load_more_btn = WebDriverWait(driver, 5).until(
                 EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Load more')]"))
             )
             driver.execute_script("arguments[0].scrollIntoView();", load_more_btn)
-            time.sleep(1)
+            before = _count_cards(driver)
+            http_client.rate_limiter.acquire(KALIBRR_HOST)
             load_more_btn.click()
-            time.sleep(2)
+            stats["pages"] += 1
+            _wait_for_more_cards(driver, before)
         except:
             # Jika tidak ada tombol Load More, mungkin pakai pagination tipe page number atau infinite scroll
             # Untuk search results Kalibrr, kadang tidak ada Load More, tapi pagination angka
             # Atau simply sudah habis
             print("⚠️ Load More tidak ditemukan atau habis. Mencoba scroll ke bawah...")
+            http_client.rate_limiter.acquire(KALIBRR_HOST)
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(3)
+            stats["pages"] += 1
             
             # Cek apakah ada data baru setelah scroll
-            new_soup = BeautifulSoup(driver.page_source, "html.parser")
-            new_cards = new_soup.find_all("div", class_=lambda x: x and "k-bg-white" in x and "k-border-solid" in x and "k-rounded-lg" in x)
-            if len(new_cards) <= len(cards):
+            if not _wait_for_more_cards(driver, card_offset):
                  print("   [!] Tidak ada data baru setelah scroll. Stop.")
                  break
             
-    driver.quit()
-    final_items = harvested_items[:target_count]
-    print(f"✅ HARVESTER SELESAI: {len(final_items)} data siap diproses detailnya.\n")
-    return final_items
+    return harvested_items, seen_urls
 
 # --- 4. TAHAP 2: PROCESSING (UPDATE HTML PARSING) ---
-def process_single_item(item):
+# parse_detail_html: jalur lean (lxml + __NEXT_DATA__ dari teks mentah), lihat scrapping/detail_parser.py
+
+def _fetch_parsed(url, cache=None):
+    """(status_code, parsed, etag) untuk satu URL, lewat HTTP cache jika ada."""
+    if cache is not None:
+        return cache.fetch(url, parse_detail_html, http_client.fetch, parser_version=PARSER_VERSION)
+    # Session keep-alive bersama + rate limiter per host (lihat http_client.py)
+    response = http_client.fetch(url)
+    if response.status_code != 200:
+        return response.status_code, None, None
+    return response.status_code, parse_detail_html(response.text), response.headers.get("ETag")
+
+def fetch_raw_document(item, cache=None):
+    """
+    Ambil halaman detail dan kembalikan data MENTAH (belum di-mining).
+    Field `ok` = True hanya jika halaman berhasil diambil & diparse,
+    hanya dokumen seperti ini yang disimpan ke raw store.
+    Jika `cache` (HttpCache) diberikan, halaman yang tidak berubah tidak diparse ulang.
+    """
     url = item['link']
+    raw = {
+        "link": url,
+        "perusahaan": item['perusahaan'],
+        "posisi": item['posisi'],
+        "lokasi": item['lokasi'],
+        "pendidikan": None,
+        "jenis": "Full Time",
+        "gaji_angka": None,
+        "deskripsi": "",
+        "fetched_at": time.time(),
+        "etag": None,
+        "content_hash": None,
+        "ok": False,
+    }
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Referer': 'https://www.google.com/'
-        }
-        time.sleep(random.uniform(0.5, 1.5))
-        
-        response = requests.get(url, headers=headers, timeout=15)
-        
-        # Default Data
-        perusahaan = item['perusahaan']
-        posisi = item['posisi']
-        kota_raw = item['lokasi']
-        gaji_angka = None
-        deskripsi_full = ""
-        pendidikan = "Tidak Disebutkan"
-        jenis = "Full Time"
-
-        if response.status_code == 200:
-            soup = BeautifulSoup(response.text, "html.parser")
-            
-            # 1. AMBIL DESKRIPSI & KUALIFIKASI (Untuk Skill Mining)
-            # Cari div itemprop="description" DAN itemprop="qualifications"
-            desc_div = soup.find("div", itemprop="description")
-            qual_div = soup.find("div", itemprop="qualifications")
-            
-            desc_text = desc_div.get_text(separator=" ", strip=True) if desc_div else ""
-            qual_text = qual_div.get_text(separator=" ", strip=True) if qual_div else ""
-            
-            # Gabungkan keduanya untuk text mining skill
-            deskripsi_full = f"{desc_text} {qual_text}"
-
-            # 2. AMBIL PENDIDIKAN (Dari tabel HTML <dl>)
-            # Cari <dt> dengan text "Persyaratan tingkat pendidikan"
-            # Note: Pakai lambda function di text=... agar case insensitive & partial match
-            dt_pendidikan = soup.find("dt", string=lambda t: t and ("pendidikan" in t.lower() or "education" in t.lower()))
-            
-            if dt_pendidikan:
-                # Ambil saudara selanjutnya (<dd>)
-                dd_pendidikan = dt_pendidikan.find_next_sibling("dd")
-                if dd_pendidikan:
-                    pendidikan = dd_pendidikan.get_text(strip=True)
-
-            # 3. AMBIL GAJI (Coba parsing dari JSON-LD jika ada, atau Next Data)
-            # HTML Kalibrr menyembunyikan gaji di UI ("Gaji Tidak Diumumkan"), tapi kadang ada di JSON
-            next_data = soup.find("script", id="__NEXT_DATA__")
-            if next_data:
-                try:
-                    data = json.loads(next_data.string)
-                    job_info = data.get('props', {}).get('pageProps', {}).get('job', {})
-                    min_sal = job_info.get('minimum_salary')
-                    max_sal = job_info.get('maximum_salary')
-                    if min_sal:
-                        gaji_angka = float(min_sal)
-                        if max_sal: gaji_angka = (gaji_angka + float(max_sal)) / 2
-                except: pass
-        
-        # --- FINAL CLEANING ---
-        skills_found = extract_skills(deskripsi_full)
-        provinsi = get_provinsi(kota_raw)
-        
-        kategori = determine_category(posisi)
-
-        return {
-            "Perusahaan": perusahaan,
-            "Posisi": posisi,
-            "kategori_posisi": kategori,
-            "kota": kota_raw,
-            "gaji_angka": gaji_angka,
-            "list_skill": str(skills_found),
-            "pendidikan": pendidikan,
-            "jenis": jenis,
-            "provinsi": provinsi,
-            "link": url
-        }
-        
+        if item.get("prefetched"):
+            # Data lengkap sudah ada dari listing JSON: tidak perlu request halaman detail
+            status_code, parsed, etag = 200, item["prefetched"], None
+        else:
+            status_code, parsed, etag = _fetch_parsed(url, cache)
+        if parsed is not None:
+            raw.update(parsed)
+            raw["etag"] = etag
+            raw["content_hash"] = hashlib.sha1(
+                f"{raw['deskripsi']}|{raw['pendidikan']}|{raw['gaji_angka']}".encode("utf-8")
+            ).hexdigest()
+            raw["ok"] = True
     except Exception as e:
         print(f"❌ Error {url}: {e}")
-        return {
-            "Perusahaan": item['perusahaan'],
-            "Posisi": item['posisi'],
-            "kategori_posisi": determine_category(item['posisi']),
-            "kota": item['lokasi'],
-            "gaji_angka": None,
-            "list_skill": "[]",
-            "pendidikan": "Tidak Disebutkan",
-            "jenis": "Full Time",
-            "provinsi": get_provinsi(item['lokasi']),
-            "link": url
-        }
+    return raw
+
+def build_record(raw, skills=None):
+    """
+    Turunkan satu baris dataset (format run_scraper) dari dokumen mentah.
+    Dipakai saat scraping maupun saat reprocessing dari raw store.
+    `skills` boleh diisi jika skill sudah dihitung secara batch.
+    """
+    # --- FINAL CLEANING ---
+    skills_found = extract_skills(raw.get("deskripsi") or "") if skills is None else skills
+    lokasi = resolve_location(raw["lokasi"])
+
+    return {
+        "Perusahaan": raw["perusahaan"],
+        "Posisi": raw["posisi"],
+        "kategori_posisi": determine_category(raw["posisi"]),
+        "kota": lokasi.kota,
+        "gaji_angka": raw.get("gaji_angka"),
+        "list_skill": str(skills_found),
+        # Label kanonik (sama untuk jalur JSON & DOM, termasuk dokumen lama di raw store)
+        "pendidikan": canonical_education(raw.get("pendidikan")) or "Tidak Disebutkan",
+        "jenis": raw.get("jenis") or "Full Time",
+        "provinsi": lokasi.provinsi,
+        "link": raw["link"]
+    }
+
+def process_single_item(item):
+    return build_record(fetch_raw_document(item))
 
 # --- 5. MAIN / EXPORTED FUNCTION ---
 
-def run_scraper(target_count=10, search_query=None):
+def _tracked_fetch(item, cache=None, progress=None):
+    # Cek batal sebelum request; item yang masih antre langsung gagal cepat
+    progress.check()
+    raw = fetch_raw_document(item, cache=cache)
+    progress.record_fetch(raw["ok"])
+    return raw
+
+def fetch_details(items, max_workers=MAX_WORKERS, cache=None, progress=None):
+    """
+    Ambil dokumen mentah untuk semua item dengan konkurensi terbatas.
+    Hasil dikembalikan sesuai urutan input.
+    Jika progress diberikan: counter fetched/failed diperbarui per item, dan
+    JobCancelled dilempar begitu job diminta berhenti.
+    """
+    if progress is not None:
+        progress.set_total(len(items))
+        worker = partial(_tracked_fetch, cache=cache, progress=progress)
+    else:
+        worker = partial(fetch_raw_document, cache=cache)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(worker, items))
+
+def iter_details(items, max_workers=MAX_WORKERS, cache=None, progress=None, max_pending=None):
+    """
+    Generator: dokumen mentah per item dalam urutan SELESAI (bukan urutan input),
+    jadi satu halaman lambat tidak menahan hasil di belakangnya.
+    Backpressure: paling banyak max_pending fetch antre/berjalan (default 2 x max_workers);
+    fetch berikutnya baru dikirim saat consumer mengambil hasil.
+    Jika generator ditutup lebih awal, fetch yang belum mulai dibatalkan.
+    """
+    if progress is not None:
+        progress.set_total(len(items))
+        worker = partial(_tracked_fetch, cache=cache, progress=progress)
+    else:
+        worker = partial(fetch_raw_document, cache=cache)
+    remaining = iter(items)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        pending = {executor.submit(worker, item) for item in islice(remaining, max_pending or 2 * max_workers)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+                for item in islice(remaining, 1):
+                    pending.add(executor.submit(worker, item))
+    finally:
+        # Tunggu hanya fetch yang sedang berjalan (cache dipakai worker), sisanya dibatalkan
+        executor.shutdown(wait=True, cancel_futures=True)
+
+def run_scraper(target_count=10, search_query=None, raw_store_path=RAW_STORE_PATH,
+                max_workers=MAX_WORKERS, incremental=False,
+                seen_index_path=SEEN_INDEX_PATH, stale_after_hours=STALE_AFTER_HOURS,
+                http_cache_path=HTTP_CACHE_PATH, offline=False, listing_mode=LISTING_MODE, progress=None):
     """
     Menjalankan scraper dengan target jumlah data tertentu.
     Mengembalikan pandas DataFrame.
+    Dokumen mentah disimpan ke raw store (raw_store_path=None untuk menonaktifkan).
+    max_workers = jumlah fetch detail yang berjalan bersamaan (thread pool).
+    incremental=True hanya mengambil detail lowongan yang baru / sudah lebih dari
+    stale_after_hours sejak terakhir diambil (berdasarkan seen index di disk).
+    Halaman detail melewati HTTP cache (http_cache_path=None untuk menonaktifkan);
+    offline=True memutar ulang detail dari cache tanpa request ke Kalibrr.
+    listing_mode menentukan cara harvest (lihat harvest_data).
+    progress (ScrapeProgress) dipakai job background (scrapping/job_manager.py):
+    progres harvested/fetched/failed dilaporkan, JobCancelled jika dibatalkan.
     """
     start_time = time.time()
-    items = harvest_data(target_count, search_query)
-    if not items:
-        return pd.DataFrame() # Return empty DataFrame if nothing found
+    seen_index = SeenIndex(seen_index_path) if seen_index_path else None
+    if progress is not None:
+        progress.set_stage("harvest")
+    try:
+        items = harvest_data(
+            target_count, search_query,
+            seen_index=seen_index if incremental else None,
+            stale_after_hours=stale_after_hours,
+            listing_mode=listing_mode,
+            progress=progress,
+        )
+        if progress is not None:
+            progress.set_harvested(len(items))
+            progress.set_stage("detail")
+        if not items:
+            return pd.DataFrame() # Return empty DataFrame if nothing found
 
-    print(f"🚀 Memproses detail untuk {len(items)} data...")
-    results = []
-    
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        futures = executor.map(process_single_item, items)
-        for i, res in enumerate(futures):
-            if res:
-                results.append(res)
-                if (i+1) % 5 == 0: print(f"   ...Selesai {i+1}")
+        print(f"🚀 Memproses detail untuk {len(items)} data...")
+        cache = HttpCache(http_cache_path, offline=offline) if http_cache_path else None
+        try:
+            raws = fetch_details(items, max_workers=max_workers, cache=cache, progress=progress)
+        finally:
+            if cache is not None:
+                print(f"   📦 HTTP cache: {cache.stats()}")
+                cache.close()
+        if seen_index is not None:
+            seen_index.mark_fetched([raw for raw in raws if raw["ok"]])
+    finally:
+        if seen_index is not None:
+            seen_index.close()
+
+    results = [build_record(raw) for raw in raws]
+    print(f"   ...Selesai {len(results)} ({time.time() - start_time:.1f} detik)")
+
+    if raw_store_path:
+        with RawStore(raw_store_path) as store:
+            saved = store.put_many([raw for raw in raws if raw["ok"]])
+        print(f"💾 {saved} dokumen mentah disimpan ke {raw_store_path}")
 
     if results:
         df = pd.DataFrame(results)
@@ -359,6 +507,90 @@ def run_scraper(target_count=10, search_query=None):
     else:
         return pd.DataFrame()
 
+def stream_scraper(target_count=10, search_query=None, raw_store_path=RAW_STORE_PATH,
+                   max_workers=MAX_WORKERS, incremental=False,
+                   seen_index_path=SEEN_INDEX_PATH, stale_after_hours=STALE_AFTER_HOURS,
+                   http_cache_path=HTTP_CACHE_PATH, offline=False, listing_mode=LISTING_MODE,
+                   batch_size=None, stop_after=None, max_pending=None, progress=None):
+    """
+    Versi streaming run_scraper (parameter sama). Generator yang menghasilkan baris
+    (dict format build_record) segera setelah detailnya selesai, dalam urutan selesai.
+    batch_size=N: hasilkan DataFrame per N baris (batch terakhir bisa lebih kecil).
+    stop_after=N: berhenti setelah N dokumen berhasil diambil; fetch sisanya dibatalkan.
+    max_pending: batas fetch yang antre/berjalan (backpressure, lihat iter_details).
+    Dokumen mentah & seen index ditulis per batch, jadi memori tetap terbatas
+    berapa pun target_count. Consumer boleh berhenti kapan saja (generator.close()).
+    """
+    start_time = time.time()
+    seen_index = SeenIndex(seen_index_path) if seen_index_path else None
+    store = RawStore(raw_store_path) if raw_store_path else None
+    cache = None
+    flush_every = batch_size or STREAM_BATCH_SIZE
+    pending_raws, batch = [], []
+    n_rows = n_ok = 0
+
+    def flush_raws():
+        good = [raw for raw in pending_raws if raw["ok"]]
+        if seen_index is not None:
+            seen_index.mark_fetched(good)
+        if store is not None:
+            store.put_many(good)
+        pending_raws.clear()
+
+    if progress is not None:
+        progress.set_stage("harvest")
+    try:
+        items = harvest_data(
+            target_count, search_query,
+            seen_index=seen_index if incremental else None,
+            stale_after_hours=stale_after_hours,
+            listing_mode=listing_mode,
+            progress=progress,
+        )
+        if progress is not None:
+            progress.set_harvested(len(items))
+            progress.set_stage("detail")
+        if not items:
+            return
+
+        print(f"🚀 [STREAM] Memproses detail untuk {len(items)} data...")
+        cache = HttpCache(http_cache_path, offline=offline) if http_cache_path else None
+        details = iter_details(items, max_workers=max_workers, cache=cache, progress=progress,
+                               max_pending=max_pending)
+        try:
+            for raw in details:
+                pending_raws.append(raw)
+                n_ok += raw["ok"]
+                record = build_record(raw)
+                n_rows += 1
+                if batch_size:
+                    batch.append(record)
+                    if len(batch) >= batch_size:
+                        yield pd.DataFrame(batch)
+                        batch = []
+                else:
+                    yield record
+                if len(pending_raws) >= flush_every:
+                    flush_raws()
+                if stop_after and n_ok >= stop_after:
+                    print(f"   ⏹️ {n_ok} data berhasil, berhenti lebih awal.")
+                    break
+        finally:
+            details.close()
+        if batch:
+            yield pd.DataFrame(batch)
+    finally:
+        if pending_raws:
+            flush_raws()
+        if cache is not None:
+            print(f"   📦 HTTP cache: {cache.stats()}")
+            cache.close()
+        if store is not None:
+            store.close()
+        if seen_index is not None:
+            seen_index.close()
+        print(f"   ...[STREAM] {n_rows} baris ({n_ok} berhasil) dalam {time.time() - start_time:.1f} detik")
+
 if __name__ == "__main__":
     # Test run direct execution
     df_result = run_scraper(5, search_query="python")
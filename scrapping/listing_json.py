@@ -0,0 +1,246 @@
+import json
+import re
+
+from bs4 import BeautifulSoup
+
+# --- LISTING TANPA BROWSER (__NEXT_DATA__) ---
+# Halaman Kalibrr dibangun dengan Next.js: data lowongan sudah ada di tag
+# <script id="__NEXT_DATA__"> sebagai JSON. Mode ini mengambil halaman listing
+# lewat HTTP biasa dan membaca semua field yang tersedia dari JSON tersebut
+# (judul, perusahaan, lokasi, gaji, pendidikan, deskripsi), tanpa Selenium.
+# Jika deskripsi ikut tersedia, halaman detail bahkan tidak perlu diambil.
+
+KALIBRR_BASE = "https://www.kalibrr.id"
+MAX_LISTING_PAGES = 30
+
+# Alasan harvest JSON berhenti. Hanya NO_DATA / HTTP_ERROR yang berarti fast path
+# tidak bisa dipakai (fallback Selenium); sisanya berhenti dengan sengaja.
+LISTING_TARGET = "target"          # target tercapai
+LISTING_KNOWN = "known"            # satu halaman penuh lowongan yang sudah dikenal (incremental)
+LISTING_EXHAUSTED = "exhausted"    # listing habis / tidak ada link baru
+LISTING_NO_DATA = "no_data"        # halaman tanpa __NEXT_DATA__ / daftar lowongan
+LISTING_HTTP_ERROR = "http_error"  # halaman listing gagal diambil
+FALLBACK_OUTCOMES = {LISTING_NO_DATA, LISTING_HTTP_ERROR}
+
+_NEXT_DATA_RE = re.compile(
+    r'<script[^>]*id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL | re.IGNORECASE
+)
+
+# Kode education_level Kalibrr -> label yang dipakai di dataset (sama dengan CSV utama:
+# "S1", "Diploma", ...). Teks tampilan halaman detail ("Sarjana / S1", "Diploma / D3")
+# dipetakan ke label yang sama lewat EDUCATION_PATTERNS (lihat canonical_education).
+EDUCATION_LEVELS = {
+    100: "SD",
+    200: "SMA/SMK",
+    300: "Diploma",
+    400: "S1",
+    500: "S2",
+    600: "S3",
+}
+# Urutan penting: jenjang tertinggi dicek dulu
+EDUCATION_PATTERNS = [
+    ("S3", re.compile(r"\b(s3|doktor\w*|doctor\w*|ph\.?d)\b", re.IGNORECASE)),
+    ("S2", re.compile(r"\b(s2|magister|master\w*|pascasarjana)\b", re.IGNORECASE)),
+    ("S1", re.compile(r"\b(s1|sarjana|bachelor\w*|d4)\b", re.IGNORECASE)),
+    ("Diploma", re.compile(r"\b(diploma|d1|d2|d3|associate)\b", re.IGNORECASE)),
+    ("SMA/SMK", re.compile(r"\b(sma|smk|stm|slta|high school|sekolah menengah atas)\b", re.IGNORECASE)),
+    ("SD", re.compile(r"\b(sd|smp|sltp|sekolah dasar|elementary)\b", re.IGNORECASE)),
+]
+
+
+def canonical_education(value):
+    """
+    Label pendidikan kanonik dari kode education_level (int / string angka) atau
+    teks tampilan halaman. None jika kosong / kode tidak dikenal; teks yang tidak
+    cocok pola apa pun dikembalikan apa adanya (dirapikan).
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return EDUCATION_LEVELS.get(int(value)) if value == value else None
+    text = " ".join(str(value).split())
+    if not text:
+        return None
+    if text.isdigit():
+        return EDUCATION_LEVELS.get(int(text))
+    for label, pattern in EDUCATION_PATTERNS:
+        if pattern.search(text):
+            return label
+    return text
+
+
+def extract_next_data(html):
+    """Ambil JSON __NEXT_DATA__ langsung dari teks HTML (tanpa parsing DOM)."""
+    match = _NEXT_DATA_RE.search(html)
+    if not match:
+        return None
+    try:
+        return json.loads(match.group(1))
+    except ValueError:
+        return None
+
+
+def _looks_like_job(obj):
+    return isinstance(obj, dict) and "id" in obj and "name" in obj and (
+        "company" in obj or "company_name" in obj
+    )
+
+
+def find_jobs(data):
+    """Cari list lowongan di mana pun letaknya di dalam JSON (struktur props bisa berubah)."""
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            if node and all(_looks_like_job(x) for x in node):
+                return node
+            stack.extend(node)
+        elif isinstance(node, dict):
+            stack.extend(node.values())
+    return []
+
+
+def _html_to_text(fragment):
+    if not fragment:
+        return ""
+    return BeautifulSoup(fragment, "lxml").get_text(separator=" ", strip=True)
+
+
+def _salary(job):
+    min_sal = job.get("minimum_salary")
+    max_sal = job.get("maximum_salary")
+    if not min_sal:
+        return None
+    try:
+        gaji = float(min_sal)
+        if max_sal:
+            gaji = (gaji + float(max_sal)) / 2
+        return gaji
+    except (TypeError, ValueError):
+        return None
+
+
+def _education(job):
+    return canonical_education(job.get("education_level"))
+
+
+def job_to_item(job):
+    """
+    Konversi satu lowongan JSON ke format item harvest
+    ({link, posisi, perusahaan, lokasi}) + field "prefetched" jika tersedia.
+    """
+    company = job.get("company") if isinstance(job.get("company"), dict) else {}
+    company_name = job.get("company_name") or company.get("name") or "N/A"
+    company_code = company.get("code") or job.get("company_code")
+
+    link = job.get("url") or job.get("link")
+    if not link and company_code:
+        slug = job.get("slug") or ""
+        link = f"{KALIBRR_BASE}/c/{company_code}/jobs/{job['id']}/{slug}".rstrip("/")
+    if not link:
+        return None
+    if link.startswith("/"):
+        link = f"{KALIBRR_BASE}{link}"
+
+    location = job.get("google_location") or {}
+    address = location.get("address_components") or {}
+    lokasi = address.get("city") or address.get("region") or job.get("location") or "Lokasi Lain"
+
+    item = {
+        "link": link,
+        "posisi": str(job["name"]).strip(),
+        "perusahaan": company_name,
+        "lokasi": lokasi,
+    }
+
+    description = _html_to_text(job.get("description"))
+    qualifications = _html_to_text(job.get("qualifications"))
+    if description or qualifications:
+        item["prefetched"] = {
+            "deskripsi": f"{description} {qualifications}",
+            "pendidikan": _education(job),
+            "gaji_angka": _salary(job),
+            "jenis": job.get("tenure") or "Full Time",
+        }
+    return item
+
+
+def parse_listing_html(html):
+    """Semua item lowongan dari satu halaman listing (list kosong jika JSON tidak ada)."""
+    return parse_listing_page(html) or []
+
+
+def parse_listing_page(html):
+    """Seperti parse_listing_html, tetapi None jika halaman tidak punya __NEXT_DATA__."""
+    data = extract_next_data(html)
+    if data is None:
+        return None
+    items = []
+    for job in find_jobs(data):
+        item = job_to_item(job)
+        if item is not None:
+            items.append(item)
+    return items
+
+
+def listing_url(search_query=None, page=1):
+    if search_query:
+        formatted_query = search_query.replace(" ", "-")
+        url = f"{KALIBRR_BASE}/id-ID/home/i/it-and-software/te/{formatted_query}"
+        return url if page == 1 else f"{url}?page={page}"
+    return f"{KALIBRR_BASE}/job-board/te/it/{page}"
+
+
+def harvest_listing_json(target_count, search_query=None, known_links=frozenset(), fetch=None, url_for_page=listing_url,
+                         progress=None):
+    """
+    Harvest lewat HTTP + __NEXT_DATA__. Mengembalikan (items, seen_urls, outcome).
+    Berhenti jika target tercapai, halaman tidak berisi lowongan, tidak ada link baru,
+    atau (mode incremental) satu halaman penuh lowongan yang sudah dikenal.
+    outcome = salah satu LISTING_* (alasan berhenti), dipakai pemanggil untuk
+    memutuskan perlu fallback Selenium atau tidak (lihat FALLBACK_OUTCOMES).
+    progress (ScrapeProgress, opsional) diperbarui & dicek batal per halaman.
+    """
+    if fetch is None:
+        from scrapping.http_client import fetch
+
+    harvested_items = []
+    seen_urls = set()
+    outcome = LISTING_EXHAUSTED
+    for page in range(1, MAX_LISTING_PAGES + 1):
+        response = fetch(url_for_page(search_query, page))
+        if response.status_code != 200:
+            # 404 setelah halaman pertama = halaman di luar listing
+            outcome = LISTING_EXHAUSTED if page > 1 and response.status_code == 404 else LISTING_HTTP_ERROR
+            break
+        page_items = parse_listing_page(response.text)
+        if page_items is None or (page == 1 and not page_items):
+            # Tanpa JSON, atau struktur JSON berubah sehingga daftar lowongan tidak ditemukan
+            outcome = LISTING_NO_DATA
+            break
+        if not page_items:
+            outcome = LISTING_EXHAUSTED
+            break
+
+        added, known = 0, 0
+        for item in page_items:
+            if item["link"] in seen_urls:
+                continue
+            seen_urls.add(item["link"])
+            if item["link"] in known_links:
+                known += 1
+                continue
+            harvested_items.append(item)
+            added += 1
+
+        print(f"   --> [JSON] Halaman {page}: Total Data: {len(harvested_items)} (Baru: {added}, Sudah dikenal: {known})")
+        if progress is not None:
+            progress.set_harvested(min(len(harvested_items), target_count))
+            progress.check()
+        if len(harvested_items) >= target_count:
+            outcome = LISTING_TARGET
+            break
+        if added == 0:
+            outcome = LISTING_KNOWN if known else LISTING_EXHAUSTED
+            break
+    return harvested_items[:target_count], seen_urls, outcome
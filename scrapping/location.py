@@ -0,0 +1,247 @@
+import difflib
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+import pandas as pd
+
+# --- NORMALISASI LOKASI (GAZETTEER + FUZZY) ---
+# Lokasi mentah Kalibrr bentuknya macam-macam: "Jakarta Raya(Hibrid)",
+# "Tangerang District", "South Tangerang", "Kabupaten Bandung", "Kebayoran Lama".
+# Modul ini mengubahnya ke nama kanonik di GAZETTEER (kota/kabupaten di Jawa + Bali)
+# lengkap dengan provinsi dan koordinat:
+# 1. Bersihkan token  : buang "(Hibrid)", ", Indonesia", terjemahkan South/North/...,
+#                       "X District/Regency" -> "Kabupaten X", "Kota X" -> "X"
+# 2. Cocokkan persis  : nama kanonik atau ALIAS (kecamatan, ejaan lain)
+# 3. Cocokkan token   : nama gazetteer terpanjang yang muncul utuh di teks
+# 4. Fuzzy (difflib)  : untuk salah ketik, cutoff FUZZY_CUTOFF
+# Hasil di-memo per string mentah (lru_cache), jadi kolom berisi ribuan baris
+# cukup me-resolve nilai uniknya saja (lihat normalize_locations).
+
+Location = namedtuple("Location", ["kota", "provinsi", "lat", "lon"])
+
+UNKNOWN_KOTA = "Lokasi Lain"
+UNKNOWN_PROVINSI = "Lainnya"
+FUZZY_CUTOFF = 0.85
+MEMO_SIZE = 4096
+
+# nama kanonik -> (provinsi, lat, lon)
+GAZETTEER = {
+    # DKI Jakarta
+    "Jakarta Raya": ("DKI Jakarta", -6.2088, 106.8456),
+    "Jakarta Selatan": ("DKI Jakarta", -6.2615, 106.8106),
+    "Jakarta Barat": ("DKI Jakarta", -6.1674, 106.7637),
+    "Jakarta Pusat": ("DKI Jakarta", -6.1751, 106.8650),
+    "Jakarta Timur": ("DKI Jakarta", -6.2250, 106.9004),
+    "Jakarta Utara": ("DKI Jakarta", -6.1384, 106.8645),
+    # Banten
+    "Tangerang": ("Banten", -6.1731, 106.6300),
+    "Tangerang Selatan": ("Banten", -6.2886, 106.7179),
+    "Kabupaten Tangerang": ("Banten", -6.1870, 106.4880),
+    "Serang": ("Banten", -6.1200, 106.1503),
+    "Cilegon": ("Banten", -6.0025, 106.0111),
+    "Banten": ("Banten", -6.4058, 106.0640),
+    # Jawa Barat
+    "Bandung": ("Jawa Barat", -6.9175, 107.6191),
+    "Kabupaten Bandung": ("Jawa Barat", -7.0251, 107.5197),
+    "Bandung Barat": ("Jawa Barat", -6.8652, 107.4920),
+    "Cimahi": ("Jawa Barat", -6.8722, 107.5425),
+    "Bekasi": ("Jawa Barat", -6.2383, 106.9756),
+    "Kabupaten Bekasi": ("Jawa Barat", -6.2615, 107.1526),
+    "Cikarang": ("Jawa Barat", -6.2615, 107.1526),
+    "Bogor": ("Jawa Barat", -6.5971, 106.8060),
+    "Kabupaten Bogor": ("Jawa Barat", -6.4817, 106.8540),
+    "Depok": ("Jawa Barat", -6.4025, 106.7942),
+    "Karawang": ("Jawa Barat", -6.3227, 107.3376),
+    "Purwakarta": ("Jawa Barat", -6.5569, 107.4431),
+    "Sukabumi": ("Jawa Barat", -6.9277, 106.9300),
+    "Cirebon": ("Jawa Barat", -6.7320, 108.5523),
+    "Tasikmalaya": ("Jawa Barat", -7.3274, 108.2207),
+    "Jawa Barat": ("Jawa Barat", -6.9147, 107.6098),
+    # Jawa Tengah
+    "Semarang": ("Jawa Tengah", -6.9667, 110.4167),
+    "Kabupaten Semarang": ("Jawa Tengah", -7.1386, 110.4057),
+    "Surakarta": ("Jawa Tengah", -7.5755, 110.8243),
+    "Karanganyar": ("Jawa Tengah", -7.5961, 110.9508),
+    "Magelang": ("Jawa Tengah", -7.4797, 110.2177),
+    "Kudus": ("Jawa Tengah", -6.8048, 110.8405),
+    "Pekalongan": ("Jawa Tengah", -6.8886, 109.6753),
+    "Tegal": ("Jawa Tengah", -6.8694, 109.1402),
+    "Purwokerto": ("Jawa Tengah", -7.4245, 109.2302),
+    "Jawa Tengah": ("Jawa Tengah", -7.1510, 110.1403),
+    # DI Yogyakarta
+    "Yogyakarta": ("DI Yogyakarta", -7.7956, 110.3695),
+    "Sleman": ("DI Yogyakarta", -7.7128, 110.3541),
+    "Bantul": ("DI Yogyakarta", -7.8881, 110.3289),
+    # Jawa Timur
+    "Surabaya": ("Jawa Timur", -7.2575, 112.7521),
+    "Sidoarjo": ("Jawa Timur", -7.4478, 112.7183),
+    "Gresik": ("Jawa Timur", -7.1539, 112.6561),
+    "Malang": ("Jawa Timur", -7.9666, 112.6326),
+    "Kabupaten Malang": ("Jawa Timur", -8.1300, 112.5700),
+    "Mojokerto": ("Jawa Timur", -7.4705, 112.4401),
+    "Kediri": ("Jawa Timur", -7.8480, 112.0178),
+    "Blitar": ("Jawa Timur", -8.0955, 112.1609),
+    "Jember": ("Jawa Timur", -8.1724, 113.7005),
+    "Madiun": ("Jawa Timur", -7.6298, 111.5239),
+    "Jawa Timur": ("Jawa Timur", -7.5360, 112.2384),
+    # Bali
+    "Denpasar": ("Bali", -8.6705, 115.2126),
+    "Bali": ("Bali", -8.4095, 115.1889),
+    # Titik tengah peta untuk lokasi yang tidak dikenal
+    UNKNOWN_KOTA: (UNKNOWN_PROVINSI, -7.35, 110.00),
+}
+
+# alias (huruf kecil, sudah dibersihkan) -> nama kanonik
+ALIASES = {
+    "dki jakarta": "Jakarta Raya", "jakarta": "Jakarta Raya", "greater jakarta": "Jakarta Raya",
+    "di yogyakarta": "Yogyakarta", "daerah istimewa yogyakarta": "Yogyakarta",
+    "jogja": "Yogyakarta", "jogjakarta": "Yogyakarta", "yogya": "Yogyakarta",
+    "jakarta tengah": "Jakarta Pusat", "solo": "Surakarta",
+    "java barat": "Jawa Barat", "java tengah": "Jawa Tengah", "java timur": "Jawa Timur",
+    "kabupaten bandung barat": "Bandung Barat",
+    "bekasi barat": "Bekasi", "bekasi timur": "Bekasi", "bekasi utara": "Bekasi", "bekasi selatan": "Bekasi",
+    # Kecamatan yang sering muncul sebagai lokasi
+    "kalideres": "Jakarta Barat", "cengkareng": "Jakarta Barat", "grogol petamburan": "Jakarta Barat",
+    "kebon jeruk": "Jakarta Barat", "palmerah": "Jakarta Barat",
+    "kebayoran lama": "Jakarta Selatan", "kebayoran baru": "Jakarta Selatan", "setiabudi": "Jakarta Selatan",
+    "mampang prapatan": "Jakarta Selatan", "pancoran": "Jakarta Selatan", "tebet": "Jakarta Selatan",
+    "cilandak": "Jakarta Selatan", "pasar minggu": "Jakarta Selatan",
+    "kemayoran": "Jakarta Pusat", "tanah abang": "Jakarta Pusat", "menteng": "Jakarta Pusat",
+    "gambir": "Jakarta Pusat", "sawah besar": "Jakarta Pusat",
+    "kelapa gading": "Jakarta Utara", "penjaringan": "Jakarta Utara", "tanjung priok": "Jakarta Utara",
+    "cakung": "Jakarta Timur", "pulo gadung": "Jakarta Timur", "jatinegara": "Jakarta Timur",
+    "serpong": "Tangerang Selatan", "bsd": "Tangerang Selatan", "ciputat": "Tangerang Selatan",
+    "pamulang": "Tangerang Selatan", "karawaci": "Tangerang",
+    "tegalsari": "Surabaya", "rungkut": "Surabaya", "wonokromo": "Surabaya",
+}
+
+_DIRECTIONS = {"south": "selatan", "north": "utara", "west": "barat", "east": "timur", "central": "tengah"}
+_REGENCY_WORDS = ("district", "regency", "kabupaten", "kab.", "kab")
+_CITY_WORDS = ("kota", "city", "kotamadya")
+
+_PARENS_RE = re.compile(r"\([^)]*\)?")
+_SPACES_RE = re.compile(r"\s+")
+_JUNK_RE = re.compile(r"[^a-z0-9.\s-]")
+
+_LOOKUP = {name.lower(): name for name in GAZETTEER}
+_LOOKUP.update(ALIASES)
+# Kunci untuk pencarian token, terpanjang dulu ("jakarta selatan" sebelum "jakarta")
+_TOKEN_KEYS = sorted(_LOOKUP, key=len, reverse=True)
+_TOKEN_RES = [(re.compile(rf"\b{re.escape(key)}\b"), key) for key in _TOKEN_KEYS]
+
+
+def clean_location(raw):
+    """Bersihkan string lokasi mentah -> bentuk huruf kecil yang siap dicocokkan."""
+    text = _PARENS_RE.sub(" ", str(raw).lower())
+    text = text.replace("indonesia", " ").replace("_", " ")
+    text = _JUNK_RE.sub(" ", text)
+    words = _SPACES_RE.sub(" ", text).strip().split(" ")
+    words = [w for w in words if w]
+
+    regency = False
+    if words and words[0] in _REGENCY_WORDS:
+        regency, words = True, words[1:]
+    if words and words[-1] in _REGENCY_WORDS:
+        regency, words = True, words[:-1]
+    if words and words[0] in _CITY_WORDS:
+        words = words[1:]
+    if words and words[-1] in _CITY_WORDS:
+        words = words[:-1]
+    # "South Tangerang" -> "tangerang selatan"
+    if len(words) > 1 and words[0] in _DIRECTIONS:
+        words = words[1:] + [_DIRECTIONS[words[0]]]
+
+    cleaned = " ".join(words)
+    return f"kabupaten {cleaned}" if regency and cleaned else cleaned
+
+
+def _match(key):
+    if not key:
+        return None
+    if key in _LOOKUP:
+        return _LOOKUP[key]
+    # "kabupaten x" yang tidak ada di gazetteer -> kota x
+    if key.startswith("kabupaten "):
+        found = _match(key[len("kabupaten "):])
+        if found:
+            return found
+    for pattern, token_key in _TOKEN_RES:
+        if pattern.search(key):
+            return _LOOKUP[token_key]
+    close = difflib.get_close_matches(key, _TOKEN_KEYS, n=1, cutoff=FUZZY_CUTOFF)
+    return _LOOKUP[close[0]] if close else None
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def resolve_location(raw):
+    """
+    String lokasi mentah -> Location(kota, provinsi, lat, lon).
+    Lokasi di luar gazetteer tetap disimpan namanya (title case) dengan provinsi "Lainnya"
+    dan koordinat None, supaya informasinya tidak hilang.
+    """
+    if raw is None or (isinstance(raw, float) and raw != raw) or not str(raw).strip():
+        return Location(UNKNOWN_KOTA, *GAZETTEER[UNKNOWN_KOTA])
+
+    # "Kebayoran Lama, Jakarta Selatan" -> coba bagian yang paling spesifik dulu
+    for part in str(raw).split(","):
+        kota = _match(clean_location(part))
+        if kota:
+            return Location(kota, *GAZETTEER[kota])
+
+    fallback = _PARENS_RE.sub(" ", str(raw).split(",")[0])
+    fallback = _SPACES_RE.sub(" ", fallback).strip().title() or UNKNOWN_KOTA
+    if fallback == UNKNOWN_KOTA:
+        return Location(UNKNOWN_KOTA, *GAZETTEER[UNKNOWN_KOTA])
+    return Location(fallback, UNKNOWN_PROVINSI, None, None)
+
+
+def normalize_locations(values):
+    """
+    Versi vektor untuk satu kolom lokasi (Series): resolve hanya nilai unik
+    (atau kategori, jika kolomnya categorical), lalu disebar ke semua baris.
+    Mengembalikan DataFrame [kota, provinsi, lat, lon] dengan index yang sama.
+    """
+    values = pd.Series(values)
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes = values.cat.codes.to_numpy()
+        uniques = values.cat.categories
+    else:
+        codes, uniques = pd.factorize(values, use_na_sentinel=True)
+
+    table = pd.DataFrame(
+        [resolve_location(u) for u in uniques] + [resolve_location(None)],
+        columns=Location._fields,
+    )
+    # kode -1 (NaN) menunjuk ke baris terakhir = lokasi tidak dikenal
+    result = table.iloc[codes].reset_index(drop=True)
+    result.index = values.index
+    result["lat"] = pd.to_numeric(result["lat"])
+    result["lon"] = pd.to_numeric(result["lon"])
+    return result
+
+
+def coordinates_for(names):
+    """{nama: [lat, lon]} untuk nama-nama yang berhasil di-resolve ke koordinat."""
+    coords = {}
+    for name in names:
+        loc = resolve_location(name)
+        if loc.lat is not None:
+            coords[name] = [loc.lat, loc.lon]
+    return coords
+
+
+if __name__ == "__main__":
+    # python -m scrapping.location  -> cek hasil normalisasi pada dataset utama
+    import time
+
+    df = pd.read_csv("./data/data_loker_clean.csv")
+    start_time = time.time()
+    result = normalize_locations(df["kota"])
+    elapsed = time.time() - start_time
+
+    pairs = pd.DataFrame({"mentah": df["kota"], "kota": result["kota"], "provinsi": result["provinsi"]})
+    print(pairs.value_counts().reset_index(name="jumlah").to_string(index=False))
+    tanpa_koordinat = result["lat"].isna().sum()
+    print(f"\n✅ {len(df)} baris, {df['kota'].nunique()} nilai unik -> {result['kota'].nunique()} kota kanonik "
+          f"({elapsed * 1000:.1f} ms, tanpa koordinat: {tanpa_koordinat})")
@@ -0,0 +1,113 @@
+import random
+import threading
+import time
+
+# --- RATE LIMITER (TOKEN BUCKET + ADAPTIVE BACKOFF) ---
+# Menggantikan time.sleep tetap / acak di scraper. Semua request ke Kalibrr
+# (requests maupun Selenium) meminta "token" ke sini dulu:
+# - token bucket per host: rata-rata `rate` request/detik, boleh burst sampai `burst`
+# - saat server membalas 429/5xx: semua worker ke host itu ditahan selama
+#   exponential backoff + jitter (atau Retry-After), dan rate diturunkan setengah
+# - setiap respon sukses menaikkan rate lagi sedikit demi sedikit (AIMD)
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Token bucket thread-safe. acquire() memblok sampai ada token."""
+
+    def __init__(self, rate, burst):
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def set_rate(self, rate):
+        """Ganti rate: token sampai saat ini dihitung dulu dengan rate lama (di bawah lock bucket)."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = float(rate)
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+
+
+class RateLimiter:
+    """
+    Penjadwal request per host. Pakai acquire(host) sebelum request, lalu
+    laporkan hasilnya dengan on_success(host) atau on_error(host, attempt, retry_after).
+    """
+
+    def __init__(self, rate=2.0, burst=4, min_rate=0.2, base_backoff=1.0, max_backoff=60.0):
+        self.target_rate = float(rate)
+        self.burst = burst
+        self.min_rate = float(min_rate)
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._buckets = {}
+        self._blocked_until = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, host):
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.target_rate, self.burst)
+            return bucket
+
+    def acquire(self, host):
+        """Tunggu sampai host tidak dalam masa backoff DAN ada token tersedia."""
+        while True:
+            with self._lock:
+                delay = self._blocked_until.get(host, 0) - time.monotonic()
+            if delay <= 0:
+                break
+            time.sleep(delay)
+        self._bucket(host).acquire()
+
+    def backoff_delay(self, attempt, retry_after=None):
+        """Exponential backoff dengan full jitter; Retry-After dari server dihormati."""
+        delay = random.uniform(0, min(self.max_backoff, self.base_backoff * (2 ** attempt)))
+        if retry_after is not None:
+            delay = max(delay, min(self.max_backoff, retry_after))
+        return delay
+
+    def on_error(self, host, attempt, retry_after=None):
+        """Server menolak / error: tahan semua request ke host ini dan turunkan rate."""
+        delay = self.backoff_delay(attempt, retry_after)
+        bucket = self._bucket(host)
+        with self._lock:
+            self._blocked_until[host] = max(self._blocked_until.get(host, 0), time.monotonic() + delay)
+            bucket.set_rate(max(self.min_rate, bucket.rate / 2))
+        return delay
+
+    def on_success(self, host):
+        """Naikkan rate kembali pelan-pelan menuju target (additive increase)."""
+        bucket = self._bucket(host)
+        with self._lock:
+            if bucket.rate < self.target_rate:
+                bucket.set_rate(min(self.target_rate, bucket.rate + 0.1 * self.target_rate))
+
+    def current_rate(self, host):
+        return self._bucket(host).rate
+
+
+def parse_retry_after(value):
+    """Header Retry-After dalam detik (format tanggal HTTP diabaikan)."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,131 @@
+import sqlite3
+import time
+import zlib
+
+# --- RAW DOCUMENT STORE ---
+# Menyimpan teks mentah halaman detail Kalibrr (deskripsi + kualifikasi, pendidikan,
+# lokasi, gaji) per `link`, supaya list_skill / kategori_posisi / provinsi / pendidikan
+# bisa dihitung ulang secara offline tanpa scraping ulang.
+# Format: SQLite satu file, kolom deskripsi dikompres zlib.
+
+RAW_STORE_PATH = "./data/raw_kalibrr.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS raw_jobs (
+    link        TEXT PRIMARY KEY,
+    perusahaan  TEXT,
+    posisi      TEXT,
+    lokasi      TEXT,
+    pendidikan  TEXT,
+    jenis       TEXT,
+    gaji_angka  REAL,
+    deskripsi   BLOB,
+    fetched_at  REAL
+)
+"""
+
+_COLUMNS = ["link", "perusahaan", "posisi", "lokasi", "pendidikan", "jenis", "gaji_angka", "deskripsi", "fetched_at"]
+
+
+class RawStore:
+    """
+    Penyimpanan dokumen mentah berbasis SQLite, key = link lowongan.
+    Tulis dari satu thread saja (run_scraper menulis setelah fetch selesai).
+    """
+
+    def __init__(self, path=RAW_STORE_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(_SCHEMA)
+        self.conn.commit()
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM raw_jobs").fetchone()[0]
+
+    def __contains__(self, link):
+        return self.conn.execute("SELECT 1 FROM raw_jobs WHERE link = ?", (link,)).fetchone() is not None
+
+    def put_many(self, raws):
+        """Upsert list dokumen mentah (dict hasil fetch_raw_document)."""
+        rows = [
+            (
+                raw["link"], raw.get("perusahaan"), raw.get("posisi"), raw.get("lokasi"),
+                raw.get("pendidikan"), raw.get("jenis"), raw.get("gaji_angka"),
+                zlib.compress((raw.get("deskripsi") or "").encode("utf-8")),
+                raw.get("fetched_at") or time.time(),
+            )
+            for raw in raws
+        ]
+        self.conn.executemany(
+            f"INSERT OR REPLACE INTO raw_jobs ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})",
+            rows,
+        )
+        self.conn.commit()
+        return len(rows)
+
+    def put(self, raw):
+        return self.put_many([raw])
+
+    def get(self, link):
+        row = self.conn.execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM raw_jobs WHERE link = ?", (link,)
+        ).fetchone()
+        return _row_to_raw(row) if row else None
+
+    def iter_raw(self, batch_size=1000):
+        """Generator semua dokumen mentah (dibaca per batch agar memori tetap kecil)."""
+        cursor = self.conn.execute(f"SELECT {', '.join(_COLUMNS)} FROM raw_jobs ORDER BY link")
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            for row in rows:
+                yield _row_to_raw(row)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _row_to_raw(row):
+    raw = dict(zip(_COLUMNS, row))
+    raw["deskripsi"] = zlib.decompress(raw["deskripsi"]).decode("utf-8") if raw["deskripsi"] else ""
+    return raw
+
+
+# --- REPROCESSING ---
+def reprocess(path=RAW_STORE_PATH, n_jobs=1):
+    """
+    Menghitung ulang list_skill, kategori_posisi, provinsi dan pendidikan dari
+    dokumen mentah yang tersimpan. Mengembalikan DataFrame dengan format yang
+    sama seperti run_scraper().
+    """
+    import pandas as pd
+    from scrapping.kalibrr_script import build_record, extract_skills_batch
+
+    with RawStore(path) as store:
+        raws = list(store.iter_raw())
+    if not raws:
+        return pd.DataFrame()
+
+    # Skill mining dalam satu batch, sisanya per record (murah)
+    all_skills = extract_skills_batch([raw["deskripsi"] for raw in raws], n_jobs=n_jobs)
+    records = [build_record(raw, skills=skills) for raw, skills in zip(raws, all_skills)]
+    return pd.DataFrame(records)
+
+
+if __name__ == "__main__":
+    # Contoh: python -m scrapping.raw_store data/data_reprocessed.csv
+    import sys
+
+    start_time = time.time()
+    df_result = reprocess()
+    print(f"♻️  {len(df_result)} data diproses ulang dalam {time.time() - start_time:.2f} detik.")
+    if len(sys.argv) > 1 and not df_result.empty:
+        df_result.to_csv(sys.argv[1], index=False)
+        print(f"💾 Disimpan ke {sys.argv[1]}")
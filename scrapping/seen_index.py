@@ -0,0 +1,88 @@
+import sqlite3
+import time
+
+# --- SEEN-URL INDEX ---
+# Index persisten semua link lowongan yang pernah terlihat di halaman listing.
+# Dipakai run_scraper(incremental=True) agar hanya lowongan baru / basi (stale)
+# yang diambil detailnya, dan harvesting berhenti begitu satu halaman penuh
+# berisi lowongan yang sudah dikenal.
+
+SEEN_INDEX_PATH = "./data/seen_index.sqlite"
+STALE_AFTER_HOURS = 24 * 7   # Detail dianggap basi setelah seminggu
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS seen_jobs (
+    link          TEXT PRIMARY KEY,
+    first_seen    REAL,
+    last_seen     REAL,
+    last_fetched  REAL,
+    etag          TEXT,
+    content_hash  TEXT
+)
+"""
+
+
+class SeenIndex:
+    """Index link lowongan berbasis SQLite (tulis dari satu thread saja)."""
+
+    def __init__(self, path=SEEN_INDEX_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(_SCHEMA)
+        self.conn.commit()
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM seen_jobs").fetchone()[0]
+
+    def fresh_links(self, stale_after_hours=STALE_AFTER_HOURS):
+        """Set link yang detailnya sudah diambil dan belum basi."""
+        cutoff = time.time() - stale_after_hours * 3600
+        rows = self.conn.execute("SELECT link FROM seen_jobs WHERE last_fetched >= ?", (cutoff,))
+        return {row[0] for row in rows}
+
+    def get(self, link):
+        row = self.conn.execute(
+            "SELECT link, first_seen, last_seen, last_fetched, etag, content_hash FROM seen_jobs WHERE link = ?",
+            (link,),
+        ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(["link", "first_seen", "last_seen", "last_fetched", "etag", "content_hash"], row))
+
+    def mark_seen(self, links, now=None):
+        """Catat bahwa link-link ini muncul di listing (insert baru / update last_seen)."""
+        now = now or time.time()
+        self.conn.executemany(
+            """
+            INSERT INTO seen_jobs (link, first_seen, last_seen) VALUES (?, ?, ?)
+            ON CONFLICT(link) DO UPDATE SET last_seen = excluded.last_seen
+            """,
+            [(link, now, now) for link in links],
+        )
+        self.conn.commit()
+
+    def mark_fetched(self, raws, now=None):
+        """Catat hasil fetch detail yang sukses (dict dari fetch_raw_document)."""
+        now = now or time.time()
+        self.conn.executemany(
+            """
+            INSERT INTO seen_jobs (link, first_seen, last_seen, last_fetched, etag, content_hash)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(link) DO UPDATE SET
+                last_seen = excluded.last_seen,
+                last_fetched = excluded.last_fetched,
+                etag = excluded.etag,
+                content_hash = excluded.content_hash
+            """,
+            [(raw["link"], now, now, now, raw.get("etag"), raw.get("content_hash")) for raw in raws],
+        )
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,240 @@
+import re
+import time
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
+
+# --- SKILL MATCHER (SINGLE-PASS) ---
+# Versi lama menjalankan satu re.search per skill (~300x per deskripsi).
+# Di sini semua skill digabung menjadi satu regex berbentuk trie, lalu teks
+# cukup di-scan SEKALI. Hasilnya identik dengan loop lama (lihat benchmark()).
+
+
+def _trie_pattern(words):
+    """
+    Menyusun alternation regex berbentuk trie dari daftar kata.
+    Cabang yang lebih panjang selalu dicoba lebih dulu (greedy), sehingga
+    pada satu posisi regex mengembalikan skill terpanjang yang cocok.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def build(node):
+        ends_here = "" in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if ends_here:
+            return "(?:" + body + ")?"
+        return body
+
+    return build(trie)
+
+
+class SkillMatcher:
+    """
+    Mencari semua skill dari kamus dalam satu kali scan teks.
+
+    Aturan sama persis dengan extract_skills versi lama:
+    - skill biasa (panjang > 2 dan bukan special) dicari dengan \\bskill\\b
+    - SPECIAL_SKILLS memakai pola regex masing-masing (c, go, c++, c#, .net)
+    - teks di-lowercase, pola TIDAK (jadi entri huruf besar tidak pernah cocok)
+    """
+
+    def __init__(self, skills, special_skills):
+        self.skills = sorted(s for s in skills if len(s) > 2 and s not in special_skills)
+        self.special_skills = dict(special_skills)
+
+        main_pattern = r"\b(?P<main>" + _trie_pattern(self.skills) + r")\b"
+        special_pattern = "|".join(f"(?:{p})" for p in self.special_skills.values())
+        self._scanner = re.compile(f"(?=(?:{main_pattern}|(?P<special>{special_pattern})))")
+        self._special_res = {skill: re.compile(p) for skill, p in self.special_skills.items()}
+
+        # Skill lebih pendek yang mulai di posisi yang sama dengan skill lain
+        # (misal "react" di dalam "react native") tidak ikut terlapor oleh scan,
+        # jadi dihitung sekali di sini.
+        self._implied = {}
+        for skill in self.skills:
+            self._implied[skill] = [
+                other for other in self.skills
+                if other != skill and len(other) < len(skill)
+                and re.match(r"\b" + re.escape(other) + r"\b", skill)
+            ]
+
+    def find_lower(self, text_lower):
+        """Cari skill pada teks yang SUDAH di-lowercase. Mengembalikan set."""
+        found = set()
+        for m in self._scanner.finditer(text_lower):
+            main = m.group("main")
+            if main is not None:
+                found.add(main)
+                found.update(self._implied[main])
+            # Special skill bisa tumpang tindih di posisi yang sama (c / c++ / c#),
+            # jadi semua pola special dicek ulang di posisi hit.
+            pos = m.start()
+            for skill, pattern in self._special_res.items():
+                if skill not in found and pattern.match(text_lower, pos):
+                    found.add(skill)
+        return found
+
+    def extract(self, text):
+        if text is None or (isinstance(text, float) and text != text):
+            return []
+        return sorted(self.find_lower(str(text).lower()))
+
+    @property
+    def vocabulary(self):
+        """Urutan kolom untuk skill_matrix()."""
+        return sorted(set(self.skills) | set(self.special_skills))
+
+    def extract_many(self, texts, n_jobs=1, chunksize=500):
+        """
+        Versi batch dari extract(): menerima pandas Series atau iterable deskripsi,
+        mengembalikan list of list skill (urutan sama dengan input).
+        n_jobs > 1 membagi pekerjaan ke ProcessPoolExecutor per chunk.
+        """
+        texts_lower = _lower_texts(texts)
+        if n_jobs is None or n_jobs <= 1:
+            return [sorted(self.find_lower(t)) if t is not None else [] for t in texts_lower]
+
+        results = []
+        with ProcessPoolExecutor(
+            max_workers=n_jobs,
+            initializer=_init_worker,
+            initargs=(self.skills, self.special_skills),
+        ) as executor:
+            for chunk_result in executor.map(_extract_chunk, _chunks(texts_lower, chunksize)):
+                results.extend(chunk_result)
+        return results
+
+    def skill_matrix(self, texts, n_jobs=1, chunksize=500):
+        """
+        Matriks sparse boolean (baris = deskripsi, kolom = self.vocabulary).
+        Mengembalikan tuple (scipy.sparse.csr_matrix, vocabulary).
+        """
+        import numpy as np
+        from scipy import sparse
+
+        vocab = self.vocabulary
+        col_of = {skill: i for i, skill in enumerate(vocab)}
+        indptr, indices = [0], []
+        for skills in self.extract_many(texts, n_jobs=n_jobs, chunksize=chunksize):
+            indices.extend(col_of[s] for s in skills)
+            indptr.append(len(indices))
+        matrix = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=bool), np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int64)),
+            shape=(len(indptr) - 1, len(vocab)),
+        )
+        return matrix, vocab
+
+
+# --- HELPER BATCH ---
+def _lower_texts(texts):
+    """Lowercase sekali untuk seluruh input. NaN/None menjadi None."""
+    try:
+        import pandas as pd
+    except ImportError:
+        pd = None
+    if pd is not None and isinstance(texts, pd.Series):
+        lowered = texts.astype("string").str.lower()
+        return [None if pd.isna(t) else t for t in lowered]
+    return (
+        None if t is None or (isinstance(t, float) and t != t) else str(t).lower()
+        for t in texts
+    )
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+_WORKER_MATCHER = None
+
+def _init_worker(skills, special_skills):
+    global _WORKER_MATCHER
+    _WORKER_MATCHER = SkillMatcher(skills, special_skills)
+
+
+def _extract_chunk(chunk):
+    return [sorted(_WORKER_MATCHER.find_lower(t)) if t is not None else [] for t in chunk]
+
+
+def extract_skills_naive(text, skills, special_skills):
+    """Implementasi lama (satu regex per skill). Dipakai sebagai acuan benchmark."""
+    if text is None or (isinstance(text, float) and text != text):
+        return []
+    text_lower = str(text).lower()
+    found_skills = set()
+    for skill in skills:
+        if len(skill) > 2 and skill not in special_skills:
+            if re.search(r"\b" + re.escape(skill) + r"\b", text_lower):
+                found_skills.add(skill)
+    for skill, pattern in special_skills.items():
+        if re.search(pattern, text_lower):
+            found_skills.add(skill)
+    return sorted(list(found_skills))
+
+
+# --- BENCHMARK ---
+def _sample_texts(csv_path, repeat):
+    import ast
+    import pandas as pd
+
+    df = pd.read_csv(csv_path)
+    texts = []
+    for _, row in df.iterrows():
+        try:
+            skills = ast.literal_eval(row["list_skill"])
+        except (ValueError, SyntaxError):
+            skills = []
+        texts.append(
+            f"Kami mencari {row['Posisi']} di {row['Perusahaan']} ({row['kota']}). "
+            f"Kualifikasi: menguasai {', '.join(skills)}; pengalaman C/C++, C#, .NET atau Go "
+            "adalah nilai tambah. Mampu bekerja dalam tim agile. " * 3
+        )
+    return texts * repeat
+
+
+def benchmark(csv_path="./data/data_loker_clean.csv", repeat=1):
+    """
+    Membandingkan loop lama vs SkillMatcher pada deskripsi sintetis dari CSV.
+    Juga memastikan hasil keduanya identik.
+    """
+    from scrapping.kalibrr_script import IT_SKILLS_DATABASE, SPECIAL_SKILLS
+
+    texts = _sample_texts(csv_path, repeat)
+    matcher = SkillMatcher(IT_SKILLS_DATABASE, SPECIAL_SKILLS)
+
+    t0 = time.perf_counter()
+    naive = [extract_skills_naive(t, IT_SKILLS_DATABASE, SPECIAL_SKILLS) for t in texts]
+    t_naive = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    fast = [matcher.extract(t) for t in texts]
+    t_fast = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    batch = matcher.extract_many(texts)
+    t_batch = time.perf_counter() - t0
+
+    mismatch = sum(1 for a, b, c in zip(naive, fast, batch) if not (a == b == c))
+    print(f"📊 {len(texts)} deskripsi")
+    print(f"   Loop per skill : {t_naive:.3f} s")
+    print(f"   SkillMatcher   : {t_fast:.3f} s  ({t_naive / max(t_fast, 1e-9):.1f}x)")
+    print(f"   extract_many   : {t_batch:.3f} s  ({t_naive / max(t_batch, 1e-9):.1f}x)")
+    print(f"   Hasil berbeda  : {mismatch}")
+    return {"n": len(texts), "naive_s": t_naive, "matcher_s": t_fast, "batch_s": t_batch, "mismatch": mismatch}
+
+
+if __name__ == "__main__":
+    # Jalankan dari root project: python -m scrapping.skill_matcher
+    benchmark()
@@ -0,0 +1,38 @@
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+
+from dashboard.preprocess import prepare_rows
+
+APP = "../app.py"  # relatif terhadap file test ini
+
+SCRAPED = pd.DataFrame([{
+    "Perusahaan": "PT Sesi A", "Posisi": "Data Scientist", "kategori_posisi": "Data / AI",
+    "kota": "Kota Sesi A", "gaji_angka": "9000000", "list_skill": "['python', 'sql']",
+    "pendidikan": None, "jenis": "Full Time", "provinsi": "Provinsi Sesi A",
+    "link": "https://www.kalibrr.id/jobs/sesi-a",
+}] * 3)
+
+
+def _total(at):
+    return next(m.value for m in at.metric if m.label == "Total Lowongan")
+
+
+def test_scraped_data_is_not_shared_between_sessions():
+    # Dua sesi dengan nomor versi scrape yang sama tidak boleh berbagi data scrape
+    # (cache_resource / cache_data dipakai bersama dalam satu proses)
+    session_a = AppTest.from_file(APP, default_timeout=60)
+    session_a.run()
+    base_total = _total(session_a)
+    session_a.session_state["scraped_data"] = prepare_rows(SCRAPED)
+    session_a.session_state["scraped_version"] = 1
+    session_a.run()
+    assert not session_a.exception
+    assert "Provinsi Sesi A" in session_a.multiselect[1].options
+
+    session_b = AppTest.from_file(APP, default_timeout=60)
+    session_b.run()
+    session_b.session_state["scraped_version"] = 1
+    session_b.run()
+    assert not session_b.exception
+    assert "Provinsi Sesi A" not in session_b.multiselect[1].options
+    assert _total(session_b) == base_total
@@ -0,0 +1,49 @@
+import pytest
+
+import scrapping.batch_scraper as batch_scraper
+
+
+class FakePool:
+    def __init__(self):
+        self.closed = 0
+
+    def close_all(self):
+        self.closed += 1
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    fake = FakePool()
+    monkeypatch.setattr(batch_scraper, "get_driver_pool", lambda *args, **kwargs: fake)
+    return fake
+
+
+def test_worker_shard_closes_browsers(monkeypatch, pool):
+    monkeypatch.setattr(batch_scraper, "harvest_data", lambda target, query, listing_mode: [{"link": "x"}])
+    query, items, _ = batch_scraper._harvest_shard("python", 5, "auto", close_browsers=True)
+    assert (query, len(items), pool.closed) == ("python", 1, 1)
+
+
+def test_worker_shard_closes_browsers_on_error(monkeypatch, pool):
+    def broken(target, query, listing_mode):
+        raise RuntimeError("chrome crash")
+
+    monkeypatch.setattr(batch_scraper, "harvest_data", broken)
+    with pytest.raises(RuntimeError):
+        batch_scraper._harvest_shard("java", 5, "auto", close_browsers=True)
+    assert pool.closed == 1
+
+
+def test_in_process_harvest_keeps_shared_pool(monkeypatch, pool):
+    monkeypatch.setattr(batch_scraper, "harvest_data", lambda target, query, listing_mode: [])
+    batch_scraper.harvest_queries([("python", 5)], max_processes=1)
+    assert pool.closed == 0
+
+
+def test_merge_harvests_dedups_links_with_provenance():
+    items, provenance = batch_scraper.merge_harvests({
+        "python": [{"link": "https://www.kalibrr.id/jobs/1?src=a"}, {"link": "https://www.kalibrr.id/jobs/2"}],
+        "java": [{"link": "https://www.kalibrr.id/jobs/1/"}],
+    })
+    assert [item["link"] for item in items] == ["https://www.kalibrr.id/jobs/1", "https://www.kalibrr.id/jobs/2"]
+    assert sorted(provenance[provenance["link"].str.endswith("/1")]["query"]) == ["java", "python"]
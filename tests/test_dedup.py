@@ -0,0 +1,36 @@
+import pandas as pd
+
+from dashboard.dedup import FingerprintSet, dedup_new_rows, key_fingerprints
+
+
+def _rows(rows):
+    return pd.DataFrame(rows, columns=["Perusahaan", "Posisi", "kota", "link"])
+
+
+BASE = _rows([
+    ("PT Maju Jaya", "Data Engineer", "Jakarta Selatan", None),
+    ("PT Sinar", "Backend Developer", "Bandung", None),
+])
+
+
+def test_linked_scraped_row_matches_unlinked_base_row():
+    known = FingerprintSet(key_fingerprints(BASE))
+    scraped = _rows([
+        ("PT  Maju Jaya", "data engineer", "Jakarta Selatan", "https://www.kalibrr.id/jobs/1"),
+        ("PT Baru", "QA Engineer", "Surabaya", "https://www.kalibrr.id/jobs/2"),
+    ])
+    clean, dup_internal, dup_base = dedup_new_rows(scraped, known)
+    assert list(clean["Perusahaan"]) == ["PT Baru"]
+    assert (dup_internal, dup_base) == (0, 1)
+
+
+def test_internal_duplicate_by_link_or_composite():
+    new = _rows([
+        ("PT A", "Data Analyst", "Bogor", "https://www.kalibrr.id/jobs/10"),
+        ("PT A (repost)", "Data Analyst", "Bogor", "https://www.kalibrr.id/jobs/10"),
+        ("PT A", "Data Analyst", "Bogor", None),
+        ("PT B", "DevOps", "Depok", None),
+    ])
+    clean, dup_internal, dup_base = dedup_new_rows(new, FingerprintSet())
+    assert list(clean["Perusahaan"]) == ["PT A", "PT B"]
+    assert (dup_internal, dup_base) == (2, 0)
@@ -0,0 +1,44 @@
+import pytest
+
+from scrapping.detail_parser import _with_json_description, parse_detail_html, parse_detail_html_soup
+from scrapping.listing_json import canonical_education
+
+FIXTURE = "./scrapping/fixtures/job_detail.html"
+
+
+@pytest.fixture
+def detail_html():
+    with open(FIXTURE, encoding="utf-8") as f:
+        return f.read()
+
+
+def test_json_and_dom_paths_give_same_pendidikan(detail_html):
+    dom = parse_detail_html(detail_html)                          # deskripsi dari <div itemprop>
+    json_path = parse_detail_html(_with_json_description(detail_html))  # deskripsi dari __NEXT_DATA__
+    assert dom["pendidikan"] == json_path["pendidikan"] == "S1"
+
+
+def test_json_path_without_education_code_reads_dd(detail_html):
+    parsed = parse_detail_html(_with_json_description(detail_html, education_level=False))
+    assert parsed["pendidikan"] == "S1"
+
+
+@pytest.mark.parametrize("education_level", [True, False])
+def test_lean_parser_matches_soup_on_every_field(detail_html, education_level):
+    # Pembanding = jalur lama (html.parser, teks <dd> mentah); pendidikan kini dikanonikkan
+    for html in (detail_html, _with_json_description(detail_html, education_level=education_level)):
+        old, new = parse_detail_html_soup(html), parse_detail_html(html)
+        assert new["deskripsi"] == old["deskripsi"]
+        assert new["gaji_angka"] == old["gaji_angka"]
+        assert old["pendidikan"] == "Sarjana / S1"
+        assert new["pendidikan"] == canonical_education(old["pendidikan"]) == "S1"
+
+
+@pytest.mark.parametrize("value, label", [
+    ("Sarjana / S1", "S1"), (400, "S1"), ("400", "S1"),
+    ("Diploma / D3", "Diploma"), (300, "Diploma"),
+    ("Magister / S2", "S2"), ("SMA / SMK / STM", "SMA/SMK"),
+    (None, None), (999, None),
+])
+def test_canonical_education(value, label):
+    assert canonical_education(value) == label
@@ -0,0 +1,48 @@
+import threading
+import time
+
+from scrapping.driver_pool import DriverPool
+
+
+class FakeDriver:
+    def __init__(self, hang=None):
+        self.hang = hang          # threading.Event: execute_script menunggu sampai di-set
+        self.quit_called = False
+
+    def execute_script(self, script):
+        if self.hang is not None:
+            self.hang.wait(5)
+            raise RuntimeError("chrome hang")
+        return 1
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_hung_health_check_does_not_block_other_callers():
+    hang = threading.Event()
+    hung, healthy = FakeDriver(hang=hang), FakeDriver()
+    pool = DriverPool(max_size=2, factory=FakeDriver)
+    pool._idle = [(healthy, 0), (hung, 0)]
+    pool._alive = 2
+
+    # Thread A mengambil driver yang hang dan tertahan di health check
+    result = {}
+    thread_a = threading.Thread(target=lambda: result.setdefault("a", pool.acquire(timeout=5)))
+    thread_a.start()
+    deadline = time.monotonic() + 2
+    while pool.stats()["idle"] != 1:
+        assert time.monotonic() < deadline, "acquire thread A tidak jalan"
+
+    # Sementara itu acquire / release / stats lain tetap jalan
+    driver = pool.acquire(timeout=1)
+    assert driver is healthy
+    pool.release(driver)
+    assert pool.stats() == {"alive": 2, "idle": 1, "in_use": 0}
+
+    # Driver hang dibuang, thread A mendapat driver sehat yang tersisa
+    hang.set()
+    thread_a.join(5)
+    assert hung.quit_called
+    assert result["a"] is healthy
+    assert pool.stats() == {"alive": 1, "idle": 0, "in_use": 1}
@@ -0,0 +1,66 @@
+import sqlite3
+
+from scrapping.http_cache import HttpCache
+
+URL = "https://www.kalibrr.id/c/x/jobs/1"
+
+
+class Response:
+    def __init__(self, status_code=200, text="<p>halaman</p>", headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+
+class Server:
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, url, headers=None):
+        self.requests.append(headers or {})
+        if headers and headers.get("If-None-Match") == '"v1"':
+            return Response(304, "", {"ETag": '"v1"'})
+        return Response(headers={"ETag": '"v1"'})
+
+
+def parse_v1(html):
+    return {"deskripsi": "lama"}
+
+
+def parse_v2(html):
+    return {"deskripsi": f"baru {len(html)}"}
+
+
+def test_fresh_hit_reparses_when_parser_version_changes(tmp_path):
+    server = Server()
+    with HttpCache(str(tmp_path / "cache.sqlite")) as cache:
+        assert cache.fetch(URL, parse_v1, server, parser_version="1")[1] == {"deskripsi": "lama"}
+        assert cache.fetch(URL, parse_v1, server, parser_version="1")[1] == {"deskripsi": "lama"}
+        assert cache.fetch(URL, parse_v2, server, parser_version="2")[1] == {"deskripsi": "baru 14"}
+        assert cache.get(URL).parser_version == "2"
+        assert len(server.requests) == 1
+        assert cache.stats()["reparsed"] == 1
+
+
+def test_304_reparses_stored_body(tmp_path):
+    server = Server()
+    with HttpCache(str(tmp_path / "cache.sqlite"), ttl_hours=0) as cache:
+        cache.fetch(URL, parse_v1, server, parser_version="1")
+        status, parsed, _ = cache.fetch(URL, parse_v2, server, parser_version="2")
+        assert (status, parsed) == (200, {"deskripsi": "baru 14"})
+        assert server.requests[-1] == {"If-None-Match": '"v1"'}
+        assert cache.stats()["revalidated"] == 1
+
+
+def test_legacy_cache_without_version_column_is_reparsed(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    conn = sqlite3.connect(path)
+    conn.execute("""CREATE TABLE http_cache (url TEXT PRIMARY KEY, status_code INTEGER, etag TEXT,
+                    last_modified TEXT, body BLOB, parsed TEXT, size INTEGER, stored_at REAL, last_access REAL)""")
+    conn.commit()
+    conn.close()
+    server = Server()
+    with HttpCache(path) as cache:
+        cache.fetch(URL, parse_v1, server, parser_version="1")
+        cache.conn.execute("UPDATE http_cache SET parser_version = NULL")
+        assert cache.fetch(URL, parse_v2, server, parser_version="2")[1] == {"deskripsi": "baru 14"}
@@ -0,0 +1,76 @@
+import pytest
+
+import scrapping.kalibrr_script as kalibrr_script
+from scrapping.listing_json import (
+    LISTING_EXHAUSTED, LISTING_HTTP_ERROR, LISTING_KNOWN, LISTING_NO_DATA, LISTING_TARGET,
+    harvest_listing_json, parse_listing_page,
+)
+
+FIXTURE = "./scrapping/fixtures/job_listing.html"
+EMPTY_PAGE = '<script id="__NEXT_DATA__" type="application/json">{"props": {"pageProps": {"jobs": []}}}</script>'
+
+
+class Response:
+    def __init__(self, status_code=200, text=""):
+        self.status_code = status_code
+        self.text = text
+
+
+@pytest.fixture
+def listing_html():
+    with open(FIXTURE, encoding="utf-8") as f:
+        return f.read()
+
+
+def pages_fetcher(pages):
+    """fetch palsu: halaman ke-n = pages[n-1], setelahnya 404."""
+    def fetch(url):
+        page = int(url.rsplit("/", 1)[1])
+        return pages[page - 1] if page <= len(pages) else Response(404)
+    return fetch
+
+
+def url_for_page(search_query, page):
+    return f"https://listing/{page}"
+
+
+def harvest(pages, target=10, known=frozenset()):
+    return harvest_listing_json(target, known_links=known, fetch=pages_fetcher(pages), url_for_page=url_for_page)
+
+
+def test_outcomes(listing_html):
+    links = {item["link"] for item in parse_listing_page(listing_html)}
+    assert harvest([Response(text=listing_html)], target=3)[2] == LISTING_TARGET
+    assert harvest([Response(text=listing_html), Response(text=EMPTY_PAGE)])[2] == LISTING_EXHAUSTED
+    assert harvest([Response(text=listing_html)])[2] == LISTING_EXHAUSTED
+    assert harvest([Response(text=listing_html)], known=links)[2] == LISTING_KNOWN
+    assert harvest([Response(text="<html>tanpa json</html>")])[2] == LISTING_NO_DATA
+    assert harvest([Response(503)])[2] == LISTING_HTTP_ERROR
+
+
+@pytest.fixture
+def no_browser(monkeypatch):
+    started = []
+
+    def get_driver_pool():
+        started.append(True)
+        raise AssertionError("Selenium tidak boleh dipakai")
+
+    monkeypatch.setattr(kalibrr_script, "get_driver_pool", get_driver_pool)
+    return started
+
+
+@pytest.mark.parametrize("outcome", [LISTING_KNOWN, LISTING_EXHAUSTED])
+def test_auto_mode_skips_selenium_when_listing_stops_on_purpose(monkeypatch, no_browser, outcome):
+    monkeypatch.setattr(kalibrr_script, "harvest_listing_json",
+                        lambda *args, **kwargs: ([{"link": "a"}], {"a"}, outcome))
+    items = kalibrr_script.harvest_data(10, listing_mode="auto")
+    assert len(items) == 1 and not no_browser
+
+
+@pytest.mark.parametrize("outcome", [LISTING_NO_DATA, LISTING_HTTP_ERROR])
+def test_auto_mode_falls_back_when_json_unavailable(monkeypatch, no_browser, outcome):
+    monkeypatch.setattr(kalibrr_script, "harvest_listing_json", lambda *args, **kwargs: ([], set(), outcome))
+    with pytest.raises(AssertionError):
+        kalibrr_script.harvest_data(10, listing_mode="auto")
+    assert no_browser
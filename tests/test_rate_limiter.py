@@ -0,0 +1,21 @@
+import time
+
+from scrapping.rate_limiter import RateLimiter, TokenBucket
+
+
+def test_set_rate_refills_with_old_rate_first():
+    bucket = TokenBucket(rate=10, burst=100)
+    bucket._tokens, bucket._last = 0.0, time.monotonic() - 1.0
+    bucket.set_rate(1)
+    # Detik yang sudah lewat dihitung dengan rate lama (10 token), bukan rate baru (1 token)
+    assert bucket._tokens >= 9.5
+    assert bucket.rate == 1.0
+
+
+def test_error_halves_rate_and_success_recovers():
+    limiter = RateLimiter(rate=2.0, burst=4, min_rate=0.2, base_backoff=0.0)
+    limiter.on_error("kalibrr.id", attempt=0)
+    assert limiter.current_rate("kalibrr.id") == 1.0
+    for _ in range(20):
+        limiter.on_success("kalibrr.id")
+    assert limiter.current_rate("kalibrr.id") == 2.0